@@ -0,0 +1,8 @@
+from fastapi import Request
+
+from app.core.client_pool import ClientPool
+
+
+def get_client_pool(request: Request) -> ClientPool:
+    """main.py lifespan 에서 만든 공용 ClientPool 주입"""
+    return request.app.state.client_pool
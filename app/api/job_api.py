@@ -0,0 +1,78 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+
+from app.api.deps import get_client_pool
+from app.api.order_api import STATUSES, BaeminOrderRequest, _crawl_orders
+from app.api.responses import json_response
+from app.core import config
+from app.core.client_pool import ClientPool
+from app.scheduler.jobs import JOB_DONE, CrawlJob, JobQueueFull, job_manager
+
+router = APIRouter(prefix="/jobs")
+
+
+def _get_job(job_id: str) -> CrawlJob:
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="job not found")
+    return job
+
+
+@router.post("")
+async def submit_job(body: BaeminOrderRequest, session: ClientPool = Depends(get_client_pool)):
+    """
+    /baemin/orders 와 같은 조회를 백그라운드 작업으로 등록하고 job_id 를 바로 돌려줌
+    진행률은 GET /jobs/{job_id}, 결과는 GET /jobs/{job_id}/result 로 나눠 받음
+    """
+
+    async def run(progress):
+        return await _crawl_orders(body, session, progress=progress)
+
+    try:
+        job = job_manager.submit(
+            body.id, {"start": body.start, "end": body.end, "statuses": STATUSES}, run
+        )
+    except JobQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+    return {"code": 200, "job_id": job.id, "state": job.state}
+
+
+@router.get("/{job_id}")
+async def job_status(job_id: str):
+    return {"code": 200, **_get_job(job_id).status()}
+
+
+@router.get("/{job_id}/result")
+async def job_result(
+    job_id: str,
+    request: Request,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(1000, ge=1),
+):
+    """
+    끝난 작업의 결과를 offset / limit 으로 나눠 받음
+    next_offset 이 null 이면 마지막 조각
+    """
+    job = _get_job(job_id)
+    if job.state != JOB_DONE:
+        raise HTTPException(status_code=409, detail=f"job is {job.state}")
+
+    limit = min(limit, config.JOBS_RESULT_CHUNK_MAX)
+    chunk = job.result[offset:offset + limit]
+    end = offset + len(chunk)
+
+    return await json_response(request, {
+        "code": 200,
+        "job_id": job.id,
+        "total": len(job.result),
+        "offset": offset,
+        "next_offset": end if end < len(job.result) else None,
+        "data": chunk,
+    })
+
+
+@router.delete("/{job_id}")
+async def cancel_job(job_id: str):
+    _get_job(job_id)
+    job = job_manager.cancel(job_id)
+    return {"code": 200, "job_id": job.id, "state": job.state}
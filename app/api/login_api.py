@@ -1,5 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel
+from app.api.deps import get_client_pool
+from app.core.client_pool import ClientPool
 from app.crawler.login import login
 
 router = APIRouter()
@@ -9,8 +11,8 @@ class LoginRequest(BaseModel):
     pw: str
 
 @router.post("/login")
-async def login_api(body: LoginRequest):
-    cookies = await login(body.id, body.pw)
+async def login_api(body: LoginRequest, pool: ClientPool = Depends(get_client_pool)):
+    cookies = await login(body.id, body.pw, session=pool)
     return {
         "code": 200,
         "message": "login success",
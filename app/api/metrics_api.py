@@ -0,0 +1,55 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core import metrics
+from app.core.cookie_store import cookie_cache
+from app.core.order_day_cache import order_day_cache
+from app.core.order_snapshot import order_snapshot_store
+from app.core.page_checkpoint import page_checkpoint
+from app.core.rate import rate_controller
+from app.crawler.login import login_flight
+from app.crawler.order_info import account_meta_cache
+from app.crawler.session_refresh import session_refresher
+from app.scheduler.jobs import job_manager
+
+router = APIRouter()
+
+
+def _stats_gauge(name: str, documentation: str, stats_fn):
+    """stats() dict 를 {stat="..."} 라벨을 가진 게이지로 노출"""
+    return metrics.register(metrics.Gauge(
+        name,
+        documentation,
+        lambda: {(k,): v for k, v in stats_fn().items()},
+        ["stat"],
+    ))
+
+
+_stats_gauge("baemin_cookie_cache", "Cookie memory cache counters", cookie_cache.stats)
+_stats_gauge("baemin_login_single_flight", "Login single-flight counters", login_flight.stats)
+_stats_gauge("baemin_account_meta_cache", "Account/shop metadata cache counters", account_meta_cache.stats)
+_stats_gauge("baemin_order_day_cache", "Past-day order result cache counters", order_day_cache.stats)
+_stats_gauge("baemin_page_checkpoint", "Completed-page checkpoint counters", page_checkpoint.stats)
+_stats_gauge("baemin_jobs", "Background crawl job counters", job_manager.stats)
+_stats_gauge("baemin_session_refresher", "Session refresh / re-login counters", session_refresher.stats)
+_stats_gauge("baemin_order_snapshots", "Materialized order snapshot counters", order_snapshot_store.stats)
+
+def _rate_controller_stats() -> dict:
+    stats = {}
+    for host, snap in rate_controller.snapshot().items():
+        for stat, value in snap.items():
+            stats[(host, stat)] = value
+    return stats
+
+
+metrics.register(metrics.Gauge(
+    "baemin_rate_controller",
+    "Per-host AIMD rate controller state (rate is requests/s)",
+    _rate_controller_stats,
+    ["host", "stat"],
+))
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics_endpoint():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
@@ -1,12 +1,21 @@
-from fastapi import APIRouter
-from pydantic import BaseModel
+import asyncio
+from typing import List
 
-from app.core.session import AsyncCurlClient
-from app.core.cookie_store import load_cookie
-from app.crawler.login import login_and_get_cookie
-from app.crawler.order_info import fetch_account_number, fetch_shop_number
-from app.crawler.order_fetcher import fetch_orders
-from app.crawler.order_parser import parse_order
+from fastapi import APIRouter, Depends, Request
+from pydantic import BaseModel, Field
+
+from app.api.deps import get_client_pool
+from app.api.responses import json_response, ndjson_line, ndjson_response
+from app.core import config
+from app.core.client_pool import ClientPool
+from app.core.concurrency import RoundRobinScheduler, bounded_gather
+from app.core.cookie_store import cookie_cache
+from app.core.logger import baemin_logger
+from app.core.tracing import span, start_trace
+from app.crawler.login import login_single_flight
+from app.crawler.order_info import account_meta_cache
+from app.crawler.order_range import fetch_parsed_orders
+from app.crawler.session_refresh import session_refresher
 
 
 class BaeminOrderRequest(BaseModel):
@@ -16,40 +25,242 @@ class BaeminOrderRequest(BaseModel):
     end: str
 
 
+class BaeminCredential(BaseModel):
+    id: str
+    pw: str
+
+
+class BaeminBatchOrderRequest(BaseModel):
+    accounts: List[BaeminCredential] = Field(min_length=1, max_length=config.ORDERS_BATCH_MAX_ACCOUNTS)
+    start: str
+    end: str
+
+
 router = APIRouter(prefix="/baemin")
 
+STATUSES = ["ACCEPTED", "CLOSED", "CANCELLED"]
+
+_STREAM_DONE = object()
 
-@router.post("/orders")
-async def get_orders(body: BaeminOrderRequest):
-    session = AsyncCurlClient()
-    await session.start()
 
-    cookies = load_cookie(body.id)
-    if cookies is None:
-        cookies = await login_and_get_cookie(body.id, body.pw, session)
+async def _prepare_crawl(body: BaeminOrderRequest, session: ClientPool):
+    """쿠키 확보 → 계정번호 → 매장 목록 → (매장 × 상태) 조합"""
+    cookies = await cookie_cache.get(body.id)
+    logged_in = cookies is None
+    if logged_in:
+        with span("login"):
+            cookies = await login_single_flight(body.id, body.pw, session)
 
-    account_no = await fetch_account_number(cookies, session)
-    shops = await fetch_shop_number(cookies, account_no, session)
+    # 만료 전 백그라운드 재로그인 / 401 재로그인 대상으로 등록
+    session_refresher.track(body.id, body.pw, cookies, verified=logged_in)
+
+    account_no, shops = await account_meta_cache.get(body.id, cookies, session)
 
     shop_nos = [s["shopNo"] for s in shops]
+    pairs = [(shop_no, st) for shop_no in shop_nos for st in STATUSES]
+
+    return cookies, account_no, pairs
+
 
-    all_orders = []
-    statuses = ["ACCEPTED", "CLOSED", "CANCELLED"]
-
-    for shop_no in shop_nos:
-        for st in statuses:
-            rows = await fetch_orders(
-                session,
-                cookies,
-                account_no,
-                shop_no,
-                body.start,
-                body.end,
-                st,
+async def _crawl_orders(body: BaeminOrderRequest, session: ClientPool, progress=None) -> list:
+    """계정의 start ~ end 주문 전체. (매장 × 상태) 조합 병렬 조회, 결과 순서는 매장/상태 순서 그대로"""
+    cookies, account_no, pairs = await _prepare_crawl(body, session)
+
+    results = await bounded_gather(
+        (
+            fetch_parsed_orders(
+                session, cookies, account_no, shop_no,
+                body.start, body.end, st, progress=progress,
             )
-            for item in rows:
-                parsed = parse_order(item["order"], pid=shop_no)
-                all_orders.append(parsed)
+            for shop_no, st in pairs
+        ),
+        config.ORDERS_FANOUT_CONCURRENCY,
+    )
+
+    orders = []
+    for parsed in results:
+        orders.extend(parsed)
+    return orders
+
+
+@router.post("/orders")
+async def get_orders(
+    body: BaeminOrderRequest,
+    request: Request,
+    debug: bool = False,
+    session: ClientPool = Depends(get_client_pool),
+):
+    """
+    debug=true 면 응답에 구간별 / 매장별 / 페이지별 소요 시간(trace)을 함께 내려줌.
+    구간 합계는 항상 Server-Timing 헤더로 내려감
+    응답은 orjson 으로 바로 직렬화하고 Accept-Encoding 에 따라 br / gzip 압축
+    """
+    trace = start_trace(detail=debug)
+
+    all_orders = await _crawl_orders(body, session)
+
+    content = {"code": 200, "data": all_orders}
+    if debug:
+        content["trace"] = trace.breakdown()
+    return await json_response(request, content, {"Server-Timing": trace.server_timing()})
+
+
+@router.post("/orders/stream")
+async def stream_orders(
+    body: BaeminOrderRequest,
+    request: Request,
+    session: ClientPool = Depends(get_client_pool),
+):
+    """
+    주문을 NDJSON(한 줄에 주문 하나)으로 페이지가 도착하는 대로 바로 흘려보냄
+
+    - 버퍼(asyncio.Queue)가 가득 차면 페이지 조회가 멈춤 → 느린 클라이언트가 백프레셔를 검
+    - 로그인/매장 조회 실패는 스트림 시작 전에 일반 에러로 응답
+    - 스트림 도중 실패하면 마지막 줄에 {"code": ..., "message": ...} 를 내보내고 종료
+    - Server-Timing 헤더에는 스트림 시작 전 구간(로그인, 계정/매장 조회)만 담김
+    - 버퍼에 쌓인 줄을 한 덩어리로 모아 내보냄 (Accept-Encoding 에 따라 덩어리마다 압축)
+    """
+    trace = start_trace()
+
+    cookies, account_no, pairs = await _prepare_crawl(body, session)
+    server_timing = trace.server_timing()
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=config.ORDERS_STREAM_BUFFER_SIZE)
+
+    async def on_rows(rows):
+        for row in rows:
+            await queue.put(row)
+
+    async def fetch_pair(shop_no, st):
+        await fetch_parsed_orders(
+            session,
+            cookies,
+            account_no,
+            shop_no,
+            body.start,
+            body.end,
+            st,
+            on_rows=on_rows,
+        )
+
+    async def produce():
+        try:
+            # 하나가 실패하면 bounded_gather 가 나머지 조회를 취소하고 끝날 때까지 기다린 뒤 던짐
+            # → 에러 줄 / _STREAM_DONE 뒤에 늦게 도착한 행이 섞이지 않음
+            await bounded_gather(
+                (fetch_pair(shop_no, st) for shop_no, st in pairs),
+                config.ORDERS_FANOUT_CONCURRENCY,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            baemin_logger.error("[ORDER STREAM ERROR] %s", e)
+            await queue.put({
+                "code": getattr(e, "code", 500),
+                "message": getattr(e, "message", str(e)),
+            })
+        await queue.put(_STREAM_DONE)
+
+    async def ndjson():
+        producer = asyncio.create_task(produce())
+        try:
+            done = False
+            while not done:
+                lines = []
+                item = await queue.get()
+                while True:
+                    if item is _STREAM_DONE:
+                        done = True
+                        break
+                    lines.append(ndjson_line(item))
+                    if queue.empty():
+                        break
+                    item = queue.get_nowait()
+                if lines:
+                    yield b"".join(lines)
+        finally:
+            # 클라이언트가 끊으면 남은 조회도 중단 (취소가 끝날 때까지 기다림)
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+    return ndjson_response(request, ndjson(), {"Server-Timing": server_timing})
+
+
+@router.post("/orders/batch")
+async def batch_orders(
+    body: BaeminBatchOrderRequest,
+    request: Request,
+    session: ClientPool = Depends(get_client_pool),
+):
+    """
+    여러 계정의 주문을 한 번에 조회해 NDJSON(한 줄에 계정 하나)으로 끝나는 순서대로 흘려보냄
+
+    - 각 계정의 작업(로그인/매장 조회, (매장 × 상태) 조회)은 계정 단위 라운드로빈으로 실행
+      → 매장이 많은 계정이 동시 작업 슬롯을 독차지하지 못함
+    - 계정별 성공 줄: {"id", "code": 200, "status": "OK", "count", "data"}
+    - 계정별 실패 줄: {"id", "code", "status", "message"} (다른 계정 조회는 계속 진행)
+    """
+    async def crawl_account(scheduler: RoundRobinScheduler, index: int, cred: BaeminCredential):
+        key = (index, cred.id)  # 같은 계정이 두 번 들어와도 따로 줄 세움
+        account_body = BaeminOrderRequest(id=cred.id, pw=cred.pw, start=body.start, end=body.end)
+
+        cookies, account_no, pairs = await scheduler.submit(
+            key, lambda: _prepare_crawl(account_body, session)
+        )
+
+        futures = [
+            scheduler.submit(
+                key,
+                lambda shop_no=shop_no, st=st: fetch_parsed_orders(
+                    session, cookies, account_no, shop_no, body.start, body.end, st
+                ),
+            )
+            for shop_no, st in pairs
+        ]
+        try:
+            results = await asyncio.gather(*futures)
+        except BaseException:
+            # 한 조합이라도 실패하면 이 계정의 남은 작업은 실행하지 않음
+            for fut in futures:
+                fut.cancel()
+            raise
+
+        orders = []
+        for parsed in results:
+            orders.extend(parsed)
+        return orders
+
+    async def run_account(scheduler, index, cred):
+        try:
+            orders = await crawl_account(scheduler, index, cred)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            baemin_logger.error("[ORDER BATCH ERROR] account_id=%s %s", cred.id, e)
+            return {
+                "id": cred.id,
+                "code": getattr(e, "code", 500),
+                "status": getattr(e, "status", "ERROR"),
+                "message": getattr(e, "message", str(e)),
+            }
+        return {"id": cred.id, "code": 200, "status": "OK", "count": len(orders), "data": orders}
+
+    async def ndjson():
+        async with RoundRobinScheduler(
+            config.ORDERS_BATCH_CONCURRENCY,
+            per_key_limit=config.ORDERS_FANOUT_CONCURRENCY,
+        ) as scheduler:
+            tasks = [
+                asyncio.create_task(run_account(scheduler, i, cred))
+                for i, cred in enumerate(body.accounts)
+            ]
+            try:
+                for done in asyncio.as_completed(tasks):
+                    yield ndjson_line(await done)
+            finally:
+                # 클라이언트가 끊으면 남은 계정 조회도 중단
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
 
-    await session.close()
-    return {"code": 200, "data": all_orders}
+    return ndjson_response(request, ndjson())
@@ -0,0 +1,169 @@
+import asyncio
+import json
+import zlib
+from typing import AsyncIterator, Dict, Optional
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+
+from app.core import config
+
+try:
+    import orjson
+
+    def json_bytes(obj) -> bytes:
+        return orjson.dumps(obj, default=str)
+
+except ImportError:  # orjson 이 없으면 표준 json 으로
+    def json_bytes(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+try:
+    import brotli
+except ImportError:  # brotli 가 없으면 gzip 만 제공
+    brotli = None
+
+
+ENCODING_GZIP = "gzip"
+ENCODING_BROTLI = "br"
+
+# 이보다 큰 덩어리는 직렬화 / 압축을 스레드에서 (이벤트 루프를 오래 막지 않게)
+_THREAD_MIN_BYTES = 256 * 1024
+
+
+def supported_encodings() -> tuple:
+    return tuple(
+        e for e in config.RESPONSE_ENCODINGS
+        if e == ENCODING_GZIP or (e == ENCODING_BROTLI and brotli is not None)
+    )
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Accept-Encoding 에서 쓸 압축 방식 선택 (없으면 None = 압축 안 함)
+    q 가 가장 높은 것, 같으면 RESPONSE_ENCODINGS 순서가 앞선 것
+    """
+    if not accept_encoding:
+        return None
+
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+
+    best, best_q = None, 0.0
+    for encoding in supported_encodings():
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == ENCODING_BROTLI:
+        return brotli.compress(data, quality=config.RESPONSE_BROTLI_QUALITY)
+    return zlib.compress(data, config.RESPONSE_GZIP_LEVEL, wbits=31)  # wbits=31 → gzip 헤더
+
+
+def _compress_body(body: bytes, encoding: Optional[str]):
+    if encoding is None or len(body) < config.RESPONSE_COMPRESS_MIN_BYTES:
+        return body, None
+    return compress(body, encoding), encoding
+
+
+def _encode(content, encoding: Optional[str]):
+    return _compress_body(json_bytes(content), encoding)
+
+
+async def json_response(request: Request, content, headers: Optional[dict] = None) -> Response:
+    """
+    content 를 jsonable_encoder 없이 바로 bytes 로 직렬화하고
+    클라이언트의 Accept-Encoding 에 맞춰 압축한 Response (직렬화 / 압축은 스레드에서)
+    """
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    body, encoding = await asyncio.to_thread(_encode, content, encoding)
+    return _response(body, encoding, headers)
+
+
+async def raw_json_response(request: Request, body: bytes, headers: Optional[dict] = None) -> Response:
+    """이미 직렬화된 JSON bytes 를 Accept-Encoding 에 맞춰 압축만 해서 내려줌"""
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    if encoding is not None and len(body) >= _THREAD_MIN_BYTES:
+        body, encoding = await asyncio.to_thread(_compress_body, body, encoding)
+    else:
+        body, encoding = _compress_body(body, encoding)
+    return _response(body, encoding, headers)
+
+
+def _response(body: bytes, encoding: Optional[str], headers: Optional[dict]) -> Response:
+    headers = dict(headers or {})
+    headers["Vary"] = "Accept-Encoding"
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(body, media_type="application/json", headers=headers)
+
+
+class StreamCompressor:
+    """스트리밍 응답용 압축기. 덩어리마다 flush 해서 받은 만큼은 바로 풀 수 있게"""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == ENCODING_BROTLI:
+            self._brotli = brotli.Compressor(quality=config.RESPONSE_BROTLI_QUALITY)
+        else:
+            self._zlib = zlib.compressobj(config.RESPONSE_GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def chunk(self, data: bytes) -> bytes:
+        if self.encoding == ENCODING_BROTLI:
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == ENCODING_BROTLI:
+            return self._brotli.finish()
+        return self._zlib.flush()
+
+
+def ndjson_response(
+    request: Request, chunks: AsyncIterator[bytes], headers: Optional[dict] = None
+) -> StreamingResponse:
+    """
+    NDJSON 덩어리(bytes, 줄 여러 개) 스트림을 Accept-Encoding 에 맞춰 압축해서 흘려보냄
+    덩어리가 작을수록 압축률은 떨어지므로 호출하는 쪽에서 준비된 줄을 모아 넘김
+    """
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+
+    headers = dict(headers or {})
+    headers["Vary"] = "Accept-Encoding"
+    if encoding is None:
+        return StreamingResponse(chunks, media_type="application/x-ndjson", headers=headers)
+
+    headers["Content-Encoding"] = encoding
+
+    async def compressed():
+        compressor = StreamCompressor(encoding)
+        try:
+            async for data in chunks:
+                if len(data) >= _THREAD_MIN_BYTES:
+                    out = await asyncio.to_thread(compressor.chunk, data)
+                else:
+                    out = compressor.chunk(data)
+                if out:
+                    yield out
+            yield compressor.finish()
+        finally:
+            # 클라이언트가 끊으면 안쪽 생성기도 바로 닫아서 남은 조회 중단
+            await chunks.aclose()
+
+    return StreamingResponse(compressed(), media_type="application/x-ndjson", headers=headers)
+
+
+def ndjson_line(obj) -> bytes:
+    return json_bytes(obj) + b"\n"
@@ -0,0 +1,78 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+
+from app.api.deps import get_client_pool
+from app.api.order_api import STATUSES, BaeminOrderRequest, _crawl_orders
+from app.api.responses import json_bytes, raw_json_response
+from app.core import config
+from app.core.client_pool import ClientPool
+from app.core.order_snapshot import OrderSnapshot, order_snapshot_store
+
+router = APIRouter(prefix="/orders/snapshots")
+
+
+def _get_snapshot(snapshot_id: str) -> OrderSnapshot:
+    snapshot = order_snapshot_store.get(snapshot_id)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="snapshot not found or expired")
+    return snapshot
+
+
+async def _page_response(request: Request, snapshot: OrderSnapshot, cursor: Optional[str], limit: int):
+    try:
+        position = snapshot.position_of(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    limit = min(limit, config.ORDER_SNAPSHOT_PAGE_MAX)
+    try:
+        data, end = await order_snapshot_store.read_page(snapshot, position, limit)
+    except FileNotFoundError:  # 읽는 사이 만료 / 삭제됨
+        raise HTTPException(status_code=404, detail="snapshot not found or expired")
+
+    head = json_bytes({
+        "code": 200,
+        "snapshot_id": snapshot.id,
+        "total": snapshot.total,
+        "expires_at": snapshot.expires_at,
+        "next_cursor": snapshot.next_cursor(end),
+    })
+    # 페이지 본문은 저장된 bytes 를 그대로 이어붙임 (주문을 다시 직렬화하지 않음)
+    return await raw_json_response(request, head[:-1] + b',"data":' + data + b"}")
+
+
+@router.post("")
+async def create_snapshot(
+    body: BaeminOrderRequest,
+    request: Request,
+    limit: int = Query(100, ge=1),
+    session: ClientPool = Depends(get_client_pool),
+):
+    """
+    start ~ end 주문을 한 번 조회해 최신순 스냅샷으로 고정하고 첫 페이지를 함께 내려줌
+    다음 페이지는 GET /snapshots/{snapshot_id}?cursor=<next_cursor> 로 (upstream 호출 없음)
+    next_cursor 가 null 이면 마지막 페이지
+    """
+    orders = await _crawl_orders(body, session)
+    snapshot = await order_snapshot_store.create(
+        body.id, {"start": body.start, "end": body.end, "statuses": STATUSES}, orders
+    )
+    return await _page_response(request, snapshot, None, limit)
+
+
+@router.get("/{snapshot_id}")
+async def snapshot_page(
+    snapshot_id: str,
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1),
+):
+    return await _page_response(request, _get_snapshot(snapshot_id), cursor, limit)
+
+
+@router.delete("/{snapshot_id}")
+async def delete_snapshot(snapshot_id: str):
+    if not order_snapshot_store.delete(snapshot_id):
+        raise HTTPException(status_code=404, detail="snapshot not found or expired")
+    return {"code": 200, "snapshot_id": snapshot_id}
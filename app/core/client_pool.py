@@ -0,0 +1,166 @@
+import asyncio
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from app.core import config
+from app.core.logger import baemin_logger
+from app.core.session import AsyncCurlClient, USER_AGENTS, http_version_for
+
+
+class ClientPool:
+    """
+    프로세스 전체가 공유하는 호스트별 AsyncCurlClient 풀
+
+    - 호스트(biz-member / self-api ...)마다 AsyncCurlClient 하나를 만들어 재사용
+      → TCP/TLS 핸드셰이크를 요청마다 반복하지 않음
+    - 호스트마다 프로토콜(v1 / v2 / auto)을 따로 지정 (BAEMIN_HTTP_VERSION_BY_HOST)
+      → 페이지 조회가 몰리는 self-api 는 HTTP/2 커넥션 몇 개로 멀티플렉싱
+    - AsyncCurlClient 와 같은 get / post / random_ua 인터페이스를 제공하므로
+      기존 crawler 함수들의 session 인자로 그대로 넘길 수 있음
+    - 일정 시간 사용되지 않은 호스트 클라이언트는 백그라운드에서 정리
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = config.HTTP_MAX_CONNECTIONS_PER_HOST,
+        idle_timeout: int = config.HTTP_IDLE_TIMEOUT_SECONDS,
+        reap_interval: float = config.HTTP_REAP_INTERVAL_SECONDS,
+        timeout: int = config.HTTP_TIMEOUT_SECONDS,
+        impersonate: str = "chrome",
+        http_version: str | None = None,
+        proxy: str | None = config.HTTP_PROXY,
+    ):
+        self.max_connections_per_host = max_connections_per_host
+        self.idle_timeout = idle_timeout
+        self.reap_interval = reap_interval
+        self.timeout = timeout
+        self.impersonate = impersonate
+        self.http_version = http_version  # None 이면 호스트별 설정 (http_version_for)
+        self.proxy = proxy
+
+        self._clients: Dict[str, AsyncCurlClient] = {}
+        self._last_used: Dict[str, float] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._lock = asyncio.Lock()
+        self._reaper: Optional[asyncio.Task] = None
+        self._closed = False
+
+    def random_ua(self) -> str:
+        return random.choice(USER_AGENTS)
+
+    # ========================================================================
+    # LIFECYCLE
+    # ========================================================================
+    async def start(self):
+        self._closed = False
+        if self._reaper is None and self.reap_interval > 0:
+            self._reaper = asyncio.create_task(self._reap_loop())
+
+    async def close(self):
+        self._closed = True
+
+        if self._reaper is not None:
+            self._reaper.cancel()
+            try:
+                await self._reaper
+            except asyncio.CancelledError:
+                pass
+            self._reaper = None
+
+        async with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._last_used.clear()
+            self._in_flight.clear()
+
+        for client in clients:
+            await client.close()
+
+        baemin_logger.info("[CLIENT POOL] closed (%d hosts)", len(clients))
+
+    # ========================================================================
+    # CLIENT 관리
+    # ========================================================================
+    async def client_for(self, url: str) -> AsyncCurlClient:
+        """URL 의 호스트에 해당하는 공용 클라이언트 반환 (없으면 생성)"""
+        if self._closed:
+            raise RuntimeError("ClientPool is closed")
+
+        host = urlsplit(url).netloc
+        client = self._clients.get(host)
+        if client is not None:
+            return client
+
+        async with self._lock:
+            client = self._clients.get(host)
+            if client is None:
+                client = AsyncCurlClient(
+                    timeout=self.timeout,
+                    impersonate=self.impersonate,
+                    http_version=self.http_version or http_version_for(url),
+                    proxy=self.proxy,
+                    max_clients=self.max_connections_per_host,
+                    idle_timeout=self.idle_timeout,
+                    discard_cookies=True,  # 여러 계정이 공유 → 세션 쿠키 누적 금지
+                )
+                await client.start()
+                self._clients[host] = client
+                self._last_used[host] = time.monotonic()
+                baemin_logger.info(
+                    "[CLIENT POOL] new client host=%s http_version=%s", host, client.http_version
+                )
+            return client
+
+    @asynccontextmanager
+    async def _use(self, url: str):
+        client = await self.client_for(url)
+        host = urlsplit(url).netloc
+        self._in_flight[host] = self._in_flight.get(host, 0) + 1
+        try:
+            yield client
+        finally:
+            self._in_flight[host] -= 1
+            self._last_used[host] = time.monotonic()
+
+    async def get(self, url: str, **kwargs):
+        async with self._use(url) as client:
+            return await client.get(url, **kwargs)
+
+    async def post(self, url: str, **kwargs):
+        async with self._use(url) as client:
+            return await client.post(url, **kwargs)
+
+    # ========================================================================
+    # IDLE REAPING
+    # ========================================================================
+    async def reap_idle(self) -> int:
+        """idle_timeout 이상 사용되지 않은 호스트 클라이언트 정리, 정리한 개수 반환"""
+        now = time.monotonic()
+        reaped = []
+
+        async with self._lock:
+            for host, last in list(self._last_used.items()):
+                if self._in_flight.get(host, 0) > 0:
+                    continue
+                if now - last < self.idle_timeout:
+                    continue
+                reaped.append(self._clients.pop(host))
+                self._last_used.pop(host, None)
+                self._in_flight.pop(host, None)
+                baemin_logger.info("[CLIENT POOL] reaped idle client host=%s", host)
+
+        for client in reaped:
+            await client.close()
+
+        return len(reaped)
+
+    async def _reap_loop(self):
+        while True:
+            await asyncio.sleep(self.reap_interval)
+            try:
+                await self.reap_idle()
+            except Exception as e:
+                baemin_logger.error("[CLIENT POOL] reap error: %s", e)
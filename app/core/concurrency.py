@@ -0,0 +1,129 @@
+import asyncio
+from collections import OrderedDict, deque
+from typing import Awaitable, Callable, Deque, Dict, Hashable, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+
+async def bounded_gather(aws: Iterable[Awaitable[T]], limit: int) -> List[T]:
+    """
+    asyncio.gather 와 동일하게 입력 순서대로 결과를 돌려주되,
+    동시에 실행되는 코루틴 수를 limit 개로 제한
+
+    하나라도 실패하면(또는 호출한 쪽이 취소되면) 나머지를 취소하고
+    끝날 때까지 기다린 뒤 첫 예외를 그대로 다시 던짐
+    """
+    sem = asyncio.Semaphore(max(1, limit))
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with sem:
+            return await aw
+
+    tasks = [asyncio.ensure_future(run(aw)) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+class RoundRobinScheduler:
+    """
+    여러 키(계정)의 작업을 키 단위 라운드로빈으로 꺼내 전체 concurrency 개까지 동시에 실행
+
+    - 작업은 키별 FIFO 로 쌓이고, 워커는 "다음 차례 키" 의 맨 앞 작업을 가져감
+      → 매장이 30개인 계정이 작업을 잔뜩 넣어도 다른 계정이 한 칸씩 번갈아 실행됨
+    - per_key_limit 가 있으면 한 키가 동시에 쓰는 워커 수를 그만큼으로 제한
+    - submit() 은 결과 Future 를 돌려줌. 실행 전에 cancel 된 작업은 건너뜀
+
+        async with RoundRobinScheduler(8, per_key_limit=3) as scheduler:
+            fut = scheduler.submit("acc1", lambda: fetch(...))
+            result = await fut
+    """
+
+    def __init__(self, concurrency: int, per_key_limit: int | None = None):
+        self.concurrency = max(1, concurrency)
+        self.per_key_limit = per_key_limit
+        self._pending: "OrderedDict[Hashable, Deque[tuple]]" = OrderedDict()
+        self._running: Dict[Hashable, int] = {}
+        self._changed = asyncio.Event()  # 작업 추가 / 완료 시 대기 중인 워커를 깨움
+        self._workers: List[asyncio.Task] = []
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def start(self):
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    async def close(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        for queue in self._pending.values():
+            for _, fut in queue:
+                fut.cancel()
+        self._pending.clear()
+
+    def submit(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> "asyncio.Future[T]":
+        fut = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(key, deque()).append((factory, fut))
+        self._changed.set()
+        return fut
+
+    def _take(self):
+        """차례대로 돌면서 실행 가능한 키의 첫 작업을 꺼냄 (꺼낸 키는 맨 뒤로)"""
+        for key in list(self._pending):
+            if self.per_key_limit is not None and self._running.get(key, 0) >= self.per_key_limit:
+                continue
+
+            queue = self._pending[key]
+            while queue and queue[0][1].cancelled():
+                queue.popleft()
+            if not queue:
+                del self._pending[key]
+                continue
+
+            factory, fut = queue.popleft()
+            if queue:
+                self._pending.move_to_end(key)
+            else:
+                del self._pending[key]
+            return key, factory, fut
+        return None
+
+    async def _worker(self):
+        while True:
+            job = self._take()
+            if job is None:
+                self._changed.clear()
+                await self._changed.wait()
+                continue
+
+            key, factory, fut = job
+            self._running[key] = self._running.get(key, 0) + 1
+            try:
+                result = await factory()
+            except asyncio.CancelledError:
+                fut.cancel()
+                raise
+            except Exception as e:
+                if not fut.done():
+                    fut.set_exception(e)
+            else:
+                if not fut.done():
+                    fut.set_result(result)
+            finally:
+                self._running[key] -= 1
+                if not self._running[key]:
+                    del self._running[key]
+                # per_key_limit 때문에 기다리던 워커가 있을 수 있음
+                self._changed.set()
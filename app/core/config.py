@@ -0,0 +1,272 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    return int(value)
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    return float(value)
+
+
+# -----------------------------
+#   upstream 주소 (로컬 목 서버로 부하 테스트할 때 바꿔서 사용)
+# -----------------------------
+BAEMIN_MEMBER_BASE_URL = os.getenv("BAEMIN_MEMBER_BASE_URL", "https://biz-member.baemin.com").rstrip("/")
+BAEMIN_SELF_API_BASE_URL = os.getenv("BAEMIN_SELF_API_BASE_URL", "https://self-api.baemin.com").rstrip("/")
+
+
+# -----------------------------
+#   HTTP 커넥션 풀
+# -----------------------------
+# 호스트당 curl 핸들(= 동시 커넥션) 개수
+HTTP_MAX_CONNECTIONS_PER_HOST = _env_int("BAEMIN_HTTP_MAX_CONNECTIONS_PER_HOST", 10)
+
+# 이 시간(초) 이상 놀고 있는 커넥션/클라이언트는 정리
+HTTP_IDLE_TIMEOUT_SECONDS = _env_int("BAEMIN_HTTP_IDLE_TIMEOUT_SECONDS", 60)
+
+# 유휴 클라이언트 정리 주기(초)
+HTTP_REAP_INTERVAL_SECONDS = _env_float("BAEMIN_HTTP_REAP_INTERVAL_SECONDS", 30.0)
+
+HTTP_TIMEOUT_SECONDS = _env_int("BAEMIN_HTTP_TIMEOUT_SECONDS", 30)
+HTTP_PROXY = os.getenv("BAEMIN_HTTP_PROXY") or None
+
+# 기본 프로토콜: v1 (HTTP/1.1) / v2 (HTTP/2, 한 커넥션에 요청 멀티플렉싱) / auto (v2 로 시작, HTTP/2 오류 시 v1 로 전환)
+HTTP_VERSION = os.getenv("BAEMIN_HTTP_VERSION", "v1").lower()
+
+# 호스트별 프로토콜 (예: "self-api.baemin.com=v2,biz-member.baemin.com=v1")
+HTTP_VERSION_BY_HOST = {
+    host.strip(): version.strip().lower()
+    for host, _, version in (
+        item.partition("=") for item in os.getenv("BAEMIN_HTTP_VERSION_BY_HOST", "").split(",")
+    )
+    if host.strip() and version.strip()
+}
+
+# TLS 검증에 쓸 CA 번들 경로 (비우면 기본 CA, 자체 서명 인증서를 쓰는 목 서버용)
+HTTP_CA_BUNDLE = os.getenv("BAEMIN_HTTP_CA_BUNDLE") or None
+
+
+# -----------------------------
+#   주문 조회
+# -----------------------------
+# (매장 × 주문상태) 조합을 동시에 몇 개까지 조회할지
+ORDERS_FANOUT_CONCURRENCY = _env_int("BAEMIN_ORDERS_FANOUT_CONCURRENCY", 6)
+
+# 스트리밍 응답: 소비자에게 아직 안 나간 주문을 최대 몇 건까지 버퍼링할지
+ORDERS_STREAM_BUFFER_SIZE = _env_int("BAEMIN_ORDERS_STREAM_BUFFER_SIZE", 500)
+
+# 스트리밍 응답: (매장 × 상태) 하나당 동시에 진행할 페이지 수
+ORDERS_STREAM_PAGE_CONCURRENCY = _env_int("BAEMIN_ORDERS_STREAM_PAGE_CONCURRENCY", 2)
+
+# 배치 조회: 전체 계정이 나눠 쓰는 동시 작업 수 (계정 단위 라운드로빈)
+ORDERS_BATCH_CONCURRENCY = _env_int("BAEMIN_ORDERS_BATCH_CONCURRENCY", 24)
+
+# 배치 조회: 요청 하나에 넣을 수 있는 최대 계정 수
+ORDERS_BATCH_MAX_ACCOUNTS = _env_int("BAEMIN_ORDERS_BATCH_MAX_ACCOUNTS", 500)
+
+
+# -----------------------------
+#   주문 응답 압축
+# -----------------------------
+# 서버가 선호하는 압축 순서 (Accept-Encoding 의 q 가 같으면 앞쪽 우선, 비우면 압축하지 않음)
+RESPONSE_ENCODINGS = tuple(
+    e.strip().lower()
+    for e in os.getenv("BAEMIN_RESPONSE_ENCODINGS", "br,gzip").split(",")
+    if e.strip()
+)
+
+# 이보다 작은 응답은 압축하지 않음 (바이트)
+RESPONSE_COMPRESS_MIN_BYTES = _env_int("BAEMIN_RESPONSE_COMPRESS_MIN_BYTES", 1024)
+
+# 압축 수준 (높을수록 작지만 느림, benchmarks.bench_response 로 비교)
+RESPONSE_GZIP_LEVEL = _env_int("BAEMIN_RESPONSE_GZIP_LEVEL", 6)
+RESPONSE_BROTLI_QUALITY = _env_int("BAEMIN_RESPONSE_BROTLI_QUALITY", 5)
+
+
+# -----------------------------
+#   백그라운드 조회 작업 (/baemin/jobs)
+# -----------------------------
+# 동시에 실행하는 작업 수 (워커 수)
+JOBS_MAX_IN_FLIGHT = _env_int("BAEMIN_JOBS_MAX_IN_FLIGHT", 4)
+
+# 실행을 기다릴 수 있는 작업 수 (넘으면 submit 거절)
+JOBS_MAX_QUEUED = _env_int("BAEMIN_JOBS_MAX_QUEUED", 200)
+
+# 끝난 작업의 결과 보관 시간(초)
+JOBS_RESULT_TTL_SECONDS = _env_int("BAEMIN_JOBS_RESULT_TTL_SECONDS", 3600)
+
+# 결과 조회 한 번에 내려주는 최대 주문 수
+JOBS_RESULT_CHUNK_MAX = _env_int("BAEMIN_JOBS_RESULT_CHUNK_MAX", 5000)
+
+
+# -----------------------------
+#   주문 스냅샷 (/baemin/orders/snapshots)
+# -----------------------------
+# 조회 결과를 order_date 순으로 저장해 두는 디렉터리
+# 프로세스마다 <pid> 하위 디렉터리를 쓰고, 그 안의 스냅샷 파일(*.ndjson)만 지움
+ORDER_SNAPSHOT_PATH = os.getenv("BAEMIN_ORDER_SNAPSHOT_PATH", "/tmp/baemin_order_snapshots")
+
+# 스냅샷 보관 시간(초). 지나면 커서 조회 시 404
+ORDER_SNAPSHOT_TTL_SECONDS = _env_int("BAEMIN_ORDER_SNAPSHOT_TTL_SECONDS", 1800)
+
+# 동시에 보관하는 최대 스냅샷 수 (넘으면 가장 오래된 것부터 삭제)
+ORDER_SNAPSHOT_MAX_COUNT = _env_int("BAEMIN_ORDER_SNAPSHOT_MAX_COUNT", 200)
+
+# 페이지 하나에 내려주는 최대 주문 수
+ORDER_SNAPSHOT_PAGE_MAX = _env_int("BAEMIN_ORDER_SNAPSHOT_PAGE_MAX", 1000)
+
+
+# -----------------------------
+#   쿠키 캐시
+# -----------------------------
+# 메모리에 올려둘 계정 쿠키 최대 개수 (LRU)
+COOKIE_CACHE_MAX_ENTRIES = _env_int("BAEMIN_COOKIE_CACHE_MAX_ENTRIES", 1024)
+
+# 쿠키 저장소: file (계정당 JSON 파일) / sqlite (WAL, 여러 워커 프로세스가 공유 가능)
+COOKIE_STORE_BACKEND = os.getenv("BAEMIN_COOKIE_STORE_BACKEND", "file").lower()
+COOKIE_STORE_FILE_PATH = os.getenv("BAEMIN_COOKIE_STORE_FILE_PATH", "/tmp/baemin_cookies")
+COOKIE_STORE_SQLITE_PATH = os.getenv("BAEMIN_COOKIE_STORE_SQLITE_PATH", "/tmp/baemin_cookies.sqlite3")
+
+# 시작 시 저장소에서 유효한 쿠키를 한 번에 읽어 메모리 캐시에 올릴지
+COOKIE_WARM_ON_START = os.getenv("BAEMIN_COOKIE_WARM_ON_START", "1") not in ("0", "false", "False")
+
+# 만료된 쿠키를 저장소에서 지우는 주기(초). 0 이면 안 지움
+COOKIE_SWEEP_INTERVAL_SECONDS = _env_float("BAEMIN_COOKIE_SWEEP_INTERVAL_SECONDS", 600.0)
+
+
+# -----------------------------
+#   세션 선제 갱신
+# -----------------------------
+# 쿠키 만료까지 이만큼(초) 남으면 백그라운드에서 미리 재로그인
+SESSION_REFRESH_BEFORE_SECONDS = _env_int("BAEMIN_SESSION_REFRESH_BEFORE_SECONDS", 300)
+
+# 갱신 대상 확인 주기(초). 0 이면 선제 갱신 끔 (401 재로그인은 계속 동작)
+SESSION_REFRESH_INTERVAL_SECONDS = _env_float("BAEMIN_SESSION_REFRESH_INTERVAL_SECONDS", 30.0)
+
+# 마지막 요청 후 이 시간(초) 안의 계정만 "활성" 으로 보고 갱신 (지나면 비밀번호도 메모리에서 지움)
+SESSION_ACTIVE_WINDOW_SECONDS = _env_int("BAEMIN_SESSION_ACTIVE_WINDOW_SECONDS", 3 * 3600)
+
+# 선제 갱신 동시 로그인 수
+SESSION_REFRESH_CONCURRENCY = _env_int("BAEMIN_SESSION_REFRESH_CONCURRENCY", 4)
+
+
+# -----------------------------
+#   계정 메타데이터 캐시 (shopOwnerNumber + 매장 목록)
+# -----------------------------
+# 이 시간(초)이 지나면 stale → 응답은 캐시로 하고 백그라운드에서 갱신
+ACCOUNT_META_TTL_SECONDS = _env_int("BAEMIN_ACCOUNT_META_TTL_SECONDS", 3600)
+
+# 이 시간(초)보다 오래된 캐시는 쓰지 않고 요청 안에서 바로 다시 조회
+ACCOUNT_META_MAX_STALE_SECONDS = _env_int("BAEMIN_ACCOUNT_META_MAX_STALE_SECONDS", 86400)
+
+# 메모리에 올려둘 계정 메타데이터 최대 개수 (LRU)
+ACCOUNT_META_MAX_ENTRIES = _env_int("BAEMIN_ACCOUNT_META_MAX_ENTRIES", 1024)
+
+
+# -----------------------------
+#   지난 날짜 주문 결과 캐시
+# -----------------------------
+ORDER_DAY_CACHE_ENABLED = os.getenv("BAEMIN_ORDER_DAY_CACHE_ENABLED", "1") not in ("0", "false", "False")
+ORDER_DAY_CACHE_PATH = os.getenv("BAEMIN_ORDER_DAY_CACHE_PATH", "/tmp/baemin_order_days")
+
+# 캐시해도 되는(더 이상 바뀌지 않는) 주문 상태
+ORDER_DAY_CACHE_STATUSES = tuple(
+    s.strip().upper()
+    for s in os.getenv("BAEMIN_ORDER_DAY_CACHE_STATUSES", "CLOSED,CANCELLED").split(",")
+    if s.strip()
+)
+
+# 오늘 기준 며칠 전 날짜부터 확정된 것으로 볼지 (1 = 어제까지)
+ORDER_DAY_CACHE_SETTLE_DAYS = _env_int("BAEMIN_ORDER_DAY_CACHE_SETTLE_DAYS", 1)
+
+# 메모리에 올려둘 (매장, 상태, 날짜) 항목 수 (LRU)
+ORDER_DAY_CACHE_MEMORY_ENTRIES = _env_int("BAEMIN_ORDER_DAY_CACHE_MEMORY_ENTRIES", 5000)
+
+
+# -----------------------------
+#   주문 조회 기간 분할
+# -----------------------------
+# 긴 기간을 며칠 단위로 나눠 병렬 조회할지 (0 이면 나누지 않음)
+ORDERS_SHARD_DAYS = _env_int("BAEMIN_ORDERS_SHARD_DAYS", 7)
+
+# (매장 × 상태) 하나당 동시에 조회할 구간 수
+ORDERS_SHARD_CONCURRENCY = _env_int("BAEMIN_ORDERS_SHARD_CONCURRENCY", 4)
+
+# 한 구간의 totalSize 가 이보다 크면 구간을 반으로 더 쪼갬 (깊은 offset 회피)
+ORDERS_SHARD_MAX_ROWS = _env_int("BAEMIN_ORDERS_SHARD_MAX_ROWS", 2000)
+
+
+# -----------------------------
+#   주문 파싱
+# -----------------------------
+# 1 이면 pydantic 모델 생성 없이 dict 를 바로 만드는 빠른 파서 사용
+ORDER_PARSER_FAST = os.getenv("BAEMIN_ORDER_PARSER_FAST", "1") not in ("0", "false", "False")
+
+
+# -----------------------------
+#   로깅
+# -----------------------------
+LOG_LEVEL = os.getenv("BAEMIN_LOG_LEVEL", "INFO").upper()
+
+# 1 이면 QueueHandler → 별도 스레드(QueueListener)에서 포맷/출력 (이벤트 루프 블로킹 없음)
+LOG_QUEUE_ENABLED = os.getenv("BAEMIN_LOG_QUEUE_ENABLED", "1") not in ("0", "false", "False")
+
+# HTTP 응답 본문 일부(앞 300자)를 남길 확률 (0 ~ 1)
+LOG_BODY_SAMPLE_RATE = _env_float("BAEMIN_LOG_BODY_SAMPLE_RATE", 0.01)
+
+
+# -----------------------------
+#   호스트별 AIMD 속도 제어
+# -----------------------------
+RATE_INITIAL_RPS = _env_float("BAEMIN_RATE_INITIAL_RPS", 3.0)
+RATE_MIN_RPS = _env_float("BAEMIN_RATE_MIN_RPS", 0.2)
+RATE_MAX_RPS = _env_float("BAEMIN_RATE_MAX_RPS", 10.0)
+
+# 정상 응답 1건마다 올리는 초당 요청 수 (additive increase)
+RATE_INCREASE_RPS = _env_float("BAEMIN_RATE_INCREASE_RPS", 0.05)
+
+# 429 / 403 / 503 / 차단 페이지를 받으면 곱하는 비율 (multiplicative decrease)
+RATE_DECREASE_FACTOR = _env_float("BAEMIN_RATE_DECREASE_FACTOR", 0.5)
+
+# 감속 후 이 시간(초) 동안은 추가 감속 안 함 (이미 나가 있던 요청들의 실패로 연달아 깎이지 않게)
+RATE_DECREASE_COOLDOWN_SECONDS = _env_float("BAEMIN_RATE_DECREASE_COOLDOWN_SECONDS", 1.0)
+
+# 호스트당 동시에 나가 있는 요청 수
+RATE_MAX_CONCURRENCY = _env_int("BAEMIN_RATE_MAX_CONCURRENCY", 3)
+
+# 요청 간격에 주는 ± 흔들림 비율 (0.3 → 간격의 70% ~ 130%)
+RATE_JITTER = _env_float("BAEMIN_RATE_JITTER", 0.3)
+
+
+# -----------------------------
+#   페이지 재시도 / 체크포인트
+# -----------------------------
+PAGE_RETRY_MAX_ATTEMPTS = _env_int("BAEMIN_PAGE_RETRY_MAX_ATTEMPTS", 4)
+PAGE_RETRY_BASE_DELAY_SECONDS = _env_float("BAEMIN_PAGE_RETRY_BASE_DELAY_SECONDS", 0.5)
+PAGE_RETRY_MAX_DELAY_SECONDS = _env_float("BAEMIN_PAGE_RETRY_MAX_DELAY_SECONDS", 8.0)
+
+# fetch_orders 한 번에 허용하는 재시도 수 = max(MIN, 페이지 요청 수 × RATIO)
+PAGE_RETRY_BUDGET_RATIO = _env_float("BAEMIN_PAGE_RETRY_BUDGET_RATIO", 0.2)
+PAGE_RETRY_BUDGET_MIN = _env_int("BAEMIN_PAGE_RETRY_BUDGET_MIN", 3)
+
+# 실패한 조회에서 이미 받아둔 페이지를 보관하는 시간(초) / 최대 페이지 수
+PAGE_CHECKPOINT_TTL_SECONDS = _env_int("BAEMIN_PAGE_CHECKPOINT_TTL_SECONDS", 600)
+PAGE_CHECKPOINT_MAX_PAGES = _env_int("BAEMIN_PAGE_CHECKPOINT_MAX_PAGES", 5000)
+
+
+# -----------------------------
+#   로그인 RSA 암호화
+# -----------------------------
+# auto: cryptography 패키지가 있으면 OpenSSL 로 암호화, 없으면 순수 파이썬 / python: 항상 순수 파이썬
+RSA_BACKEND = os.getenv("BAEMIN_RSA_BACKEND", "auto").lower()
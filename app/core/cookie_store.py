@@ -1,36 +1,427 @@
+import asyncio
 import json
 import os
+import sqlite3
+import tempfile
+import threading
 import time
-from typing import Optional
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
-BASE_PATH = "/tmp/baemin_cookies"
+from app.core import config
+from app.core.logger import baemin_logger
+
+BASE_PATH = config.COOKIE_STORE_FILE_PATH
 os.makedirs(BASE_PATH, exist_ok=True)
 
 COOKIE_EXPIRE_SECONDS = 3600
 
+# (cookies, saved_at)
+CookieRecord = Tuple[dict, float]
+
 
-def get_cookie_path(account_id: str):
-    return f"{BASE_PATH}/{account_id}.json"
+def get_cookie_path(account_id: str, base_path: str = BASE_PATH):
+    return f"{base_path}/{account_id}.json"
 
 
-def save_cookie(account_id: str, cookies: dict):
+def save_cookie(
+    account_id: str, cookies: dict, saved_at: float | None = None, base_path: str = BASE_PATH
+):
+    saved_at = time.time() if saved_at is None else saved_at
     payload = {
         "cookies": cookies,
-        "saved_at": time.time()
+        "saved_at": saved_at
     }
-    with open(get_cookie_path(account_id), "w") as f:
-        json.dump(payload, f)
 
+    # 임시 파일에 쓴 뒤 rename → 읽는 쪽이 반쯤 쓰인 파일을 보지 않음
+    fd, tmp_path = tempfile.mkstemp(dir=base_path, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(payload, f)
+        # mtime = saved_at → 일괄 로드 / 만료 정리 때 파일을 열지 않고 거를 수 있음
+        os.utime(tmp_path, (saved_at, saved_at))
+        os.replace(tmp_path, get_cookie_path(account_id, base_path))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
-def load_cookie(account_id: str) -> Optional[dict]:
-    path = get_cookie_path(account_id)
+
+def _read_cookie_file(account_id: str, base_path: str = BASE_PATH) -> Optional[dict]:
+    path = get_cookie_path(account_id, base_path)
     if not os.path.exists(path):
         return None
 
     with open(path, "r") as f:
-        data = json.load(f)
+        return json.load(f)
+
+
+def load_cookie(account_id: str) -> Optional[dict]:
+    data = _read_cookie_file(account_id)
+    if data is None:
+        return None
 
     if time.time() - data["saved_at"] > COOKIE_EXPIRE_SECONDS:
         return None  # expired
 
     return data["cookies"]
+
+
+# ============================================================================
+# 저장소 백엔드
+# ============================================================================
+class CookieBackend(ABC):
+    """
+    쿠키 영구 저장소 인터페이스 (CookieCache 뒤에 붙음)
+
+    - get / put / invalidate : 계정 하나 단위
+    - load_since             : saved_at 이 since 이후인 쿠키를 최신순으로 한꺼번에 (시작 시 캐시 채우기)
+    - sweep                  : saved_at 이 before 보다 오래된 쿠키 삭제, 지운 개수 반환
+    - open / close           : 연결 같은 자원을 잡고 놓음 (CookieCache.start / close 에서 호출, 다시 open 가능)
+    """
+
+    name = "base"
+
+    @abstractmethod
+    async def get(self, account_id: str) -> Optional[CookieRecord]:
+        ...
+
+    @abstractmethod
+    async def put(self, account_id: str, cookies: dict, saved_at: float):
+        ...
+
+    @abstractmethod
+    async def invalidate(self, account_id: str):
+        ...
+
+    @abstractmethod
+    async def load_since(self, since: float, limit: int) -> List[Tuple[str, dict, float]]:
+        ...
+
+    @abstractmethod
+    async def sweep(self, before: float) -> int:
+        ...
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+
+class FileCookieBackend(CookieBackend):
+    """계정당 JSON 파일 하나 (기존 방식). 파일 I/O 는 스레드에서"""
+
+    name = "file"
+
+    def __init__(self, base_path: str = BASE_PATH):
+        self.base_path = base_path
+        os.makedirs(base_path, exist_ok=True)
+
+    async def get(self, account_id: str) -> Optional[CookieRecord]:
+        data = await asyncio.to_thread(_read_cookie_file, account_id, self.base_path)
+        if data is None:
+            return None
+        return data["cookies"], data["saved_at"]
+
+    async def put(self, account_id: str, cookies: dict, saved_at: float):
+        await asyncio.to_thread(save_cookie, account_id, cookies, saved_at, self.base_path)
+
+    async def invalidate(self, account_id: str):
+        def remove():
+            try:
+                os.unlink(get_cookie_path(account_id, self.base_path))
+            except FileNotFoundError:
+                pass
+
+        await asyncio.to_thread(remove)
+
+    def _scan(self):
+        """(account_id, 경로, mtime) – save_cookie 가 mtime 을 saved_at 으로 맞춰 둠"""
+        with os.scandir(self.base_path) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    yield entry.name[:-5], entry.path, entry.stat().st_mtime
+
+    async def load_since(self, since: float, limit: int) -> List[Tuple[str, dict, float]]:
+        def load():
+            candidates = sorted(
+                (c for c in self._scan() if c[2] >= since), key=lambda c: c[2], reverse=True
+            )[:limit]
+            rows = []
+            for account_id, path, _ in candidates:
+                try:
+                    with open(path, "r") as f:
+                        data = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                if data["saved_at"] >= since:
+                    rows.append((account_id, data["cookies"], data["saved_at"]))
+            return rows
+
+        return await asyncio.to_thread(load)
+
+    async def sweep(self, before: float) -> int:
+        def sweep():
+            removed = 0
+            for _, path, mtime in self._scan():
+                if mtime < before:
+                    try:
+                        os.unlink(path)
+                        removed += 1
+                    except FileNotFoundError:
+                        pass
+            return removed
+
+        return await asyncio.to_thread(sweep)
+
+
+class SqliteCookieBackend(CookieBackend):
+    """
+    SQLite(WAL) 파일 하나에 전체 계정 쿠키 저장
+
+    - WAL 모드 → 여러 uvicorn 워커 프로세스가 같은 파일을 동시에 읽고 쓸 수 있음
+    - saved_at 인덱스 → 시작 시 최신 쿠키 일괄 로드 / 만료 정리가 전체 스캔 없이 동작
+    - 연결 하나를 락으로 보호하고 쿼리는 스레드에서 실행
+    - 연결은 import 시점이 아니라 open()(CookieCache.start) 에서 열고, close() 후 다시 열 수 있음
+      (open 전에 쓰이면 첫 쿼리에서 엶)
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str = config.COOKIE_STORE_SQLITE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """self._lock 을 잡은 상태에서 호출"""
+        if self._conn is not None:
+            return self._conn
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cookies ("
+                " account_id TEXT PRIMARY KEY,"
+                " cookies TEXT NOT NULL,"
+                " saved_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS cookies_saved_at ON cookies(saved_at)")
+        except BaseException:
+            conn.close()
+            raise
+        self._conn = conn
+        return conn
+
+    def _execute(self, sql: str, params=()) -> list:
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    async def open(self):
+        def connect():
+            with self._lock:
+                self._connect()
+
+        await asyncio.to_thread(connect)
+
+    async def get(self, account_id: str) -> Optional[CookieRecord]:
+        rows = await asyncio.to_thread(
+            self._execute, "SELECT cookies, saved_at FROM cookies WHERE account_id = ?", (account_id,)
+        )
+        if not rows:
+            return None
+        cookies, saved_at = rows[0]
+        return json.loads(cookies), saved_at
+
+    async def put(self, account_id: str, cookies: dict, saved_at: float):
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT INTO cookies (account_id, cookies, saved_at) VALUES (?, ?, ?)"
+            " ON CONFLICT(account_id) DO UPDATE SET cookies = excluded.cookies, saved_at = excluded.saved_at",
+            (account_id, json.dumps(cookies), saved_at),
+        )
+
+    async def invalidate(self, account_id: str):
+        await asyncio.to_thread(
+            self._execute, "DELETE FROM cookies WHERE account_id = ?", (account_id,)
+        )
+
+    async def load_since(self, since: float, limit: int) -> List[Tuple[str, dict, float]]:
+        rows = await asyncio.to_thread(
+            self._execute,
+            "SELECT account_id, cookies, saved_at FROM cookies"
+            " WHERE saved_at >= ? ORDER BY saved_at DESC LIMIT ?",
+            (since, limit),
+        )
+        return [(account_id, json.loads(cookies), saved_at) for account_id, cookies, saved_at in rows]
+
+    async def sweep(self, before: float) -> int:
+        def sweep():
+            with self._lock:
+                return self._connect().execute(
+                    "DELETE FROM cookies WHERE saved_at < ?", (before,)
+                ).rowcount
+
+        return await asyncio.to_thread(sweep)
+
+    async def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def create_backend(name: str = config.COOKIE_STORE_BACKEND) -> CookieBackend:
+    if name == "sqlite":
+        return SqliteCookieBackend(config.COOKIE_STORE_SQLITE_PATH)
+    if name == "file":
+        return FileCookieBackend(config.COOKIE_STORE_FILE_PATH)
+    raise ValueError(f"unknown cookie store backend: {name}")
+
+
+# ============================================================================
+# 메모리 캐시
+# ============================================================================
+class CookieCache:
+    """
+    쿠키 저장소(backend) 앞단의 LRU + TTL 메모리 캐시 (account_id 기준)
+
+    - 히트면 저장소를 전혀 건드리지 않음
+    - 미스면 저장소에서 한 번 읽어 캐시에 올림
+    - 저장은 메모리 갱신 후 저장소에 기록 (write-through)
+    - TTL 은 쿠키 저장 시각(saved_at) 기준 COOKIE_EXPIRE_SECONDS
+    - start() : 저장소의 유효한 쿠키를 최신순으로 maxsize 개까지 미리 올리고, 만료 정리 루프 시작
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = COOKIE_EXPIRE_SECONDS,
+        backend: Optional[CookieBackend] = None,
+        sweep_interval: float = config.COOKIE_SWEEP_INTERVAL_SECONDS,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.backend = backend if backend is not None else FileCookieBackend()
+        self.sweep_interval = sweep_interval
+        self._entries: "OrderedDict[str, CookieRecord]" = OrderedDict()
+        self._sweeper: Optional[asyncio.Task] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.warmed = 0
+        self.swept = 0
+
+    # ========================================================================
+    # LIFECYCLE
+    # ========================================================================
+    async def start(self, warm: bool = config.COOKIE_WARM_ON_START):
+        await self.backend.open()
+        if warm:
+            await self.warm()
+        if self._sweeper is None and self.sweep_interval > 0:
+            self._sweeper = asyncio.create_task(self._sweep_loop())
+
+    async def close(self):
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+        await self.backend.close()
+
+    async def warm(self) -> int:
+        """저장소에서 아직 유효한 쿠키를 한 번에 읽어 캐시에 올림"""
+        rows = await self.backend.load_since(time.time() - self.ttl, self.maxsize)
+        # 최신순으로 오므로 역순으로 넣어야 최신이 LRU 의 맨 뒤(가장 최근)에 옴
+        for account_id, cookies, saved_at in reversed(rows):
+            self._remember(account_id, cookies, saved_at)
+        self.warmed += len(rows)
+        baemin_logger.info("[COOKIE CACHE] warmed %d accounts from %s", len(rows), self.backend.name)
+        return len(rows)
+
+    async def sweep_expired(self) -> int:
+        removed = await self.backend.sweep(time.time() - self.ttl)
+        self.swept += removed
+        return removed
+
+    async def _sweep_loop(self):
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                await self.sweep_expired()
+            except Exception as e:
+                baemin_logger.error("[COOKIE CACHE] sweep error: %s", e)
+
+    # ========================================================================
+    # GET / PUT
+    # ========================================================================
+    def _remember(self, account_id: str, cookies: dict, saved_at: float):
+        self._entries[account_id] = (cookies, saved_at)
+        self._entries.move_to_end(account_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _expired(self, saved_at: float) -> bool:
+        return time.time() - saved_at > self.ttl
+
+    async def get(self, account_id: str) -> Optional[dict]:
+        entry = self._entries.get(account_id)
+        if entry is not None:
+            cookies, saved_at = entry
+            if not self._expired(saved_at):
+                self._entries.move_to_end(account_id)
+                self.hits += 1
+                return cookies
+            # 만료 → 저장소 사본도 같은 saved_at 이므로 다시 읽을 필요 없음
+            del self._entries[account_id]
+            self.misses += 1
+            return None
+
+        self.misses += 1
+        record = await self.backend.get(account_id)
+        if record is None or self._expired(record[1]):
+            return None
+
+        self._remember(account_id, *record)
+        return record[0]
+
+    def saved_at(self, account_id: str) -> Optional[float]:
+        """메모리에 올라와 있는 쿠키의 저장 시각 (없으면 None, 저장소는 조회하지 않음)"""
+        entry = self._entries.get(account_id)
+        return entry[1] if entry is not None else None
+
+    async def put(self, account_id: str, cookies: dict):
+        saved_at = time.time()
+        self._remember(account_id, cookies, saved_at)
+        await self.backend.put(account_id, cookies, saved_at)
+
+    async def invalidate(self, account_id: str):
+        """메모리와 저장소에서 모두 제거 (세션이 끊긴 쿠키를 다른 워커도 쓰지 않게)"""
+        self._entries.pop(account_id, None)
+        await self.backend.invalidate(account_id)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "warmed": self.warmed,
+            "swept": self.swept,
+        }
+
+
+cookie_cache = CookieCache(maxsize=config.COOKIE_CACHE_MAX_ENTRIES, backend=create_backend())
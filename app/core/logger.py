@@ -1,7 +1,13 @@
+import atexit
+import copy
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+from app.core import config
 
 baemin_logger = logging.getLogger("baemin-crawler")
-baemin_logger.setLevel(logging.INFO)
+baemin_logger.setLevel(config.LOG_LEVEL)
 
 console_handler = logging.StreamHandler()
 console_formatter = logging.Formatter(
@@ -10,7 +16,41 @@ console_formatter = logging.Formatter(
 )
 console_handler.setFormatter(console_formatter)
 
+
+class LazyQueueHandler(QueueHandler):
+    """
+    기본 QueueHandler 는 큐에 넣기 전에 호출한 스레드(= 이벤트 루프)에서 메시지를 포맷함.
+    msg % args 포맷은 리스너 스레드에서 하도록 레코드를 그대로 넘기고,
+    traceback 만 미리 문자열로 만들어 프레임 참조를 끊음
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        if record.exc_info:
+            record.exc_text = console_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_log_listener: QueueListener | None = None
+
+
+def stop_log_listener():
+    """큐에 남은 로그를 모두 출력하고 리스너 스레드 종료"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
 if not baemin_logger.handlers:
-    baemin_logger.addHandler(console_handler)
+    if config.LOG_QUEUE_ENABLED:
+        _log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        baemin_logger.addHandler(LazyQueueHandler(_log_queue))
+        _log_listener = QueueListener(_log_queue, console_handler)
+        _log_listener.start()
+        atexit.register(stop_log_listener)
+    else:
+        baemin_logger.addHandler(console_handler)
 
-__all__ = ["baemin_logger"]
+__all__ = ["baemin_logger", "stop_log_listener"]
@@ -0,0 +1,233 @@
+"""
+prometheus_client 없이 쓰는 최소한의 Counter / Histogram / Gauge
+
+- 모든 값은 이벤트 루프 스레드에서만 갱신 → 락 없음, 관측 1회 = dict 조회 + 덧셈 몇 번
+- render() 가 Prometheus text exposition format (0.0.4) 문자열을 만듦
+"""
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+def _format_labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels, amount: float = 1):
+        key = tuple(str(v) for v in labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, *labels) -> float:
+        return self._values.get(tuple(str(v) for v in labels), 0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for key, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key → [버킷별 카운트..., sum, count]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, *labels, count: int = 1):
+        """
+        count > 1 이면 같은 값을 count 번 관측한 것으로 기록
+        (페이지 단위로 잰 시간을 주문 단위 평균으로 넣을 때 사용)
+        """
+        key = tuple(str(v) for v in labels)
+        data = self._values.get(key)
+        if data is None:
+            data = self._values[key] = [0] * (len(self.buckets) + 2)
+
+        idx = bisect_left(self.buckets, value)
+        if idx < len(self.buckets):
+            data[idx] += count
+        data[-2] += value * count
+        data[-1] += count
+
+    def time(self, *labels) -> "_Timer":
+        return _Timer(self, labels)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for key, data in sorted(self._values.items()):
+            cumulative = 0
+            for bound, n in zip(self.buckets, data):
+                cumulative += n
+                le = f'le="{_format_value(float(bound))}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {_format_value(cumulative)}"
+                )
+            inf = 'le="+Inf"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, inf)} {_format_value(data[-1])}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(data[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {_format_value(data[-1])}")
+        return lines
+
+
+class _Timer:
+    __slots__ = ("histogram", "labels", "started")
+
+    def __init__(self, histogram: Histogram, labels: Iterable):
+        self.histogram = histogram
+        self.labels = tuple(labels)
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.started, *self.labels)
+        return False
+
+
+class Gauge:
+    """render 시점에 callback() 으로 값을 읽어오는 게이지 ({라벨값 튜플: 값} 또는 단일 값)"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], object],
+        labelnames: Sequence[str] = (),
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.callback = callback
+        self.labelnames = tuple(labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"]
+        value = self.callback()
+        items = value.items() if isinstance(value, dict) else [((), value)]
+        for key, v in items:
+            key = key if isinstance(key, tuple) else (key,)
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}")
+        return lines
+
+
+REGISTRY: List[object] = []
+
+
+def register(metric):
+    REGISTRY.append(metric)
+    return metric
+
+
+def render() -> str:
+    lines: List[str] = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# -----------------------------
+#   크롤러 지표
+# -----------------------------
+UPSTREAM_LATENCY = register(Histogram(
+    "baemin_upstream_request_seconds",
+    "Upstream HTTP request latency (excluding client-side throttling)",
+    ["endpoint", "method"],
+))
+
+UPSTREAM_RESPONSES = register(Counter(
+    "baemin_upstream_responses_total",
+    "Upstream HTTP responses by status code",
+    ["endpoint", "status"],
+))
+
+BLOCK_PAGES = register(Counter(
+    "baemin_block_pages_total",
+    "Baemin security block pages detected",
+    ["endpoint"],
+))
+
+HTTP2_FALLBACKS = register(Counter(
+    "baemin_http2_fallbacks_total",
+    "Hosts switched from HTTP/2 to HTTP/1.1 after an HTTP/2 error (http_version=auto)",
+    ["host"],
+))
+
+THROTTLE_WAIT = register(Histogram(
+    "baemin_throttle_wait_seconds",
+    "Time spent waiting on the per-host rate controller",
+    ["host"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+))
+
+PAGE_RETRIES = register(Counter(
+    "baemin_page_retries_total",
+    "Order page retries (retried / budget_exhausted)",
+    ["outcome"],
+))
+
+PAGES_PER_FETCH = register(Histogram(
+    "baemin_fetch_orders_pages",
+    "Order pages fetched per fetch_orders call",
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500),
+))
+
+PARSE_SECONDS_PER_ORDER = register(Histogram(
+    "baemin_parse_order_seconds",
+    "parse_order time per order",
+    buckets=(0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.005),
+))
+
+PARSE_FALLBACKS = register(Counter(
+    "baemin_parse_order_fallbacks_total",
+    "Orders the fast parser handed to the pydantic model path (non-string text fields)",
+))
+
+
+def endpoint_label(url: str) -> str:
+    """URL → 지표용 엔드포인트 이름 (라벨 카디널리티 고정)"""
+    if "/login/init" in url:
+        return "login_init"
+    if "/v1/login" in url:
+        return "login"
+    if "/session/profile" in url:
+        return "profile"
+    if "/store/shops" in url:
+        return "shops"
+    if "/v4/orders" in url:
+        return "orders"
+    return "other"
@@ -0,0 +1,94 @@
+import asyncio
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from datetime import date
+from typing import Optional, Tuple
+
+from app.core import config
+
+
+def _read_json(path: str) -> Optional[list]:
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _write_json_atomic(path: str, rows: list):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(rows, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class OrderDayCache:
+    """
+    (shop_no, status, day) 단위 파싱 결과 캐시
+
+    - 이미 끝난 날짜의 주문은 바뀌지 않으므로 만료 없이 디스크에 영구 저장
+    - 앞단에 LRU 메모리 캐시를 두고, 디스크 I/O 는 스레드에서 처리
+    - 주문이 0건인 날도 빈 리스트로 저장 (다시 조회하지 않도록)
+    """
+
+    def __init__(self, base_path: str, max_memory_entries: int = 5000):
+        self.base_path = base_path
+        self.max_memory_entries = max_memory_entries
+        self._mem: "OrderedDict[Tuple[str, str, date], list]" = OrderedDict()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _path(self, shop_no, status: str, day: date) -> str:
+        return os.path.join(self.base_path, str(shop_no), status, f"{day.isoformat()}.json")
+
+    def _remember(self, key, rows: list):
+        self._mem[key] = rows
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.max_memory_entries:
+            self._mem.popitem(last=False)
+
+    async def get(self, shop_no, status: str, day: date) -> Optional[list]:
+        key = (str(shop_no), status, day)
+        rows = self._mem.get(key)
+        if rows is not None:
+            self._mem.move_to_end(key)
+            self.memory_hits += 1
+            return rows
+
+        rows = await asyncio.to_thread(_read_json, self._path(shop_no, status, day))
+        if rows is None:
+            self.misses += 1
+            return None
+
+        self.disk_hits += 1
+        self._remember(key, rows)
+        return rows
+
+    async def put(self, shop_no, status: str, day: date, rows: list):
+        self._remember((str(shop_no), status, day), rows)
+        await asyncio.to_thread(_write_json_atomic, self._path(shop_no, status, day), rows)
+
+    def stats(self) -> dict:
+        return {
+            "memory_size": len(self._mem),
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+        }
+
+
+order_day_cache = OrderDayCache(
+    config.ORDER_DAY_CACHE_PATH,
+    max_memory_entries=config.ORDER_DAY_CACHE_MEMORY_ENTRIES,
+)
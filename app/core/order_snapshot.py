@@ -0,0 +1,256 @@
+import asyncio
+import base64
+import json
+import os
+import tempfile
+import time
+import uuid
+from array import array
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.core import config
+from app.core.logger import baemin_logger
+
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, default=str)
+
+except ImportError:  # orjson 이 없으면 표준 json 으로
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _sort_key(order: dict):
+    return order.get("order_date") or 0, order.get("order_delivery_id") or ""
+
+
+def _write_snapshot(path: str, orders: list) -> Tuple[array, array]:
+    """
+    주문을 최신순(order_date 내림차순)으로 정렬해 한 줄에 하나씩 저장
+    반환: (줄 시작 위치 offsets[n + 1], order_date dates[n])
+    """
+    rows = sorted(orders, key=_sort_key, reverse=True)
+    offsets = array("q", [0])
+    dates = array("q")
+
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pos = 0
+            for order in rows:
+                line = _dumps(order) + b"\n"
+                f.write(line)
+                pos += len(line)
+                offsets.append(pos)
+                dates.append(int(order.get("order_date") or 0))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    return offsets, dates
+
+
+def _read_range(path: str, start: int, end: int) -> bytes:
+    with open(path, "rb") as f:
+        return os.pread(f.fileno(), end - start, start)
+
+
+def encode_cursor(position: int, order_date: int) -> str:
+    raw = f"{position}:{order_date}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[int, int]:
+    """잘못된 커서면 ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        position, order_date = raw.split(":")
+        return int(position), int(order_date)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"invalid cursor: {cursor!r}") from e
+
+
+class OrderSnapshot:
+    __slots__ = ("id", "account_id", "params", "path", "offsets", "dates", "created_at", "expires_at")
+
+    def __init__(
+        self, snapshot_id: str, account_id: str, params: dict, path: str,
+        offsets: array, dates: array, ttl: float,
+    ):
+        self.id = snapshot_id
+        self.account_id = account_id
+        self.params = params
+        self.path = path
+        self.offsets = offsets
+        self.dates = dates
+        self.created_at = time.time()
+        self.expires_at = self.created_at + ttl
+
+    @property
+    def total(self) -> int:
+        return len(self.dates)
+
+    @property
+    def size_bytes(self) -> int:
+        return self.offsets[-1]
+
+    def position_of(self, cursor: Optional[str]) -> int:
+        """커서 → 다음에 읽을 위치. 이 스냅샷의 커서가 아니면 ValueError"""
+        if not cursor:
+            return 0
+        position, order_date = decode_cursor(cursor)
+        if not 0 < position <= self.total or self.dates[position - 1] != order_date:
+            raise ValueError(f"cursor does not belong to snapshot {self.id}")
+        return position
+
+    def next_cursor(self, end: int) -> Optional[str]:
+        if end >= self.total:
+            return None
+        return encode_cursor(end, self.dates[end - 1])
+
+
+class OrderSnapshotStore:
+    """
+    한 번 조회한 주문 결과를 스냅샷으로 고정해 두고 커서로 나눠 내려주는 저장소
+
+    - 주문은 최신순으로 정렬해 디스크 파일에 한 줄씩(orjson) 저장
+    - 메모리에는 줄 시작 위치(offsets) / order_date(dates) 배열만 둠 (주문당 16바이트)
+    - 페이지 조회 = offsets 로 범위를 찾아 pread 한 번 → 페이지 크기에만 비례, upstream 호출 없음
+    - 커서는 (다음 위치, 직전 주문의 order_date) → 다른 스냅샷 / 위조 커서는 거절
+    - ttl 이 지나거나 max_count 를 넘으면 오래된 스냅샷부터 파일째 삭제
+    - 파일은 base_path/<pid>/ 아래에만 씀 → 같은 base_path 를 쓰는 다른 프로세스(워커)의
+      파일이나 base_path 에 원래 있던 파일은 건드리지 않음
+    """
+
+    def __init__(
+        self,
+        base_path: str = config.ORDER_SNAPSHOT_PATH,
+        ttl: float = config.ORDER_SNAPSHOT_TTL_SECONDS,
+        max_count: int = config.ORDER_SNAPSHOT_MAX_COUNT,
+    ):
+        self.base_path = base_path
+        self.directory = os.path.join(base_path, str(os.getpid()))
+        self.ttl = ttl
+        self.max_count = max(1, max_count)
+
+        self._snapshots: "OrderedDict[str, OrderSnapshot]" = OrderedDict()
+
+        self.created = 0
+        self.expired = 0
+        self.pages_served = 0
+
+    # ========================================================================
+    # LIFECYCLE
+    # ========================================================================
+    async def start(self):
+        # 같은 pid 를 쓰던 이전 프로세스가 남긴 스냅샷은 인덱스가 없으므로 지움 (이 저장소가 만든 파일만)
+        os.makedirs(self.directory, exist_ok=True)
+        await asyncio.to_thread(self._remove_own_files)
+
+    async def close(self):
+        snapshots = list(self._snapshots.values())
+        self._snapshots.clear()
+        for snapshot in snapshots:
+            self._unlink(snapshot)
+        await asyncio.to_thread(self._remove_own_files)
+        try:
+            os.rmdir(self.directory)
+        except OSError:  # 이미 없거나 다른 파일이 있음
+            pass
+
+    def _remove_own_files(self):
+        try:
+            with os.scandir(self.directory) as it:
+                names = [e.name for e in it if e.name.endswith((".ndjson", ".tmp")) and e.is_file()]
+        except FileNotFoundError:
+            return
+        for name in names:
+            try:
+                os.unlink(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+
+    # ========================================================================
+    # SNAPSHOTS
+    # ========================================================================
+    async def create(self, account_id: str, params: dict, orders: list) -> OrderSnapshot:
+        snapshot_id = uuid.uuid4().hex
+        path = os.path.join(self.directory, f"{snapshot_id}.ndjson")
+        offsets, dates = await asyncio.to_thread(_write_snapshot, path, orders)
+
+        snapshot = OrderSnapshot(snapshot_id, account_id, params, path, offsets, dates, self.ttl)
+        self._snapshots[snapshot.id] = snapshot
+        self.created += 1
+
+        self._evict_expired()
+        while len(self._snapshots) > self.max_count:
+            _, oldest = self._snapshots.popitem(last=False)
+            self._unlink(oldest)
+            self.expired += 1
+
+        baemin_logger.info(
+            "[SNAPSHOT] created snapshot_id=%s account_id=%s orders=%d bytes=%d",
+            snapshot.id, account_id, snapshot.total, snapshot.size_bytes,
+        )
+        return snapshot
+
+    def get(self, snapshot_id: str) -> Optional[OrderSnapshot]:
+        self._evict_expired()
+        return self._snapshots.get(snapshot_id)
+
+    def delete(self, snapshot_id: str) -> bool:
+        snapshot = self._snapshots.pop(snapshot_id, None)
+        if snapshot is None:
+            return False
+        self._unlink(snapshot)
+        return True
+
+    async def read_page(self, snapshot: OrderSnapshot, position: int, limit: int) -> Tuple[bytes, int]:
+        """
+        position 부터 limit 건을 JSON 배열 bytes 로 반환 (파싱 / 재직렬화 없음)
+        반환: (배열 bytes, 다음 위치)
+        """
+        end = min(position + limit, snapshot.total)
+        if position >= end:
+            return b"[]", end
+
+        raw = await asyncio.to_thread(
+            _read_range, snapshot.path, snapshot.offsets[position], snapshot.offsets[end]
+        )
+        self.pages_served += 1
+        # 한 줄 = 주문 하나 (JSON 안의 줄바꿈은 이스케이프되므로 \n 은 구분자뿐)
+        return b"[" + raw[:-1].replace(b"\n", b",") + b"]", end
+
+    def _evict_expired(self):
+        now = time.time()
+        for snapshot_id, snapshot in list(self._snapshots.items()):
+            if now >= snapshot.expires_at:
+                del self._snapshots[snapshot_id]
+                self._unlink(snapshot)
+                self.expired += 1
+
+    @staticmethod
+    def _unlink(snapshot: OrderSnapshot):
+        try:
+            os.unlink(snapshot.path)
+        except FileNotFoundError:
+            pass
+
+    def stats(self) -> dict:
+        return {
+            "snapshots": len(self._snapshots),
+            "orders": sum(s.total for s in self._snapshots.values()),
+            "bytes": sum(s.size_bytes for s in self._snapshots.values()),
+            "created": self.created,
+            "expired": self.expired,
+            "pages_served": self.pages_served,
+        }
+
+
+order_snapshot_store = OrderSnapshotStore()
@@ -0,0 +1,94 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+from app.core import config
+
+
+class _Entry:
+    __slots__ = ("total", "created_at", "pages")
+
+    def __init__(self, total: int):
+        self.total = total
+        self.created_at = time.monotonic()
+        self.pages: Dict[int, list] = {}
+
+
+class PageCheckpoint:
+    """
+    주문 조회 구간별로 이미 받은 페이지(offset → contents)를 잠깐 보관
+
+    - 조회 도중 한 페이지가 실패해도 성공한 페이지는 남아 있으므로,
+      같은 요청을 다시 보내면 빠진 페이지만 upstream 에 요청
+    - key = (shopOwnerNumber, shopNo, status, 구간 시작, 구간 끝)
+    - 첫 페이지의 totalSize 가 저장 당시와 다르면 (주문이 새로 들어옴) 버리고 새로 시작
+    - fetch_orders 호출 전체(모든 구간)가 성공하면 discard() 로 정리
+      (실패한 호출의 나머지 구간은 재시도 때 쓰이도록 TTL 까지 남김)
+    - 항목은 만든 순서(= created_at 순)로 유지 → 만료 / 용량 정리는 앞에서부터만 보면 됨
+    """
+
+    def __init__(
+        self,
+        ttl: float = config.PAGE_CHECKPOINT_TTL_SECONDS,
+        max_pages: int = config.PAGE_CHECKPOINT_MAX_PAGES,
+    ):
+        self.ttl = ttl
+        self.max_pages = max_pages
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._page_count = 0
+
+        self.resumed_pages = 0
+
+    def begin(self, key: Hashable, total: int) -> Dict[int, list]:
+        """구간 조회 시작. 재사용 가능한 완료 페이지 dict 를 돌려줌 (없으면 빈 dict)"""
+        entry = self._entries.get(key)
+        if entry is not None and (
+            entry.total != total or time.monotonic() - entry.created_at > self.ttl
+        ):
+            self.discard(key)
+            entry = None
+
+        if entry is None:
+            entry = self._entries[key] = _Entry(total)
+        else:
+            self.resumed_pages += len(entry.pages)
+
+        return dict(entry.pages)
+
+    def put(self, key: Hashable, offset: int, rows: list):
+        entry = self._entries.get(key)
+        if entry is None or offset in entry.pages:
+            return
+        entry.pages[offset] = rows
+        self._page_count += 1
+        self._evict()
+
+    def get(self, key: Hashable, offset: int) -> Optional[list]:
+        entry = self._entries.get(key)
+        return None if entry is None else entry.pages.get(offset)
+
+    def discard(self, key: Hashable):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._page_count -= len(entry.pages)
+
+    def _evict(self):
+        # 가장 오래된 항목부터 만료된 것만 정리 (만료되지 않은 항목을 만나면 멈춤)
+        now = time.monotonic()
+        while self._entries:
+            oldest_key, oldest = next(iter(self._entries.items()))
+            if now - oldest.created_at <= self.ttl:
+                break
+            self.discard(oldest_key)
+        while self._page_count > self.max_pages and self._entries:
+            self.discard(next(iter(self._entries)))
+
+    def stats(self) -> dict:
+        return {
+            "shards": len(self._entries),
+            "pages": self._page_count,
+            "resumed_pages": self.resumed_pages,
+        }
+
+
+page_checkpoint = PageCheckpoint()
@@ -1,54 +1,155 @@
 import asyncio
 import random
-from functools import wraps
+import time
+from contextlib import asynccontextmanager
+from typing import Dict
+from urllib.parse import urlsplit
 
+from app.core import config, metrics
+from app.core.logger import baemin_logger
+from app.core.tracing import span
 
-# 전역 세마포어 (동시 실행 개수 제어)
-GLOBAL_RATE_SEMAPHORE = asyncio.Semaphore(3)
+# 이 상태 코드는 "너무 빠르다" 신호로 보고 감속
+BACKOFF_STATUSES = {403, 429, 503}
 
 
-async def random_delay(min_ms: int = 200, max_ms: int = 800):
+class HostRateController:
     """
-    랜덤 딜레이 (반차단용)
+    호스트 하나의 AIMD 속도 제어기
+
+    - 요청 간격을 1 / rate 초(± jitter)로 맞춰 내보냄 (반차단용 랜덤 딜레이 역할 포함)
+    - 동시에 나가 있는 요청은 max_concurrency 개까지
+    - 정상 응답(2xx / 3xx)이면 rate 를 increase 만큼 천천히 올리고,
+      429 / 403 / 503 / 차단 페이지면 rate 에 decrease_factor 를 곱해 빠르게 내림
+    - 그 밖의 4xx(401 세션 만료, 400 / 404 등)와 5xx 는 속도 신호로 보지 않음 (유지)
     """
-    delay = random.uniform(min_ms / 1000.0, max_ms / 1000.0)
-    await asyncio.sleep(delay)
 
+    def __init__(
+        self,
+        host: str,
+        initial_rate: float = config.RATE_INITIAL_RPS,
+        min_rate: float = config.RATE_MIN_RPS,
+        max_rate: float = config.RATE_MAX_RPS,
+        increase: float = config.RATE_INCREASE_RPS,
+        decrease_factor: float = config.RATE_DECREASE_FACTOR,
+        decrease_cooldown: float = config.RATE_DECREASE_COOLDOWN_SECONDS,
+        max_concurrency: int = config.RATE_MAX_CONCURRENCY,
+        jitter: float = config.RATE_JITTER,
+    ):
+        self.host = host
+        self.rate = min(max(initial_rate, min_rate), max_rate)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+        self.max_concurrency = max_concurrency
+        self.jitter = jitter
+
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._next_slot = 0.0
+        self._last_decrease = 0.0
+        self.in_flight = 0
+
+        self.backoffs = 0
+
+    async def acquire(self):
+        with span("throttle"):
+            await self._sem.acquire()
+            try:
+                now = time.monotonic()
+                interval = random.uniform(1 - self.jitter, 1 + self.jitter) / self.rate
+                slot = max(now, self._next_slot)
+                self._next_slot = slot + interval
+                if slot > now:
+                    await asyncio.sleep(slot - now)
+            except BaseException:
+                self._sem.release()
+                raise
+        self.in_flight += 1
+
+    def release(self):
+        self.in_flight -= 1
+        self._sem.release()
+
+    @asynccontextmanager
+    async def slot(self):
+        started = time.perf_counter()
+        await self.acquire()
+        metrics.THROTTLE_WAIT.observe(time.perf_counter() - started, self.host)
+        try:
+            yield self
+        finally:
+            self.release()
+
+    def feedback(self, status_code: int, blocked: bool = False):
+        """응답 결과를 반영해 rate 조정"""
+        if blocked or status_code in BACKOFF_STATUSES:
+            self._decrease(status_code, blocked)
+        elif 200 <= status_code < 400:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def _decrease(self, status_code: int, blocked: bool):
+        now = time.monotonic()
+        if now - self._last_decrease < self.decrease_cooldown:
+            return
 
-def rate_limited(
-    _func=None,
-    *,
-    semaphore: asyncio.Semaphore | None = None,
-    min_ms: int = 200,
-    max_ms: int = 800,
-):
+        self._last_decrease = now
+        self.backoffs += 1
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        # 이미 예약된 다음 요청도 새 속도 기준으로 밀어냄
+        self._next_slot = max(self._next_slot, now + 1 / self.rate)
+
+        baemin_logger.warning(
+            "[RATE] backoff host=%s status=%s blocked=%s rate=%.2f/s",
+            self.host, status_code, blocked, self.rate,
+        )
+
+    def snapshot(self) -> dict:
+        return {
+            "rate": round(self.rate, 3),
+            "in_flight": self.in_flight,
+            "backoffs": self.backoffs,
+        }
+
+
+class RateController:
     """
-    사용 예시
-    --------
-    1) 기본 사용
-        @rate_limited
-        async def fetch_page(...):
-            ...
-
-    2) 옵션 사용
-        @rate_limited(semaphore=my_sem, min_ms=100, max_ms=500)
-        async def fetch_page(...):
-            ...
+    upstream 호스트별 HostRateController 모음 (프로세스 공용)
+
+    configure() 로 시작 시점에 기본값이나 특정 호스트 설정을 바꿀 수 있음
     """
 
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            sem = semaphore or GLOBAL_RATE_SEMAPHORE
-            async with sem:
-                await random_delay(min_ms=min_ms, max_ms=max_ms)
-                return await func(*args, **kwargs)
+    def __init__(self):
+        self._defaults: dict = {}
+        self._host_overrides: Dict[str, dict] = {}
+        self._hosts: Dict[str, HostRateController] = {}
+
+    def configure(self, host: str | None = None, **params):
+        """
+        rate_controller.configure(initial_rate=5, max_rate=20)            # 전체 기본값
+        rate_controller.configure("self-api.baemin.com", max_concurrency=6)  # 특정 호스트
+        이미 만들어진 호스트 제어기는 새 설정으로 다시 만듦
+        """
+        if host is None:
+            self._defaults.update(params)
+            self._hosts.clear()
+        else:
+            self._host_overrides.setdefault(host, {}).update(params)
+            self._hosts.pop(host, None)
+
+    def for_host(self, host: str) -> HostRateController:
+        controller = self._hosts.get(host)
+        if controller is None:
+            params = {**self._defaults, **self._host_overrides.get(host, {})}
+            controller = self._hosts[host] = HostRateController(host, **params)
+        return controller
+
+    def for_url(self, url: str) -> HostRateController:
+        return self.for_host(urlsplit(url).netloc)
 
-        return wrapper
+    def snapshot(self) -> Dict[str, dict]:
+        return {host: c.snapshot() for host, c in self._hosts.items()}
 
-    # @rate_limited 처럼 인자 없이 쓴 경우
-    if _func is not None and callable(_func):
-        return decorator(_func)
 
-    # @rate_limited(...) 처럼 옵션을 준 경우
-    return decorator
+rate_controller = RateController()
@@ -0,0 +1,76 @@
+import asyncio
+import random
+from typing import Awaitable, Callable, TypeVar
+
+from app.core import config, metrics
+from app.core.logger import baemin_logger
+
+T = TypeVar("T")
+
+# 다시 시도해볼 만한 HTTP 상태 (세션 내부 예외도 500 으로 들어옴)
+RETRYABLE_CODES = {429, 500, 502, 503, 504}
+
+
+class RetryBudget:
+    """
+    한 작업(fetch_orders 호출) 안에서 쓸 수 있는 재시도 횟수 제한
+    허용 재시도 수 = max(min_retries, 시도한 요청 수 × ratio)
+    → 장애 상황에서 재시도가 upstream 부하를 몇 배로 키우지 않게 함
+    """
+
+    def __init__(
+        self,
+        ratio: float = config.PAGE_RETRY_BUDGET_RATIO,
+        min_retries: int = config.PAGE_RETRY_BUDGET_MIN,
+    ):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.requests = 0
+        self.retries = 0
+
+    def record_request(self):
+        self.requests += 1
+
+    def try_spend(self) -> bool:
+        if self.retries >= max(self.min_retries, self.requests * self.ratio):
+            return False
+        self.retries += 1
+        return True
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = config.PAGE_RETRY_BASE_DELAY_SECONDS,
+    cap: float = config.PAGE_RETRY_MAX_DELAY_SECONDS,
+) -> float:
+    """full jitter 지수 백오프: 0 ~ min(cap, base × 2^attempt)"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+async def retry_async(
+    fn: Callable[[], Awaitable[T]],
+    is_retryable: Callable[[Exception], bool],
+    budget: RetryBudget | None = None,
+    max_attempts: int = config.PAGE_RETRY_MAX_ATTEMPTS,
+    label: str = "",
+) -> T:
+    attempt = 0
+    while True:
+        if budget is not None:
+            budget.record_request()
+        try:
+            return await fn()
+        except Exception as e:
+            attempt += 1
+            if not is_retryable(e) or attempt >= max_attempts:
+                raise
+            if budget is not None and not budget.try_spend():
+                metrics.PAGE_RETRIES.inc("budget_exhausted")
+                raise
+
+            delay = backoff_delay(attempt - 1)
+            metrics.PAGE_RETRIES.inc("retried")
+            baemin_logger.warning(
+                "[RETRY] %s attempt=%d delay=%.2fs error=%s", label, attempt, delay, e
+            )
+            await asyncio.sleep(delay)
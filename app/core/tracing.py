@@ -0,0 +1,100 @@
+"""
+요청 단위 구간(stage) 시간 측정
+
+- start_trace() 로 현재 요청 컨텍스트에 RequestTrace 를 붙이면
+  span("page", ...) 같은 구간이 끝날 때마다 합계가 쌓임 (gather 로 만든 하위 task 에도 전파)
+- 요청 밖(백그라운드 작업 등)에서는 span 이 아무 일도 하지 않음
+- detail=True 일 때만 구간별 이벤트(매장/페이지 단위)를 따로 보관
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+_current_trace: ContextVar[Optional["RequestTrace"]] = ContextVar("baemin_trace", default=None)
+
+
+class RequestTrace:
+    def __init__(self, detail: bool = False):
+        self.detail = detail
+        self.started = time.perf_counter()
+        self.stages: Dict[str, List[float]] = {}  # name → [합계(초), 횟수]
+        self.events: List[dict] = []
+
+    def add(self, name: str, duration: float, attrs: dict):
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = [0.0, 0]
+        stage[0] += duration
+        stage[1] += 1
+
+        if self.detail:
+            self.events.append({"stage": name, "ms": round(duration * 1000, 2), **attrs})
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        """
+        Server-Timing 헤더 값. 병렬로 돈 구간은 합계라서 total 보다 클 수 있음
+        예) login;dur=812.3, page;dur=5321.0;desc="n=24", total;dur=2210.4
+        """
+        parts = []
+        for name, (total, count) in self.stages.items():
+            part = f"{name};dur={total * 1000:.1f}"
+            if count > 1:
+                part += f';desc="n={count}"'
+            parts.append(part)
+        parts.append(f"total;dur={self.elapsed() * 1000:.1f}")
+        return ", ".join(parts)
+
+    def breakdown(self) -> dict:
+        """debug 응답용: 구간 합계 + 매장별 합계 + 페이지별 목록"""
+        shops: Dict[str, Dict[str, float]] = {}
+        pages = []
+        for event in self.events:
+            shop = event.get("shop")
+            if shop is not None:
+                per_shop = shops.setdefault(str(shop), {})
+                per_shop[event["stage"]] = round(per_shop.get(event["stage"], 0) + event["ms"], 2)
+            if event["stage"] == "page":
+                pages.append(event)
+
+        return {
+            "total_ms": round(self.elapsed() * 1000, 2),
+            "stages": {
+                name: {"ms": round(total * 1000, 2), "count": count}
+                for name, (total, count) in self.stages.items()
+            },
+            "shops": shops,
+            "pages": pages,
+        }
+
+
+def start_trace(detail: bool = False) -> RequestTrace:
+    trace = RequestTrace(detail=detail)
+    _current_trace.set(trace)
+    return trace
+
+
+def current_trace() -> Optional[RequestTrace]:
+    return _current_trace.get()
+
+
+def detach_trace():
+    """백그라운드 task 시작 시 호출 → 요청이 끝난 뒤의 작업이 요청 trace 에 섞이지 않게 함"""
+    _current_trace.set(None)
+
+
+@contextmanager
+def span(name: str, **attrs):
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(name, time.perf_counter() - started, attrs)
@@ -1,8 +1,10 @@
+import hashlib
 import time
-import traceback
+from app.core import config
 from app.core.logger import baemin_logger
-from app.core.session import AsyncCurlClient
-from app.core.cookie_store import save_cookie
+from app.core.session import AsyncCurlClient, BlockPage, http_version_for
+from app.core.cookie_store import cookie_cache
+from app.core.singleflight import SingleFlight
 from app.core.errors import (
     LoginError,
     StructureChangedError,
@@ -15,8 +17,11 @@ from app.crawler.utils import RSAEncryptor, generate_dummy_password
 # -----------------------------
 #   CONSTANTS
 # -----------------------------
-LOGIN_INIT_URL = "https://biz-member.baemin.com/v1/login/init"
-LOGIN_URL = "https://biz-member.baemin.com/v1/login"
+LOGIN_INIT_URL = f"{config.BAEMIN_MEMBER_BASE_URL}/v1/login/init"
+LOGIN_URL = f"{config.BAEMIN_MEMBER_BASE_URL}/v1/login"
+
+# 로그인 세션 쿠키 (없으면 로그인 실패로 봄)
+SESSION_COOKIE = "_ceo_v2_gk_sid"
 
 INIT_HEADERS = {
     "Accept": "application/json, text/plain, */*",
@@ -32,6 +37,9 @@ LOGIN_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:144.0) Gecko/20100101 Firefox/144.0",
 }
 
+# 계정별 동시 로그인 합치기 (login_flight.stats() 로 합쳐진 횟수 확인)
+login_flight = SingleFlight()
+
 
 # -----------------------------
 #   STEP 1: TAG FETCH (RSA 초기화)
@@ -47,7 +55,10 @@ async def fetch_tag(session: AsyncCurlClient) -> str:
         body_type="JSON",
     )
 
-    baemin_logger.info(f"[INIT] status={status}, res={res}")
+    baemin_logger.info("[INIT] status=%s", status)
+
+    if isinstance(res, BlockPage):
+        raise BaeminError("[보안 위배] 로그인 초기화 차단됨", code=403)
 
     if status != 200:
         raise StructureChangedError("init API 실패: HTTP 200 아님")
@@ -84,8 +95,7 @@ async def login_and_get_cookie(id: str, pw: str, session: AsyncCurlClient) -> di
         # --------------------------
         # 2) RSA 암호화 준비
         # --------------------------
-        n = int(tag, 16)
-        rsa = RSAEncryptor(n)
+        rsa = RSAEncryptor(int(tag, 16))
 
         enc_id = rsa.encrypt(id)
         enc_pw = rsa.encrypt(pw)
@@ -116,7 +126,10 @@ async def login_and_get_cookie(id: str, pw: str, session: AsyncCurlClient) -> di
             return_response=True,
         )
 
-        baemin_logger.info(f"[LOGIN] status={status}, res={res}")
+        baemin_logger.info("[LOGIN] status=%s result=%s", status, res.get("status") if isinstance(res, dict) else None)
+
+        if isinstance(res, BlockPage):
+            raise BaeminError("[보안 위배] 로그인 요청 차단됨", code=403)
 
         if status != 200 or res.get("status") != "SUCCESS":
             raise LoginError("아이디 또는 패스워드 오류")
@@ -128,34 +141,48 @@ async def login_and_get_cookie(id: str, pw: str, session: AsyncCurlClient) -> di
 
         cookies = {c.name: c.value for c in raw_cookie_jar}
 
-        if "_ceo_v2_gk_sid" not in cookies:
+        if SESSION_COOKIE not in cookies:
             raise StructureChangedError("로그인 성공했지만 필수 쿠키 없음 → 구조 변경 가능성 있음")
 
         # --------------------------
         # 5) 파일 저장소에 저장
         # --------------------------
-        save_cookie(id, cookies)
-        baemin_logger.info(f"[COOKIE SAVED] account_id={id}")
+        await cookie_cache.put(id, cookies)
+        baemin_logger.info("[COOKIE SAVED] account_id=%s", id)
 
         return cookies
 
     except Exception as e:
-        baemin_logger.error("[LOGIN ERROR]")
-        baemin_logger.error(traceback.format_exc())
+        baemin_logger.error("[LOGIN ERROR]", exc_info=True)
         raise BaeminError(str(e))
 
-async def login(id: str, pw: str) -> dict:
+async def login_single_flight(id: str, pw: str, session: AsyncCurlClient) -> dict:
+    """
+    같은 계정으로 동시에 들어온 로그인 요청을 한 번의 login_and_get_cookie 로 합침.
+    진행 중인 로그인이 있으면 새로 로그인하지 않고 그 결과(쿠키 또는 에러)를 같이 받음.
+
+    key 에 비밀번호 해시를 포함 → 다른 비밀번호로 들어온 요청이 남의 로그인 결과를 받지 않음
+    """
+    key = (id, hashlib.sha256(pw.encode("utf-8")).hexdigest())
+    return await login_flight.do(key, lambda: login_and_get_cookie(id, pw, session))
+
+
+async def login(id: str, pw: str, session=None) -> dict:
     """
     기존 FastAPI 라우터에서 쓰는 엔트리 포인트.
 
-    - 내부에서 AsyncCurlClient 세션을 만들고
+    - session(공용 ClientPool 등)이 주어지면 그대로 사용하고
+    - 없으면 내부에서 AsyncCurlClient 세션을 만들어
     - login_and_get_cookie를 호출한 뒤
     - 세션을 정리(cleanup)합니다.
     """
+    if session is not None:
+        return await login_single_flight(id, pw, session)
+
     session = AsyncCurlClient(
         timeout=30,
         impersonate="chrome",
-        http_version="v1",
+        http_version=http_version_for(LOGIN_URL),
     )
     await session.start()
 
@@ -163,4 +190,4 @@ async def login(id: str, pw: str) -> dict:
         cookies = await login_and_get_cookie(id, pw, session)
         return cookies
     finally:
-        await session.close()
\ No newline at end of file
+        await session.close()
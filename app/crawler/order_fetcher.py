@@ -1,29 +1,58 @@
 import asyncio
-from app.core.rate import rate_limited, random_delay
+from datetime import date, timedelta
+from typing import List, NamedTuple, Optional, Tuple
+
+from app.core import config, metrics
+from app.core.concurrency import bounded_gather
 from app.core.errors import BaeminError
+from app.core.page_checkpoint import page_checkpoint
+from app.core.retry import RETRYABLE_CODES, RetryBudget, retry_async
+from app.core.session import BlockPage
+from app.core.tracing import span
+from app.crawler.session_refresh import with_relogin
+from app.crawler.utils import order_day, parse_day
 
-ORDER_URL = "https://self-api.baemin.com/v4/orders"
+ORDER_URL = f"{config.BAEMIN_SELF_API_BASE_URL}/v4/orders"
+PAGE_LIMIT = 100
 
 
-def is_block_page(raw: str) -> bool:
-    """
-    배민 보안 위배 페이지 HTML 탐지
-    """
-    if "<title>보안 위배" in raw:
-        return True
-    if "올바르지 않은 요청으로 페이지를 보실 수 없습니다" in raw:
-        return True
-    if "<!DOCTYPE html>" in raw and "보안" in raw:
-        return True
-    return False
+class FetchProgress:
+    """fetch_orders 한 번의 페이지 진행 상황"""
 
+    __slots__ = ("pages_done", "pages_total")
 
-async def fetch_orders(session, cookies, shop_owner_no, shop_no, start, end, status):
-    """
-    한 매장의 주문 전체 조회 (페이지네이션 자동 처리)
+    def __init__(self):
+        self.pages_done = 0
+        self.pages_total = 0
+
+
+class Shard(NamedTuple):
+    """조회 구간. 날짜 포맷을 알 수 없으면 start_day/end_day/fmt 는 None"""
+    start: str
+    end: str
+    start_day: Optional[date] = None
+    end_day: Optional[date] = None
+    fmt: Optional[str] = None
+
+
+async def fetch_orders(
+    session, cookies, shop_owner_no, shop_no, start, end, status, on_page=None,
+    progress: Optional[FetchProgress] = None,
+):
     """
-    limit = 100
+    한 매장의 주문 전체 조회 (페이지네이션 + 기간 분할 자동 처리)
 
+    - 긴 기간은 ORDERS_SHARD_DAYS 단위 구간으로 나눠 병렬 조회 후 기간 순서대로 머지
+    - 구간 경계에 걸쳐 중복으로 내려온 주문은 orderNumber 로 제거
+    - 일시적 오류는 페이지 단위로 지수 백오프 재시도 (호출당 재시도 예산 내에서)
+    - 성공한 페이지는 체크포인트에 남겨 두었다가, 실패 후 같은 조회가 다시 오면 빠진 페이지만 요청
+
+    on_page 가 주어지면 페이지가 도착하는 즉시 await on_page(rows) 로 넘기고
+    결과를 모으지 않음 (스트리밍용). on_page 가 막히면 다음 페이지 조회도 멈춤.
+
+    progress 를 넘기면 페이지 진행 상황(완료 / totalSize 기준 전체)을 거기에 누적
+    (여러 조회가 같은 객체를 공유해도 됨 – 작업 진행률 표시용)
+    """
     headers = {
         "accept": "application/json, text/plain, */*",
         "origin": "https://self.baemin.com",
@@ -31,91 +60,242 @@ async def fetch_orders(session, cookies, shop_owner_no, shop_no, start, end, sta
         "User-Agent": session.random_ua(),
     }
 
+    shards = split_range(start, end, config.ORDERS_SHARD_DAYS)
+    # 체크포인트는 구간 하나가 아니라 호출 전체가 성공했을 때 한꺼번에 정리
+    # (한 구간이 실패해서 다시 조회하면, 이미 끝난 구간도 페이지를 다시 받지 않게)
+    ckpt_keys = []
+    seen = set()
+    progress = progress if progress is not None else FetchProgress()
+    pages_before = progress.pages_done
+    budget = RetryBudget()
+
+    def dedupe(rows):
+        unique = []
+        for item in rows:
+            order_no = (item.get("order") or {}).get("orderNumber")
+            if order_no:
+                if order_no in seen:
+                    continue
+                seen.add(order_no)
+            unique.append(item)
+        return unique
+
+    def shard_task(shard, emit=None):
+        return _fetch_shard(
+            session, headers, cookies, shop_owner_no, shop_no, shard, status,
+            progress, budget, emit, ckpt_keys,
+        )
+
+    if on_page is not None:
+        async def emit(rows):
+            rows = dedupe(rows)
+            if rows:
+                await on_page(rows)
+
+        await bounded_gather(
+            (shard_task(shard, emit) for shard in shards),
+            config.ORDERS_SHARD_CONCURRENCY,
+        )
+        metrics.PAGES_PER_FETCH.observe(progress.pages_done - pages_before)
+        return []
+
+    results = await bounded_gather(
+        (shard_task(shard) for shard in shards),
+        config.ORDERS_SHARD_CONCURRENCY,
+    )
+
     # --------------------------
-    # 1) 첫 페이지 조회 → totalSize 조회
+    # 구간 결과 머지 (구간 순서 유지 + orderNumber 중복 제거)
     # --------------------------
-    first_payload = {
-        "offset": 0,
-        "limit": limit,
-        "purchaseType": "",
-        "startDate": start,
-        "endDate": end,
-        "shopOwnerNumber": shop_owner_no,
-        "shopNumbers": shop_no,
-        "orderStatus": status,
-    }
+    merged = []
+    for rows in results:
+        merged.extend(dedupe(rows))
+
+    for key in ckpt_keys:
+        page_checkpoint.discard(key)
+
+    metrics.PAGES_PER_FETCH.observe(progress.pages_done - pages_before)
+    return merged
+
+
+def split_range(start, end, shard_days: int) -> List[Shard]:
+    """
+    start~end 를 shard_days 일 단위 구간으로 분할.
+    날짜 포맷을 알 수 없거나 분할이 필요 없으면 원래 구간 하나만 반환
+    """
+    start_day, fmt = parse_day(start)
+    end_day, end_fmt = parse_day(end)
+
+    if start_day is None or end_day is None or fmt != end_fmt or start_day > end_day:
+        return [Shard(start, end)]
+
+    if shard_days <= 0 or (end_day - start_day).days < shard_days:
+        return [Shard(start, end, start_day, end_day, fmt)]
 
-    res, sc = await session.get(
-        ORDER_URL,
-        headers=headers,
-        params=first_payload,
-        cookies=cookies
+    shards = []
+    cur = start_day
+    while cur <= end_day:
+        last = min(cur + timedelta(days=shard_days - 1), end_day)
+        shards.append(Shard(cur.strftime(fmt), last.strftime(fmt), cur, last, fmt))
+        cur = last + timedelta(days=1)
+    return shards
+
+
+def _halve(shard: Shard) -> Tuple[Shard, Shard]:
+    mid = shard.start_day + timedelta(days=(shard.end_day - shard.start_day).days // 2)
+    nxt = mid + timedelta(days=1)
+    fmt = shard.fmt
+    return (
+        Shard(shard.start, mid.strftime(fmt), shard.start_day, mid, fmt),
+        Shard(nxt.strftime(fmt), shard.end, nxt, shard.end_day, fmt),
     )
 
-    # 🔥 보안위배 감지
-    if sc == 403 and is_block_page(str(res)):
-        raise BaeminError(403, "[보안 위배] 배민이 접근을 차단했습니다.")
 
-    if sc != 200:
-        raise BaeminError(500, f"[주문 조회 실패] HTTP {sc}")
+async def _fetch_shard(
+    session, headers, cookies, shop_owner_no, shop_no, shard, status,
+    progress: FetchProgress, budget: RetryBudget, on_page=None, ckpt_keys=None,
+    head_rows=None,
+):
+    """
+    한 구간 조회. 첫 페이지의 totalSize 가 ORDERS_SHARD_MAX_ROWS 를 넘으면
+    구간을 반으로 나눠 다시 조회 (깊은 offset 페이지 회피)
+
+    ckpt_keys 에는 쓴 체크포인트 키를 모음 (정리는 fetch_orders 가 전체 성공 후에)
+    head_rows 는 상위 구간 첫 페이지에서 얻은 이 구간의 offset 0 페이지
+    → 있으면 offset 0 대신 두 번째 페이지로 totalSize 를 얻음 (나눌 때마다 요청 하나 절약)
+    """
+    limit = PAGE_LIMIT
+
+    # --------------------------
+    # 1) 첫 요청 → totalSize 조회
+    # --------------------------
+    probe_offset = 0 if head_rows is None else limit
+    res = await _request_page_retrying(
+        session, headers, cookies, shop_owner_no, shop_no,
+        shard.start, shard.end, status, probe_offset, budget,
+    )
+    # 첫 요청은 비었거나 구간을 나누더라도 요청한 페이지이므로 완료 / 전체 양쪽에 셈
+    progress.pages_done += 1
+    progress.pages_total += 1
 
     total = res.get("totalSize", 0)
     if total <= 0:
         return []
 
+    probe_rows = res.get("contents", []) or []
+    first_rows = probe_rows if head_rows is None else head_rows
+
+    if (
+        total > config.ORDERS_SHARD_MAX_ROWS
+        and shard.start_day is not None
+        and shard.start_day < shard.end_day
+    ):
+        halves = _halve(shard)
+        heads = _split_head(first_rows, halves, limit)
+        results = await bounded_gather(
+            (
+                _fetch_shard(
+                    session, headers, cookies, shop_owner_no, shop_no, half, status,
+                    progress, budget, on_page, ckpt_keys, head,
+                )
+                for half, head in zip(halves, heads)
+            ),
+            len(halves),
+        )
+        return results[0] + results[1]
+
     total_pages = (total + limit - 1) // limit
+    known = {0: first_rows}
+    if head_rows is not None:
+        known[limit] = probe_rows
+    offsets = [page * limit for page in range(1, total_pages) if page * limit not in known]
+    progress.pages_total += len(offsets)
 
     # --------------------------
-    # 2) 전체 페이지 async 조회
+    # 2) 나머지 페이지 async 조회 (이미 받은 페이지는 재사용)
     # --------------------------
-    tasks = []
-    for page in range(total_pages):
-        offset = page * limit
-        tasks.append(
-            fetch_page(
+    # 스트리밍은 메모리를 페이지 단위로 유지해야 하므로 체크포인트 사용 안 함
+    ckpt_key = (shop_owner_no, shop_no, status, shard.start, shard.end)
+    done_pages = page_checkpoint.begin(ckpt_key, total) if on_page is None else {}
+    if on_page is None and ckpt_keys is not None:
+        ckpt_keys.append(ckpt_key)
+
+    async def run_page(offset):
+        rows = done_pages.get(offset)
+        if rows is None:
+            rows = await fetch_page(
                 session,
                 headers,
                 cookies,
                 shop_owner_no,
                 shop_no,
-                start,
-                end,
+                shard.start,
+                shard.end,
                 status,
                 offset,
+                budget=budget,
             )
+            if on_page is None:
+                page_checkpoint.put(ckpt_key, offset, rows)
+        progress.pages_done += 1
+        if on_page is not None:
+            await on_page(rows)
+            return None
+        return rows
+
+    if on_page is not None:
+        for offset in sorted(known):
+            if known[offset]:
+                await on_page(known[offset])
+        # 스트리밍: 소비자가 느리면 진행 중인 페이지 수 이상으로 앞서가지 않음
+        await bounded_gather(
+            (run_page(offset) for offset in offsets),
+            config.ORDERS_STREAM_PAGE_CONCURRENCY,
         )
+        return []
 
-    all_results = await asyncio.gather(*tasks)
+    # 실패한 페이지가 있어도 나머지 페이지는 끝까지 받아 체크포인트에 남긴 뒤 에러 전파
+    all_results = await asyncio.gather(
+        *(run_page(offset) for offset in offsets), return_exceptions=True
+    )
+    for r in all_results:
+        if isinstance(r, BaseException):
+            raise r
 
-    # --------------------------
-    # 3) 결과 머지
-    # --------------------------
+    pages = dict(known)
+    pages.update(zip(offsets, all_results))
     merged = []
-    for r in all_results:
-        if r:
-            merged.extend(r)
+    for offset in sorted(pages):
+        if pages[offset]:
+            merged.extend(pages[offset])
 
     return merged
 
 
-@rate_limited
-async def fetch_page(
-    session,
-    headers,
-    cookies,
-    shop_owner_no,
-    shop_no,
-    start,
-    end,
-    status,
-    offset
-):
+def _split_head(
+    rows: list, halves: Tuple[Shard, Shard], limit: int
+) -> Tuple[Optional[list], Optional[list]]:
     """
-    개별 페이지 조회
+    나누기 전 구간의 첫 페이지(rows)가 통째로 한쪽 절반의 날짜에만 속하면
+    그 절반의 offset 0 페이지와 같음 (같은 정렬에서 앞 limit 건이 모두 그 절반 것이므로)
+    → 그 절반 자리에 rows, 나머지는 None. 판단할 수 없으면 둘 다 None
     """
+    if len(rows) != limit:
+        return None, None
+
+    days = {order_day(item.get("order") or {}) for item in rows}
+    for i, half in enumerate(halves):
+        if all(day is not None and half.start_day <= day <= half.end_day for day in days):
+            return (rows, None) if i == 0 else (None, rows)
+    return None, None
+
+
+async def _request_page(
+    session, headers, cookies, shop_owner_no, shop_no, start, end, status, offset
+) -> dict:
     payload = {
         "offset": offset,
-        "limit": 100,
+        "limit": PAGE_LIMIT,
         "purchaseType": "",
         "startDate": start,
         "endDate": end,
@@ -124,18 +304,64 @@ async def fetch_page(
         "orderStatus": status,
     }
 
-    res, sc = await session.get(
-        ORDER_URL,
-        headers=headers,
-        params=payload,
-        cookies=cookies
-    )
+    with span("page", shop=shop_no, status=status, start=start, offset=offset):
+        res, sc = await session.get(
+            ORDER_URL,
+            headers=headers,
+            params=payload,
+            cookies=cookies
+        )
 
-    # 🔥 보안 위배 감지
-    if sc == 403 and is_block_page(str(res)):
-        raise BaeminError(403, "[보안 위배] 배민 보안 페이지 감지됨")
+    # 🔥 보안 위배 감지 (AsyncCurlClient 가 응답 분류 시 BlockPage 로 돌려줌)
+    if isinstance(res, BlockPage):
+        raise BaeminError("[보안 위배] 배민 보안 페이지 감지됨", code=403, status="BLOCKED")
 
     if sc != 200:
-        raise BaeminError(500, f"[페이지 조회 실패] offset={offset}, HTTP {sc}")
+        raise BaeminError(f"[페이지 조회 실패] offset={offset}, HTTP {sc}", code=sc)
+
+    return res
+
 
+def _is_retryable(e: Exception) -> bool:
+    return isinstance(e, BaeminError) and e.code in RETRYABLE_CODES
+
+
+async def _request_page_retrying(
+    session, headers, cookies, shop_owner_no, shop_no, start, end, status, offset,
+    budget: RetryBudget | None = None,
+) -> dict:
+    """일시적 오류는 백오프 재시도, 401 이면 재로그인 후 한 번 더"""
+    return await with_relogin(
+        cookies,
+        session,
+        lambda: retry_async(
+            lambda: _request_page(
+                session, headers, cookies, shop_owner_no, shop_no, start, end, status, offset
+            ),
+            _is_retryable,
+            budget=budget,
+            label=f"shop={shop_no} status={status} start={start} offset={offset}",
+        ),
+    )
+
+
+async def fetch_page(
+    session,
+    headers,
+    cookies,
+    shop_owner_no,
+    shop_no,
+    start,
+    end,
+    status,
+    offset,
+    budget: RetryBudget | None = None,
+):
+    """
+    개별 페이지 조회 (일시적 오류는 재시도, 세션이 끊겼으면 재로그인 후 재시도)
+    """
+    res = await _request_page_retrying(
+        session, headers, cookies, shop_owner_no, shop_no, start, end, status, offset,
+        budget,
+    )
     return res.get("contents", []) or []
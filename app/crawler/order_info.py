@@ -1,12 +1,26 @@
-import traceback
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Set, Tuple
+
+from app.core import config
 from app.core.errors import BaeminError
 from app.core.logger import baemin_logger
-from app.core.session import AsyncCurlClient
+from app.core.session import AsyncCurlClient, BlockPage
+from app.core.singleflight import SingleFlight
+from app.core.tracing import detach_trace, span
+from app.crawler.session_refresh import session_refresher, with_relogin
+
+PROFILE_URL = f"{config.BAEMIN_SELF_API_BASE_URL}/v1/session/profile"
+SHOPS_URL = (
+    f"{config.BAEMIN_SELF_API_BASE_URL}/v4/store/shops/"
+    "temporary-stop-status/by-shop-owner-number"
+)
 
 
 async def fetch_account_number(cookies: dict, session: AsyncCurlClient) -> str:
     """사장님 계정 번호(shopOwnerNumber) 조회"""
-    url = "https://self-api.baemin.com/v1/session/profile"
+    url = PROFILE_URL
     headers = {
         "Accept": "application/json, text/plain, */*",
         "service-channel": "SELF_SERVICE_PC",
@@ -14,12 +28,16 @@ async def fetch_account_number(cookies: dict, session: AsyncCurlClient) -> str:
     }
 
     try:
-        res, status = await session.get(
-            url, headers=headers, cookies=cookies, body_type="JSON"
-        )
+        with span("account"):
+            res, status = await session.get(
+                url, headers=headers, cookies=cookies, body_type="JSON"
+            )
+
+        if isinstance(res, BlockPage):
+            raise BaeminError("[보안 위배] 계정번호 조회 차단됨", code=403)
 
         if status != 200:
-            raise BaeminError("계정번호 조회 실패")
+            raise BaeminError("계정번호 조회 실패", code=status)
 
         account_no = res.get("shopOwnerNumber")
         if not account_no:
@@ -28,7 +46,7 @@ async def fetch_account_number(cookies: dict, session: AsyncCurlClient) -> str:
         return account_no
 
     except Exception:
-        baemin_logger.error(f"[ACCOUNT ERROR] {traceback.format_exc()}")
+        baemin_logger.error("[ACCOUNT ERROR]", exc_info=True)
         raise
 
 
@@ -36,10 +54,7 @@ async def fetch_shop_number(
     cookies: dict, account_number: str, session: AsyncCurlClient
 ) -> list:
     """해당 사장님 계정의 매장 목록 조회"""
-    url = (
-        "https://self-api.baemin.com/v4/store/shops/"
-        "temporary-stop-status/by-shop-owner-number"
-    )
+    url = SHOPS_URL
 
     payload = {
         "shopOwnerNo": account_number,
@@ -55,16 +70,132 @@ async def fetch_shop_number(
     }
 
     try:
-        res, status = await session.get(
-            url, headers=headers, params=payload, cookies=cookies, body_type="JSON"
-        )
+        with span("shops"):
+            res, status = await session.get(
+                url, headers=headers, params=payload, cookies=cookies, body_type="JSON"
+            )
+
+        if isinstance(res, BlockPage):
+            raise BaeminError("[보안 위배] 매장 조회 차단됨", code=403)
 
         if status != 200:
-            raise BaeminError("매장 조회 실패")
+            raise BaeminError("매장 조회 실패", code=status)
 
         shops = res.get("content", [])
         return shops
 
     except Exception:
-        baemin_logger.error(f"[SHOP ERROR] {traceback.format_exc()}")
+        baemin_logger.error("[SHOP ERROR]", exc_info=True)
         raise
+
+
+class AccountMetaCache:
+    """
+    계정별 shopOwnerNumber + 매장 목록 캐시 (stale-while-revalidate)
+
+    - ttl 이내        : 캐시 그대로 사용
+    - ttl ~ max_stale : 캐시로 바로 응답하고 백그라운드에서 갱신
+    - max_stale 초과  : 요청 안에서 다시 조회
+    - 같은 계정 조회는 SingleFlight 로 한 번만 실행
+    - 계정 수는 maxsize 개까지 (LRU), 401 재로그인한 계정은 invalidate 로 바로 버림
+    """
+
+    def __init__(
+        self,
+        ttl: float = config.ACCOUNT_META_TTL_SECONDS,
+        max_stale: float = config.ACCOUNT_META_MAX_STALE_SECONDS,
+        maxsize: int = config.ACCOUNT_META_MAX_ENTRIES,
+    ):
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.maxsize = max(1, maxsize)
+        self._entries: "OrderedDict[str, Tuple[str, list, float]]" = OrderedDict()
+        self._flight = SingleFlight()
+        self._background: Set[asyncio.Task] = set()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.refresh_errors = 0
+
+    async def get(
+        self, account_id: str, cookies: dict, session: AsyncCurlClient
+    ) -> Tuple[str, list]:
+        entry = self._entries.get(account_id)
+        if entry is not None:
+            account_no, shops, fetched_at = entry
+            age = time.monotonic() - fetched_at
+
+            if age <= self.ttl:
+                self._entries.move_to_end(account_id)
+                self.hits += 1
+                return account_no, shops
+
+            if age <= self.max_stale:
+                self._entries.move_to_end(account_id)
+                self.stale_hits += 1
+                self._refresh_in_background(account_id, cookies, session)
+                return account_no, shops
+
+        self.misses += 1
+        return await self._refresh(account_id, cookies, session)
+
+    def invalidate(self, account_id: str):
+        self._entries.pop(account_id, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    async def _refresh(
+        self, account_id: str, cookies: dict, session: AsyncCurlClient
+    ) -> Tuple[str, list]:
+        async def load():
+            # 세션이 끊겼으면(401) 재로그인 후 한 번 더
+            account_no = await with_relogin(
+                cookies, session, lambda: fetch_account_number(cookies, session)
+            )
+            shops = await with_relogin(
+                cookies, session, lambda: fetch_shop_number(cookies, account_no, session)
+            )
+            self._entries[account_id] = (account_no, shops, time.monotonic())
+            self._entries.move_to_end(account_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return account_no, shops
+
+        return await self._flight.do(account_id, load)
+
+    def _refresh_in_background(
+        self, account_id: str, cookies: dict, session: AsyncCurlClient
+    ):
+        if self._flight.in_flight(account_id):
+            return
+
+        async def run():
+            detach_trace()
+            try:
+                await self._refresh(account_id, cookies, session)
+            except Exception as e:
+                self.refresh_errors += 1
+                baemin_logger.error("[META REFRESH ERROR] account_id=%s %s", account_id, e)
+
+        task = asyncio.create_task(run())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "refresh_errors": self.refresh_errors,
+        }
+
+
+account_meta_cache = AccountMetaCache()
+# 401 로 재로그인한 계정은 shopOwnerNumber / 매장 목록도 다시 조회
+session_refresher.on_relogin(account_meta_cache.invalidate)
@@ -1,4 +1,7 @@
+import time
 from datetime import datetime
+from app.core import config, metrics
+from app.core.tracing import span
 from app.models.order import (
     OrderRequest,
     PayInfo,
@@ -76,7 +79,149 @@ def parse_items(items):
 
     return order_items, preview, qty_sum, price_sum
 
+# --------- 빠른 아이템 파싱 (pydantic 모델 생성 없이 dict 직접 생성) ----------
+_EMPTY_OPTION_CATEGORY = {"option_category_id": "", "option_category_name": ""}
+
+
+class _NeedsModel(Exception):
+    """빠른 경로가 모델 검증 결과를 보장할 수 없는 입력 → parse_order_model 로 넘김"""
+
+
+def parse_items_fast(items):
+    """
+    parse_items 와 같은 값을 model_dump() 결과 형태(dict)로 바로 생성
+    모델이 str 로 검증하는 이름 필드가 문자열이 아니면 _NeedsModel
+    """
+    order_items = []
+    preview = ""
+    qty_sum = 0
+    price_sum = 0
+
+    if items:
+        preview = items[0].get("name", "")
+        if len(items) > 1:
+            preview += f" 외 {len(items) - 1}건"
+
+    for item in items or ():
+        qty = to_int(item.get("quantity"))
+        total = to_int(item.get("totalPrice"))
+        unit = total / qty if qty > 0 else 0
+
+        name = item.get("name", "")
+        if not isinstance(name, str):
+            raise _NeedsModel
+
+        options = []
+        for opt in item.get("options", []) or ():
+            option_name = opt.get("name", "")
+            if not isinstance(option_name, str):
+                raise _NeedsModel
+            options.append({
+                "option_id": "",
+                "option_name": option_name,
+                "option_price": to_int(opt.get("price")),
+                "option_qty": qty,
+                "option_category": dict(_EMPTY_OPTION_CATEGORY),
+            })
+
+        order_items.append({
+            "item_id": "",
+            "item_name": name,
+            "item_price": unit,
+            "item_qty": qty,
+            "option": options,
+            "coupon": [],
+        })
+
+        qty_sum += qty
+        price_sum += total
+
+    return order_items, preview, qty_sum, price_sum
+
+
 def parse_order(order, pid):
+    """주문 하나 파싱. ORDER_PARSER_FAST 면 모델 생성 없는 빠른 경로 사용"""
+    if config.ORDER_PARSER_FAST:
+        return parse_order_fast(order, pid)
+    return parse_order_model(order, pid)
+
+
+def parse_page(rows, pid):
+    """주문 조회 한 페이지(contents) 를 한 번에 파싱"""
+    if not rows:
+        return []
+    parse = parse_order_fast if config.ORDER_PARSER_FAST else parse_order_model
+    started = time.perf_counter()
+    with span("parse", shop=pid):
+        parsed = [parse(item["order"], pid) for item in rows]
+    metrics.PARSE_SECONDS_PER_ORDER.observe(
+        (time.perf_counter() - started) / len(parsed), count=len(parsed)
+    )
+    return parsed
+
+
+def parse_order_fast(order, pid):
+    """
+    parse_order_model 과 같은 dict 를 pydantic 모델 생성/검증 없이 생성
+    모델이 str 로 검증하는 필드(주문번호 / 배달유형 / 메뉴·옵션 이름)가 문자열이 아니면
+    parse_order_model 로 넘겨서 같은 결과(또는 같은 ValidationError)를 냄
+    """
+    order_no = order.get("orderNumber", "")
+    order_type = order.get("deliveryType", "")
+    try:
+        if not isinstance(order_no, str) or not isinstance(order_type, str):
+            raise _NeedsModel
+        items, preview, total_qty, items_total_price = parse_items_fast(order.get("items"))
+    except _NeedsModel:
+        metrics.PARSE_FALLBACKS.inc()
+        return parse_order_model(order, pid)
+
+    delivery_tip = to_int(order.get("deliveryTip"))
+    extra_tip = to_int(order.get("extraDeliveryTip"))
+    discount_price = to_int(order.get("discountPrice"))
+    pay_amount = to_int(order.get("payAmount"))
+
+    total_price = items_total_price + delivery_tip + extra_tip - discount_price
+
+    order_time_raw = order.get("orderDateTime")
+    try:
+        ts = int(datetime.fromisoformat(order_time_raw).timestamp())
+    except:
+        ts = 0
+
+    status_code = STATUS_MAP.get((order.get("status", "") or "").upper(), 0)
+    pid_str = str(pid)
+
+    return {
+        "uid": pid_str,
+        "pid": pid_str,
+        "order_date": ts,
+        "pos_order_id": "",
+        "order_delivery_id": order_no,
+        "status": status_code,
+        "pg_status": status_code,
+        "order_path": "direct",
+        "order_type": order_type,
+        "pay_type": "BAEMIN",
+        "total_price": total_price,
+        "pay_price": pay_amount,
+        "delivery_price": delivery_tip,
+        "order_item_qty": total_qty,
+        "order_info": items,
+        "order_item": preview,
+        "pay_info": {
+            "user_id": pid_str,
+            "tran_no": "",
+            "tran_type": "",
+            "total_amount": pay_amount,
+            "result_code": "0000",
+            "approval_num": "",
+            "approval_date": "",
+        },
+    }
+
+
+def parse_order_model(order, pid):
     items, preview, total_qty, items_total_price = parse_items(order.get("items"))
 
     delivery_tip = to_int(order.get("deliveryTip"))
@@ -128,13 +273,15 @@ def parse_order(order, pid):
         pay_info=pay_info,
     ).model_dump()
 
+STATUS_MAP = {
+    "ORDERED": 1,
+    "ACCEPTED": 2,
+    "PICKED_UP": 3,
+    "DELIVERING": 4,
+    "CLOSED": 5,
+    "CANCELLED": 9,
+}
+
+
 def map_status(status_str: str) -> int:
-    mapping = {
-        "ORDERED": 1,
-        "ACCEPTED": 2,
-        "PICKED_UP": 3,
-        "DELIVERING": 4,
-        "CLOSED": 5,
-        "CANCELLED": 9,
-    }
-    return mapping.get(status_str.upper(), 0)   # 모르면 0
+    return STATUS_MAP.get((status_str or "").upper(), 0)   # 모르면(None 포함) 0
@@ -0,0 +1,149 @@
+from datetime import date, datetime, timedelta
+from typing import List, Tuple
+
+from app.core import config
+from app.core.order_day_cache import order_day_cache
+from app.crawler.order_fetcher import fetch_orders
+from app.crawler.order_parser import parse_page
+from app.crawler.utils import KST, order_day, parse_day
+
+
+def is_immutable_day(day: date, status: str) -> bool:
+    """더 이상 바뀌지 않는 (지난 날짜 + 확정 상태) 인지"""
+    if status.upper() not in config.ORDER_DAY_CACHE_STATUSES:
+        return False
+    today = datetime.now(KST).date()
+    return day <= today - timedelta(days=config.ORDER_DAY_CACHE_SETTLE_DAYS)
+
+
+def _uncached_runs(days: List[date], cached: dict) -> List[Tuple[date, date]]:
+    """캐시에 없는 날짜들을 연속 구간 (시작일, 종료일) 목록으로 묶음"""
+    runs = []
+    run_start = None
+    prev = None
+    for day in days:
+        if day in cached:
+            if run_start is not None:
+                runs.append((run_start, prev))
+                run_start = None
+        elif run_start is None:
+            run_start = day
+        prev = day
+    if run_start is not None:
+        runs.append((run_start, prev))
+    return runs
+
+
+async def fetch_parsed_orders(
+    session, cookies, shop_owner_no, shop_no, start, end, status, on_rows=None, progress=None
+) -> list:
+    """
+    한 매장/상태의 start~end 주문을 파싱된 형태로 조회
+
+    - 지난 날짜(확정 상태)는 order_day_cache 에서 꺼내고,
+      캐시에 없는 날짜 구간만 fetch_orders 로 upstream 에 요청
+    - 새로 받아온 지난 날짜 결과는 날짜별로 캐시에 저장
+    - 결과는 날짜 구간 순서대로 이어 붙임 (구간 안에서는 upstream 순서 유지)
+    - on_rows 가 주어지면 (스트리밍) 파싱된 행을 도착하는 대로 넘기고 결과를 모으지 않음.
+      이 경우 캐시를 읽기만 하고 새로 채우지는 않음 (메모리를 페이지 단위로 유지하기 위해)
+    - progress(FetchProgress) 는 fetch_orders 로 그대로 넘김 (캐시에서 꺼낸 날짜는 페이지로 안 셈)
+    """
+    start_day, fmt = parse_day(start)
+    end_day, end_fmt = parse_day(end)
+
+    if (
+        not config.ORDER_DAY_CACHE_ENABLED
+        or start_day is None
+        or end_day is None
+        or fmt != end_fmt
+        or start_day > end_day
+        or not is_immutable_day(start_day, status)
+    ):
+        return await _fetch_range(
+            session, cookies, shop_owner_no, shop_no, start, end, status, on_rows, progress
+        )
+
+    days = [start_day + timedelta(days=i) for i in range((end_day - start_day).days + 1)]
+
+    cached = {}
+    for day in days:
+        if not is_immutable_day(day, status):
+            break
+        rows = await order_day_cache.get(shop_no, status, day)
+        if rows is None:
+            continue
+        cached[day] = rows
+
+    segments = []  # (구간 시작일, 행 목록 또는 None=upstream 구간)
+    for day, rows in cached.items():
+        segments.append((day, day, rows))
+    for run_start, run_end in _uncached_runs(days, cached):
+        segments.append((run_start, run_end, None))
+    segments.sort(key=lambda seg: seg[0])
+
+    merged = []
+    for seg_start, seg_end, rows in segments:
+        if rows is not None:
+            if on_rows is not None:
+                await on_rows(rows)
+            else:
+                merged.extend(rows)
+            continue
+
+        seg_start_s = seg_start.strftime(fmt)
+        seg_end_s = seg_end.strftime(fmt)
+
+        if on_rows is not None:
+            await _fetch_range(
+                session, cookies, shop_owner_no, shop_no,
+                seg_start_s, seg_end_s, status, on_rows, progress,
+            )
+            continue
+
+        raw_rows = await fetch_orders(
+            session, cookies, shop_owner_no, shop_no, seg_start_s, seg_end_s, status,
+            progress=progress,
+        )
+        parsed = parse_page(raw_rows, pid=shop_no)
+        merged.extend(parsed)
+
+        await _store_days(shop_no, status, seg_start, seg_end, raw_rows, parsed)
+
+    return merged
+
+
+async def _fetch_range(
+    session, cookies, shop_owner_no, shop_no, start, end, status, on_rows=None, progress=None
+) -> list:
+    if on_rows is None:
+        rows = await fetch_orders(
+            session, cookies, shop_owner_no, shop_no, start, end, status,
+            progress=progress,
+        )
+        return parse_page(rows, pid=shop_no)
+
+    async def on_page(rows):
+        await on_rows(parse_page(rows, pid=shop_no))
+
+    await fetch_orders(
+        session, cookies, shop_owner_no, shop_no, start, end, status,
+        on_page=on_page, progress=progress,
+    )
+    return []
+
+
+async def _store_days(shop_no, status, seg_start, seg_end, raw_rows, parsed):
+    """upstream 에서 받은 구간 결과를 날짜별로 나눠 확정된 날짜만 캐시에 저장"""
+    by_day = {}
+    for item, row in zip(raw_rows, parsed):
+        day = order_day(item["order"])
+        if day is None or not (seg_start <= day <= seg_end):
+            # 날짜를 확신할 수 없는 주문이 섞이면 이 구간은 캐시하지 않음
+            return
+        by_day.setdefault(day, []).append(row)
+
+    day = seg_start
+    while day <= seg_end:
+        if is_immutable_day(day, status):
+            await order_day_cache.put(shop_no, status, day, by_day.get(day, []))
+        day += timedelta(days=1)
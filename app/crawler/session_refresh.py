@@ -0,0 +1,259 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Set, TypeVar
+
+from app.core import config
+from app.core.cookie_store import cookie_cache
+from app.core.errors import BaeminError
+from app.core.logger import baemin_logger
+from app.core.tracing import detach_trace
+from app.crawler.login import SESSION_COOKIE, login_single_flight
+
+T = TypeVar("T")
+
+
+class _Account:
+    __slots__ = ("account_id", "pw", "cookies", "login_at", "last_used")
+
+    def __init__(self, account_id: str, pw: str, cookies: dict, login_at: float):
+        self.account_id = account_id
+        self.pw = pw
+        self.cookies = cookies
+        self.login_at = login_at
+        self.last_used = time.time()
+
+
+class SessionRefresher:
+    """
+    활성 계정의 로그인 세션을 요청 경로 밖에서 유지
+
+    - track()           : 요청이 쓸 쿠키를 등록 (계정별 비밀번호 / 쿠키 / 로그인 시각 / 마지막 사용 시각)
+    - refresh_cookies() : upstream 이 401 을 주면 재로그인 후 쿠키 dict 를 제자리에서 갱신
+                          → 같은 dict 를 들고 있는 진행 중인 페이지 조회들이 다음 시도부터 새 쿠키 사용
+    - 백그라운드 루프   : 만료 refresh_before 초 전인 활성 계정을 미리 재로그인
+                          (사용자 요청이 만료된 쿠키 때문에 로그인을 기다리지 않게)
+    - on_relogin()      : 401 재로그인 후 호출할 콜백 등록 (account_id 를 넘김 – 계정별 캐시 무효화용)
+
+    비밀번호는 활성 기간(active_window) 동안만 메모리에 둠
+    """
+
+    def __init__(
+        self,
+        ttl: float = cookie_cache.ttl,
+        refresh_before: float = config.SESSION_REFRESH_BEFORE_SECONDS,
+        interval: float = config.SESSION_REFRESH_INTERVAL_SECONDS,
+        active_window: float = config.SESSION_ACTIVE_WINDOW_SECONDS,
+        concurrency: int = config.SESSION_REFRESH_CONCURRENCY,
+    ):
+        self.ttl = ttl
+        self.refresh_before = refresh_before
+        self.interval = interval
+        self.active_window = active_window
+        self.concurrency = max(1, concurrency)
+
+        self._accounts: Dict[str, _Account] = {}
+        self._by_sid: Dict[str, str] = {}  # 세션 쿠키 값 → account_id
+        self._session = None
+        self._loop_task: Optional[asyncio.Task] = None
+        self._background: Set[asyncio.Task] = set()
+        self._relogin_listeners: List[Callable[[str], None]] = []
+
+        self.proactive_refreshes = 0
+        self.recovered_401 = 0
+        self.refresh_errors = 0
+
+    # ========================================================================
+    # LIFECYCLE
+    # ========================================================================
+    async def start(self, session):
+        """session: 재로그인에 쓸 공용 ClientPool"""
+        self._session = session
+        if self._loop_task is None and self.interval > 0:
+            self._loop_task = asyncio.create_task(self._refresh_loop())
+
+    async def close(self):
+        tasks = list(self._background)
+        if self._loop_task is not None:
+            tasks.append(self._loop_task)
+            self._loop_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._session = None
+
+    # ========================================================================
+    # 계정 등록 / 재로그인
+    # ========================================================================
+    def on_relogin(self, listener: Callable[[str], None]):
+        """401 로 재로그인한 뒤 listener(account_id) 호출 (세션이 끊겼다면 계정 정보도 바뀌었을 수 있음)"""
+        self._relogin_listeners.append(listener)
+
+    def track(self, account_id: str, pw: str, cookies: dict, verified: bool = False):
+        """
+        요청에서 쓸 쿠키 등록. 이미 만료가 가까우면 (요청은 지금 쿠키로 진행하고) 백그라운드 갱신
+
+        verified: 이 pw 로 방금 로그인에 성공했는지. 캐시된 쿠키로 처리한 요청의 pw 는
+        검증되지 않았으므로 이미 등록된 계정의 비밀번호를 덮어쓰지 않음
+        (틀린 비밀번호가 재로그인 / 선제 갱신을 망가뜨리지 않게)
+        """
+        account = self._accounts.get(account_id)
+        login_at = cookie_cache.saved_at(account_id) or time.time()
+
+        if account is None:
+            account = self._accounts[account_id] = _Account(account_id, pw, cookies, login_at)
+        else:
+            if verified:
+                account.pw = pw
+            account.last_used = time.time()
+            if account.cookies is not cookies:
+                account.cookies = cookies
+                account.login_at = login_at
+
+        sid = cookies.get(SESSION_COOKIE)
+        if sid:
+            self._by_sid[sid] = account_id
+
+        if self._due(account, time.time()):
+            self._refresh_in_background(account)
+
+    async def refresh_cookies(self, cookies: dict, used_sid: Optional[str], session) -> bool:
+        """
+        used_sid 로 보낸 요청이 401 을 받았을 때 호출. 새 쿠키를 cookies 에 채웠으면 True
+
+        - 그 사이 다른 요청이 이미 재로그인했으면 (cookies 의 sid 가 바뀜) 로그인 없이 True
+        - 등록되지 않은 쿠키면 재로그인할 방법이 없으므로 False
+        """
+        if used_sid is None:
+            return False
+        if cookies.get(SESSION_COOKIE) != used_sid:
+            return True
+
+        account_id = self._by_sid.get(used_sid)
+        account = self._accounts.get(account_id) if account_id else None
+        if account is None:
+            return False
+
+        self.recovered_401 += 1
+        baemin_logger.info("[SESSION] 401 → re-login account_id=%s", account_id)
+        await self._relogin(account, session, replace=cookies)
+        for listener in self._relogin_listeners:
+            listener(account.account_id)
+        return True
+
+    async def _relogin(self, account: _Account, session, replace: Optional[dict] = None):
+        # 기존 쿠키는 저장소에서도 지워서 다른 워커가 끊긴 세션을 다시 쓰지 않게
+        if replace is not None:
+            await cookie_cache.invalidate(account.account_id)
+
+        new_cookies = await login_single_flight(account.account_id, account.pw, session)
+
+        # 요청들이 들고 있는 dict 를 제자리에서 바꿈 (옛 sid 매핑은 정리)
+        for target in {id(c): c for c in (account.cookies, replace) if c is not None}.values():
+            if target is not new_cookies:
+                self._by_sid.pop(target.get(SESSION_COOKIE), None)
+                target.clear()
+                target.update(new_cookies)
+
+        account.login_at = cookie_cache.saved_at(account.account_id) or time.time()
+        sid = new_cookies.get(SESSION_COOKIE)
+        if sid:
+            self._by_sid[sid] = account.account_id
+
+    # ========================================================================
+    # 선제 갱신
+    # ========================================================================
+    def _due(self, account: _Account, now: float) -> bool:
+        return now - account.login_at >= self.ttl - self.refresh_before
+
+    def _refresh_in_background(self, account: _Account):
+        if self._session is None:
+            return
+        if any(t.get_name() == f"session-refresh:{account.account_id}" for t in self._background):
+            return
+
+        async def run():
+            detach_trace()
+            try:
+                await self._relogin(account, self._session)
+                self.proactive_refreshes += 1
+            except Exception as e:
+                self.refresh_errors += 1
+                baemin_logger.error("[SESSION REFRESH ERROR] account_id=%s %s", account.account_id, e)
+
+        task = asyncio.create_task(run(), name=f"session-refresh:{account.account_id}")
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def refresh_due(self) -> int:
+        """만료가 가까운 활성 계정 재로그인, 비활성 계정은 정리. 재로그인한 계정 수 반환"""
+        now = time.time()
+
+        for account_id, account in list(self._accounts.items()):
+            if now - account.last_used > self.active_window:
+                self._forget(account_id)
+
+        due = [a for a in self._accounts.values() if self._due(a, now)]
+        if not due or self._session is None:
+            return 0
+
+        sem = asyncio.Semaphore(self.concurrency)
+        refreshed = 0
+
+        async def refresh(account: _Account):
+            nonlocal refreshed
+            async with sem:
+                try:
+                    await self._relogin(account, self._session)
+                    refreshed += 1
+                except Exception as e:
+                    self.refresh_errors += 1
+                    baemin_logger.error(
+                        "[SESSION REFRESH ERROR] account_id=%s %s", account.account_id, e
+                    )
+
+        await asyncio.gather(*(refresh(a) for a in due))
+        self.proactive_refreshes += refreshed
+        baemin_logger.info("[SESSION] refreshed %d/%d sessions before expiry", refreshed, len(due))
+        return refreshed
+
+    def _forget(self, account_id: str):
+        self._accounts.pop(account_id, None)
+        for sid in [s for s, a in self._by_sid.items() if a == account_id]:
+            del self._by_sid[sid]
+
+    async def _refresh_loop(self):
+        detach_trace()
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.refresh_due()
+            except Exception as e:
+                baemin_logger.error("[SESSION REFRESH LOOP ERROR] %s", e)
+
+    def stats(self) -> dict:
+        return {
+            "active_accounts": len(self._accounts),
+            "proactive_refreshes": self.proactive_refreshes,
+            "recovered_401": self.recovered_401,
+            "refresh_errors": self.refresh_errors,
+        }
+
+
+session_refresher = SessionRefresher()
+
+
+async def with_relogin(cookies: dict, session, fn: Callable[[], Awaitable[T]]) -> T:
+    """
+    fn() 이 HTTP 401(BaeminError code=401) 로 실패하면 재로그인 후 한 번만 다시 호출
+    fn 은 호출 시점의 cookies dict 를 그대로 써야 함 (재로그인은 dict 를 제자리에서 갱신)
+    """
+    used_sid = cookies.get(SESSION_COOKIE)
+    try:
+        return await fn()
+    except BaeminError as e:
+        if e.code != 401:
+            raise
+        if not await session_refresher.refresh_cookies(cookies, used_sid, session):
+            raise
+
+    return await fn()
@@ -1,18 +1,50 @@
 import os
 import random
 import string
+from datetime import date, datetime
+from typing import Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from app.core import config
+
+try:
+    from cryptography.hazmat.primitives.asymmetric import padding as _rsa_padding
+    from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicNumbers
+except ImportError:  # cryptography 가 없으면 순수 파이썬 pow() 로
+    RSAPublicNumbers = None
+
+DATE_FORMATS = ("%Y-%m-%d", "%Y%m%d")
+
+KST = ZoneInfo("Asia/Seoul")
 
 
 class RSAEncryptor:
     """
     배민 로그인에 필요한 RSA-PKCS#1 v1.5 암호화기
+
+    - cryptography 가 설치돼 있고 RSA_BACKEND 가 auto 면 OpenSSL 로 암호화
+      (패딩 + 모듈러 거듭제곱 전부 C 에서 처리)
+    - 아니면 순수 파이썬 (_pkcs1_pad + pow)
+    - 두 경로 모두 결과 형식(앞자리 0 없는 짝수 길이 hex)은 같음
     """
 
-    def __init__(self, n: int, e: int = 65537):
+    def __init__(self, n: int, e: int = 65537, backend: str | None = None):
         self.n = n
         self.e = e
         self.key_length = (n.bit_length() + 7) // 8  # RSA key size (bytes)
 
+        backend = backend or config.RSA_BACKEND
+        self._public_key = None
+        if backend != "python" and RSAPublicNumbers is not None:
+            try:
+                self._public_key = RSAPublicNumbers(e, n).public_key()
+            except ValueError:  # OpenSSL 이 받지 않는 키 → 순수 파이썬으로
+                self._public_key = None
+
+    @property
+    def backend(self) -> str:
+        return "python" if self._public_key is None else "cryptography"
+
     def _pkcs1_pad(self, data: bytes, target_length: int) -> bytes:
         """
         PKCS#1 v1.5 padding
@@ -25,13 +57,13 @@ class RSAEncryptor:
 
         padding_len = target_length - data_len - 3  # 00 02 + 패딩 + 00 + data
 
-        padding = bytearray()
+        # 한 번에 넉넉히 뽑고 0 바이트만 걸러냄 (0 이 나올 확률 1/256 → 보통 1번에 끝남)
+        padding = b""
         while len(padding) < padding_len:
-            b = os.urandom(1)[0]
-            if b != 0:    # non-zero만 사용
-                padding.append(b)
+            need = padding_len - len(padding)
+            padding += os.urandom(need + need // 64 + 8).translate(None, b"\x00")
 
-        return b"\x00\x02" + bytes(padding) + b"\x00" + data
+        return b"\x00\x02" + padding[:padding_len] + b"\x00" + data
 
     def encrypt(self, text: str) -> str:
         if not text:
@@ -39,17 +71,45 @@ class RSAEncryptor:
 
         data = text.encode("utf-8")
 
-        padded = self._pkcs1_pad(data, self.key_length)
-        if padded is None:
-            return ""
+        if self._public_key is not None:
+            if self.key_length < len(data) + 11:
+                return ""
+            c = int.from_bytes(self._public_key.encrypt(data, _rsa_padding.PKCS1v15()), "big")
+        else:
+            padded = self._pkcs1_pad(data, self.key_length)
+            if padded is None:
+                return ""
 
-        m = int.from_bytes(padded, "big")
-        c = pow(m, self.e, self.n)
+            m = int.from_bytes(padded, "big")
+            c = pow(m, self.e, self.n)
 
         hex_str = hex(c)[2:].lower()
         return hex_str if len(hex_str) % 2 == 0 else "0" + hex_str
 
 
+_DUMMY_PASSWORD_CHARS = string.digits + string.ascii_lowercase
+
+
 def generate_dummy_password(length=60):
-    chars = string.digits + string.ascii_lowercase
-    return "".join(random.choice(chars) for _ in range(length))
+    return "".join(random.choices(_DUMMY_PASSWORD_CHARS, k=length))
+
+
+def parse_day(value: str) -> Tuple[Optional[date], Optional[str]]:
+    """'2025-01-01' / '20250101' → (date, 원래 포맷). 알 수 없는 포맷이면 (None, None)"""
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date(), fmt
+        except (TypeError, ValueError):
+            continue
+    return None, None
+
+
+def order_day(order: dict) -> Optional[date]:
+    """주문 원본(orderDateTime)의 한국 시간 기준 날짜"""
+    try:
+        dt = datetime.fromisoformat(order.get("orderDateTime"))
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(KST)
+    return dt.date()
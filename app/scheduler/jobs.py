@@ -0,0 +1,219 @@
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from app.core import config
+from app.core.logger import baemin_logger
+from app.crawler.order_fetcher import FetchProgress
+
+JOB_QUEUED = "QUEUED"
+JOB_RUNNING = "RUNNING"
+JOB_DONE = "DONE"
+JOB_FAILED = "FAILED"
+JOB_CANCELLED = "CANCELLED"
+
+FINISHED_STATES = (JOB_DONE, JOB_FAILED, JOB_CANCELLED)
+
+# runner(progress) → 파싱된 주문 목록
+JobRunner = Callable[[FetchProgress], Awaitable[list]]
+
+
+class JobQueueFull(Exception):
+    pass
+
+
+class CrawlJob:
+    __slots__ = (
+        "id", "account_id", "params", "runner", "state", "progress",
+        "result", "error", "created_at", "started_at", "finished_at", "task",
+    )
+
+    def __init__(self, account_id: str, params: dict, runner: JobRunner):
+        self.id = uuid.uuid4().hex
+        self.account_id = account_id
+        self.params = params
+        self.runner = runner
+        self.state = JOB_QUEUED
+        self.progress = FetchProgress()
+        self.result: Optional[List[dict]] = None
+        self.error: Optional[dict] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.state in FINISHED_STATES
+
+    def status(self) -> dict:
+        """진행률 = 완료 페이지 / totalSize 로 계산한 전체 페이지 (구간이 열릴 때마다 전체가 늘어날 수 있음)"""
+        done = self.progress.pages_done
+        total = self.progress.pages_total
+        return {
+            "job_id": self.id,
+            "account_id": self.account_id,
+            "state": self.state,
+            "params": self.params,
+            "progress": {
+                "pages_done": done,
+                "pages_total": total,
+                "ratio": min(1.0, round(done / total, 4)) if total else (1.0 if self.finished else 0.0),
+            },
+            "count": len(self.result) if self.result is not None else None,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobManager:
+    """
+    오래 걸리는 주문 조회를 요청과 분리해 백그라운드 워커에서 실행
+
+    - submit() 은 바로 job_id 를 돌려주고, 작업은 대기열에 쌓임 (가득 차면 JobQueueFull)
+    - 워커 max_in_flight 개가 대기열에서 하나씩 꺼내 실행 → 동시에 도는 작업 수 제한
+    - 끝난 작업의 결과는 result_ttl 초 동안 보관 후 정리
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = config.JOBS_MAX_IN_FLIGHT,
+        max_queued: int = config.JOBS_MAX_QUEUED,
+        result_ttl: float = config.JOBS_RESULT_TTL_SECONDS,
+    ):
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_queued = max_queued
+        self.result_ttl = result_ttl
+
+        self._jobs: "OrderedDict[str, CrawlJob]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    # ========================================================================
+    # LIFECYCLE
+    # ========================================================================
+    async def start(self):
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queued)
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.max_in_flight)
+        ]
+
+    async def close(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        for job in self._jobs.values():
+            if not job.finished:
+                job.state = JOB_CANCELLED
+                job.finished_at = time.time()
+        self._queue = None
+
+    # ========================================================================
+    # JOBS
+    # ========================================================================
+    def submit(self, account_id: str, params: dict, runner: JobRunner) -> CrawlJob:
+        if self._queue is None:
+            raise RuntimeError("JobManager is not started")
+
+        self._evict_expired()
+
+        job = CrawlJob(account_id, params, runner)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise JobQueueFull(f"대기 중인 작업이 {self.max_queued}개를 넘음")
+
+        self._jobs[job.id] = job
+        self.submitted += 1
+        baemin_logger.info("[JOB] submitted job_id=%s account_id=%s", job.id, account_id)
+        return job
+
+    def get(self, job_id: str) -> Optional[CrawlJob]:
+        self._evict_expired()
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[CrawlJob]:
+        job = self._jobs.get(job_id)
+        if job is None or job.finished:
+            return job
+
+        if job.task is not None:
+            job.task.cancel()  # 실행 중 → _run 에서 CANCELLED 처리
+        else:
+            job.state = JOB_CANCELLED  # 대기 중 → 워커가 꺼낼 때 건너뜀
+            job.finished_at = time.time()
+        return job
+
+    def _evict_expired(self):
+        now = time.time()
+        for job_id, job in list(self._jobs.items()):
+            if job.finished and now - job.finished_at > self.result_ttl:
+                del self._jobs[job_id]
+
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            try:
+                if job.state == JOB_QUEUED:
+                    job.task = asyncio.create_task(self._run(job))
+                    try:
+                        await asyncio.shield(job.task)
+                    except asyncio.CancelledError:
+                        if not job.task.done():  # 워커 자체가 취소됨 (종료)
+                            job.task.cancel()
+                            raise
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: CrawlJob):
+        job.state = JOB_RUNNING
+        job.started_at = time.time()
+        try:
+            job.result = await job.runner(job.progress)
+            job.state = JOB_DONE
+            self.completed += 1
+        except asyncio.CancelledError:
+            job.state = JOB_CANCELLED
+        except Exception as e:
+            job.state = JOB_FAILED
+            job.error = {
+                "code": getattr(e, "code", 500),
+                "status": getattr(e, "status", "ERROR"),
+                "message": getattr(e, "message", str(e)),
+            }
+            self.failed += 1
+            baemin_logger.error("[JOB ERROR] job_id=%s %s", job.id, e)
+        finally:
+            job.finished_at = time.time()
+            job.runner = None  # 자격 증명을 잡고 있는 클로저 해제
+
+    def stats(self) -> Dict[str, int]:
+        states: Dict[str, int] = {}
+        for job in self._jobs.values():
+            states[job.state] = states.get(job.state, 0) + 1
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "queued": states.get(JOB_QUEUED, 0),
+            "running": states.get(JOB_RUNNING, 0),
+            "retained": len(self._jobs),
+        }
+
+
+job_manager = JobManager()
@@ -0,0 +1,103 @@
+"""
+쿠키 저장소 백엔드별 조회 지연 (계정 10k 기준)
+
+    python -m benchmarks.bench_cookie_store                          # 계정 1만 / 조회 5천
+    python -m benchmarks.bench_cookie_store --accounts 100000 --lookups 20000
+    python -m benchmarks.bench_cookie_store --backend sqlite         # 한 백엔드만
+
+임시 디렉터리에 백엔드마다 계정 N 개를 채운 뒤
+- get        : 메모리 캐시 없이 backend.get 무작위 조회 (p50 / p99 / 초당)
+- get(cache) : CookieCache 히트 (비교용)
+- warm       : 시작 시 일괄 로드 (최신 1024개)
+- sweep      : 절반이 만료된 상태에서 만료 정리
+"""
+import argparse
+import asyncio
+import random
+import shutil
+import tempfile
+import time
+from statistics import quantiles
+
+from app.core.cookie_store import CookieCache, FileCookieBackend, SqliteCookieBackend
+
+COOKIES = {"_ceo_v2_gk_sid": "x" * 64, "JSESSIONID": "y" * 32, "ceo_uid": "1234567890"}
+
+
+def _pct(samples):
+    cuts = quantiles(samples, n=100)
+    return cuts[49] * 1e6, cuts[98] * 1e6
+
+
+async def bench_backend(backend, n_accounts: int, n_lookups: int):
+    await backend.open()
+    now = time.time()
+    started = time.perf_counter()
+    # 절반은 만료된 쿠키 (sweep 측정용)
+    for i in range(n_accounts):
+        saved_at = now if i % 2 == 0 else now - 10_000
+        await backend.put(f"acct{i:06d}", COOKIES, saved_at)
+    fill_s = time.perf_counter() - started
+
+    rnd = random.Random(0)
+    samples = []
+    for _ in range(n_lookups):
+        account_id = f"acct{rnd.randrange(n_accounts):06d}"
+        t0 = time.perf_counter()
+        await backend.get(account_id)
+        samples.append(time.perf_counter() - t0)
+    p50, p99 = _pct(samples)
+
+    cache = CookieCache(maxsize=1024, backend=backend, sweep_interval=0)
+    t0 = time.perf_counter()
+    warmed = await cache.warm()
+    warm_s = time.perf_counter() - t0
+
+    cached_ids = list(cache._entries)
+    cache_samples = []
+    for _ in range(n_lookups):
+        account_id = rnd.choice(cached_ids)
+        t0 = time.perf_counter()
+        await cache.get(account_id)
+        cache_samples.append(time.perf_counter() - t0)
+    c50, c99 = _pct(cache_samples)
+
+    t0 = time.perf_counter()
+    swept = await cache.sweep_expired()
+    sweep_s = time.perf_counter() - t0
+
+    print(f"[{backend.name}] accounts={n_accounts} fill={fill_s:.2f}s")
+    print(f"  get          p50 {p50:8.1f}us  p99 {p99:8.1f}us  {n_lookups / sum(samples):8.0f}/s")
+    print(f"  get(cache)   p50 {c50:8.1f}us  p99 {c99:8.1f}us")
+    print(f"  warm         {warmed} entries in {warm_s * 1000:.1f}ms")
+    print(f"  sweep        {swept} expired in {sweep_s * 1000:.1f}ms")
+
+    await backend.close()
+
+
+async def run(backends, n_accounts: int, n_lookups: int):
+    workdir = tempfile.mkdtemp(prefix="baemin_cookie_bench_")
+    try:
+        if "file" in backends:
+            await bench_backend(FileCookieBackend(f"{workdir}/files"), n_accounts, n_lookups)
+        if "sqlite" in backends:
+            await bench_backend(SqliteCookieBackend(f"{workdir}/cookies.sqlite3"), n_accounts, n_lookups)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cookie store backend latency benchmark")
+    parser.add_argument("--accounts", type=int, default=10_000, help="채워 넣을 계정 수")
+    parser.add_argument("--lookups", type=int, default=5_000, help="무작위 조회 수")
+    parser.add_argument(
+        "--backend", choices=("file", "sqlite"), action="append", dest="backends",
+        help="측정할 백엔드 (여러 번 지정 가능, 기본: 전부)",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run(args.backends or ("file", "sqlite"), args.accounts, args.lookups))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+목 서버를 upstream 으로 두고 크롤러 API 전체를 돌리는 e2e 처리량 벤치마크
+
+    python -m benchmarks.bench_e2e --accounts 20 --shops 2 --days 14 --concurrency 10
+
+1) benchmarks.mock_baemin 을 subprocess 로 띄움 (지연/에러/차단 비율 지정)
+2) 크롤러(main:app)를 upstream 주소만 목 서버로 바꿔 subprocess 로 띄움
+   (주문 일자 캐시는 끔 → 매번 upstream 까지 감)
+3) 계정 N 개 × 매장 M 개 × 기간(days) 로 POST /baemin/baemin/orders 를 동시에 호출
+4) 요청/초, 주문/초, p50/p99 지연, 크롤러 프로세스 최대 RSS(VmHWM) 출력
+
+계정당 upstream 페이지 수 ≈ M × 상태 3개 × ceil(days × orders_per_day / 100)
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from datetime import date, timedelta
+from statistics import quantiles
+
+from curl_cffi.requests import AsyncSession
+from curl_cffi.requests.exceptions import RequestException
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ORDERS_PATH = "/baemin/baemin/orders"
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def peak_rss_mb(pid: int) -> float | None:
+    """/proc/<pid>/status 의 VmHWM (리눅스 전용)"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def spawn(args: list, env: dict | None = None) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, *args],
+        cwd=ROOT,
+        env={**os.environ, **(env or {})},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def wait_ready(url: str, proc: subprocess.Popen, timeout: float = 20.0, verify=True):
+    deadline = time.monotonic() + timeout
+    async with AsyncSession(verify=verify) as client:
+        while time.monotonic() < deadline:
+            if proc.poll() is not None:
+                raise RuntimeError(f"process exited early: {proc.args}")
+            try:
+                await client.get(url, timeout=1.0)
+                return
+            except RequestException:
+                await asyncio.sleep(0.1)
+    raise RuntimeError(f"not ready: {url}")
+
+
+async def drive(base_url: str, args) -> dict:
+    start = date(2025, 3, 1)
+    end = start + timedelta(days=args.days - 1)
+
+    latencies = []
+    orders = 0
+    failures = 0
+    sem = asyncio.Semaphore(args.concurrency)
+
+    async def one(client, i):
+        nonlocal orders, failures
+        body = {
+            "id": f"bench{i:05d}",
+            "pw": "pw",
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+        }
+        async with sem:
+            t0 = time.perf_counter()
+            try:
+                r = await client.post(f"{base_url}{ORDERS_PATH}", json=body)
+            except RequestException:
+                failures += 1
+                return
+            latencies.append(time.perf_counter() - t0)
+            if r.status_code != 200:
+                failures += 1
+                return
+            orders += len(r.json().get("data", []))
+
+    async with AsyncSession(timeout=args.timeout, max_clients=args.concurrency) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(one(client, i) for i in range(args.accounts)))
+        elapsed = time.perf_counter() - started
+
+    return {"elapsed": elapsed, "latencies": latencies, "orders": orders, "failures": failures}
+
+
+def report(result: dict, crawler_pid: int, mock_stats: dict, args):
+    lat = sorted(result["latencies"])
+    if len(lat) >= 2:
+        cuts = quantiles(lat, n=100)
+        p50, p99 = cuts[49], cuts[98]
+    else:
+        p50 = p99 = lat[0] if lat else float("nan")
+
+    elapsed = result["elapsed"]
+    rss = peak_rss_mb(crawler_pid)
+
+    print(
+        f"accounts={args.accounts} shops={args.shops} days={args.days} "
+        f"orders/day={args.orders_per_day} concurrency={args.concurrency} "
+        f"latency={args.latency_ms}ms error_rate={args.error_rate} block_rate={args.block_rate}"
+    )
+    print(f"elapsed        {elapsed:8.2f}s")
+    print(f"requests/s     {len(lat) / elapsed:8.2f}   (failed {result['failures']})")
+    print(f"orders/s       {result['orders'] / elapsed:8.0f}   (total {result['orders']})")
+    print(f"latency p50    {p50 * 1000:8.1f}ms")
+    print(f"latency p99    {p99 * 1000:8.1f}ms")
+    print(f"peak RSS       {rss:8.1f}MB" if rss is not None else "peak RSS            n/a")
+    print(f"upstream       {json.dumps(mock_stats)}")
+
+
+async def main(args):
+    mock_port = args.mock_port or free_port()
+    app_port = args.app_port or free_port()
+    mock_url = f"http://127.0.0.1:{mock_port}"
+    app_url = f"http://127.0.0.1:{app_port}"
+
+    mock = spawn([
+        "-m", "benchmarks.mock_baemin",
+        "--port", str(mock_port),
+        "--latency-ms", str(args.latency_ms),
+        "--error-rate", str(args.error_rate),
+        "--block-rate", str(args.block_rate),
+        "--shops", str(args.shops),
+        "--orders-per-day", str(args.orders_per_day),
+    ])
+    crawler = spawn(
+        ["-m", "uvicorn", "main:app", "--port", str(app_port), "--log-level", "warning", "--no-access-log"],
+        env={
+            "BAEMIN_MEMBER_BASE_URL": mock_url,
+            "BAEMIN_SELF_API_BASE_URL": mock_url,
+            "BAEMIN_ORDER_DAY_CACHE_ENABLED": "0",
+            "BAEMIN_LOG_LEVEL": "WARNING",
+            "BAEMIN_RATE_INITIAL_RPS": str(args.rps),
+            "BAEMIN_RATE_MAX_RPS": str(args.rps),
+            "BAEMIN_RATE_MAX_CONCURRENCY": str(args.upstream_concurrency),
+            "BAEMIN_HTTP_MAX_CONNECTIONS_PER_HOST": str(args.upstream_concurrency),
+        },
+    )
+
+    try:
+        await wait_ready(f"{mock_url}/_stats", mock)
+        await wait_ready(f"{app_url}/metrics", crawler)
+
+        result = await drive(app_url, args)
+
+        async with AsyncSession() as client:
+            mock_stats = (await client.get(f"{mock_url}/_stats")).json()
+
+        report(result, crawler.pid, mock_stats, args)
+    finally:
+        for proc in (crawler, mock):
+            proc.terminate()
+        for proc in (crawler, mock):
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Baemin crawler e2e throughput benchmark")
+    parser.add_argument("--accounts", type=int, default=20)
+    parser.add_argument("--shops", type=int, default=2)
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--orders-per-day", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=10, help="동시에 보내는 /orders 요청 수")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--block-rate", type=float, default=0.0)
+    parser.add_argument("--rps", type=float, default=1000.0, help="크롤러의 호스트별 최대 RPS")
+    parser.add_argument("--upstream-concurrency", type=int, default=50)
+    parser.add_argument("--timeout", type=float, default=300.0)
+    parser.add_argument("--mock-port", type=int, default=0)
+    parser.add_argument("--app-port", type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,196 @@
+"""
+HTTP/1.1 vs HTTP/2 주문 페이지 조회 비교 (목 서버 대상)
+
+    python -m benchmarks.bench_http_version --fanouts 1,8,32,64 --pages 512
+
+1) 자체 서명 인증서를 만들고 benchmarks.mock_baemin 을 hypercorn(TLS + ALPN h2/http1.1) 으로 띄움
+2) 프로토콜(v1 / v2 / auto) × fan-out 마다 새 ClientPool 을 만들어
+   fetch_page 로 /v4/orders 페이지 N 개를 fan-out 개씩 동시에 조회
+3) 페이지/초, p50/p99 지연, 목 서버가 새로 받은 커넥션 수, 실제 협상된 프로토콜 출력
+
+hypercorn 이 필요함 (pip install hypercorn, 벤치마크 전용 / 크롤러 의존성 아님)
+"""
+import argparse
+import asyncio
+import datetime as dt
+import ipaddress
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from statistics import quantiles
+
+from curl_cffi.requests import AsyncSession
+
+from benchmarks.bench_e2e import free_port, spawn, wait_ready
+
+SHOP_NO = "1234567801"
+START = dt.date(2025, 3, 1)
+
+
+def make_self_signed_cert(workdir: str) -> tuple:
+    """127.0.0.1 용 자체 서명 인증서 (certfile, keyfile). 크롤러는 이 파일을 CA 번들로 씀"""
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = dt.datetime.now(dt.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - dt.timedelta(minutes=5))
+        .not_valid_after(now + dt.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]),
+            critical=False,
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+
+    certfile = os.path.join(workdir, "cert.pem")
+    keyfile = os.path.join(workdir, "key.pem")
+    with open(certfile, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(keyfile, "wb") as f:
+        f.write(key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ))
+    return certfile, keyfile
+
+
+async def mock_stats(mock_url: str, cafile: str) -> dict:
+    async with AsyncSession(verify=cafile) as client:
+        return (await client.get(f"{mock_url}/_stats")).json()
+
+
+async def run_case(version: str, fanout: int, args, mock_url: str, cafile: str, cookies: dict) -> dict:
+    from app.core.client_pool import ClientPool
+    from app.crawler.order_fetcher import fetch_page
+
+    end = START + dt.timedelta(days=args.days - 1)
+    n_offsets = max(1, args.days * args.orders_per_day // 100)
+    sem = asyncio.Semaphore(fanout)
+    latencies = []
+
+    pool = ClientPool(max_connections_per_host=fanout, http_version=version, reap_interval=0)
+    await pool.start()
+
+    async def one(i: int):
+        async with sem:
+            t0 = time.perf_counter()
+            await fetch_page(
+                pool, {}, cookies, "", SHOP_NO,
+                START.isoformat(), end.isoformat(), "CLOSED", (i % n_offsets) * 100,
+            )
+            latencies.append(time.perf_counter() - t0)
+
+    before = await mock_stats(mock_url, cafile)
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(args.pages)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await pool.close()
+    after = await mock_stats(mock_url, cafile)
+
+    protocols = {
+        v: n - before["http_versions"].get(v, 0)
+        for v, n in after["http_versions"].items()
+        if n - before["http_versions"].get(v, 0) > 0
+    }
+    cuts = quantiles(latencies, n=100)
+    return {
+        "pages_s": args.pages / elapsed,
+        "p50": cuts[49],
+        "p99": cuts[98],
+        "connections": after["connections"] - before["connections"],
+        "protocols": protocols,
+    }
+
+
+async def main(args):
+    workdir = tempfile.mkdtemp(prefix="baemin_http_bench_")
+    certfile, keyfile = make_self_signed_cert(workdir)
+    port = args.mock_port or free_port()
+    mock_url = f"https://127.0.0.1:{port}"
+
+    # app 모듈은 import 시점에 설정을 읽으므로 환경 변수를 먼저 지정
+    max_fanout = max(args.fanouts)
+    os.environ.update({
+        "BAEMIN_MEMBER_BASE_URL": mock_url,
+        "BAEMIN_SELF_API_BASE_URL": mock_url,
+        "BAEMIN_HTTP_CA_BUNDLE": certfile,
+        "BAEMIN_COOKIE_STORE_FILE_PATH": os.path.join(workdir, "cookies"),
+        "BAEMIN_LOG_LEVEL": "WARNING",
+        "BAEMIN_RATE_INITIAL_RPS": "100000",
+        "BAEMIN_RATE_MAX_RPS": "100000",
+        "BAEMIN_RATE_MAX_CONCURRENCY": str(max_fanout),
+    })
+
+    mock = spawn([
+        "-m", "benchmarks.mock_baemin",
+        "--port", str(port),
+        "--server", "hypercorn",
+        "--certfile", certfile,
+        "--keyfile", keyfile,
+        "--latency-ms", str(args.latency_ms),
+        "--orders-per-day", str(args.orders_per_day),
+    ])
+    try:
+        await wait_ready(f"{mock_url}/_stats", mock, verify=certfile)
+
+        from app.core.client_pool import ClientPool
+        from app.crawler.login import login
+
+        pool = ClientPool(reap_interval=0)
+        await pool.start()
+        try:
+            cookies = await login("bench_http", "pw", pool)
+        finally:
+            await pool.close()
+
+        print(
+            f"pages={args.pages} days={args.days} orders/day={args.orders_per_day} "
+            f"latency={args.latency_ms}ms"
+        )
+        print(f"{'version':>7} {'fanout':>6} {'pages/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'conns':>6}  protocols")
+        for fanout in args.fanouts:
+            for version in args.versions:
+                r = await run_case(version, fanout, args, mock_url, certfile, cookies)
+                print(
+                    f"{version:>7} {fanout:>6} {r['pages_s']:9.1f} {r['p50'] * 1000:8.1f} "
+                    f"{r['p99'] * 1000:8.1f} {r['connections']:>6}  {r['protocols']}"
+                )
+    finally:
+        mock.terminate()
+        try:
+            mock.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            mock.kill()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="HTTP/1.1 vs HTTP/2 page fetch benchmark")
+    parser.add_argument("--versions", type=lambda s: s.split(","), default=["v1", "v2"])
+    parser.add_argument("--fanouts", type=lambda s: [int(x) for x in s.split(",")], default=[1, 8, 32, 64])
+    parser.add_argument("--pages", type=int, default=512, help="fan-out 별 조회할 페이지 수")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--orders-per-day", type=int, default=40)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--mock-port", type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,57 @@
+"""
+로그인 암호화 경로 처리량 (코어 1개 기준 logins/s)
+
+    python -m benchmarks.bench_login [초]
+
+로그인 1회의 CPU 작업 = TAG 로 RSAEncryptor 생성 + ID / PW 암호화 + 더미 PW 생성
+(fetch_tag / 로그인 요청 왕복은 제외). 단일 스레드로 돌리므로 결과가 곧 코어당 처리량.
+
+- backend 는 python(순수 파이썬) / cryptography(설치돼 있을 때만)
+- TAG(modulus)는 로그인마다 init 응답으로 새로 받으므로 암호화기도 매번 새로 만듦
+"""
+import sys
+import time
+
+from app.crawler.utils import RSAEncryptor, RSAPublicNumbers, generate_dummy_password
+from benchmarks.mock_baemin import FAKE_MODULUS
+
+ACCOUNT_ID = "baemin_owner_01"
+PASSWORD = "correct-horse-battery!"
+
+
+def login_crypto(make_encryptor, tag: str):
+    rsa = make_encryptor(int(tag, 16))
+    return rsa.encrypt(ACCOUNT_ID), rsa.encrypt(PASSWORD), generate_dummy_password()
+
+
+def logins_per_second(make_encryptor, seconds: float) -> float:
+    count = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(20):
+            login_crypto(make_encryptor, FAKE_MODULUS)
+        count += 20
+    return count / (time.perf_counter() - started)
+
+
+def main(seconds: float = 2.0):
+    backends = ["python"]
+    if RSAPublicNumbers is not None:
+        backends.append("cryptography")
+
+    rows = []
+    for backend in backends:
+        make = lambda n, b=backend: RSAEncryptor(n, backend=b)
+        rows.append((backend, logins_per_second(make, seconds)))
+
+    base = rows[0][1]
+    for name, rate in rows:
+        print(f"{name:<22} {rate:10.0f} logins/s/core  x{rate / base:.1f}")
+
+    if RSAPublicNumbers is None:
+        print("cryptography 미설치 → 가속 백엔드 생략 (pip install cryptography)")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 2.0)
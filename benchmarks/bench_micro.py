@@ -0,0 +1,166 @@
+"""
+핫패스 마이크로벤치마크 + 기준선(baseline) 비교
+
+    python -m benchmarks.bench_micro                       # 측정만
+    python -m benchmarks.bench_micro --save                # 측정 후 기준선 저장
+    python -m benchmarks.bench_micro --compare             # 기준선 대비 비교 (회귀 시 exit 1)
+    python -m benchmarks.bench_micro --compare -k rsa      # 이름에 rsa 가 들어간 케이스만
+
+- 케이스마다 timeit autorange 로 반복 횟수를 정하고 repeat 번 재서 최솟값(1회당 시간)을 사용
+- 기준선은 JSON ({케이스 이름: 1회당 초}) 으로 저장. 머신마다 값이 다르므로
+  같은 머신에서 저장한 기준선과만 비교할 것
+- 현재 / 기준선 비율이 --threshold 를 넘으면 회귀로 표시
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+from typing import Callable, Dict, List, Tuple
+
+from app.core.session import classify_response, is_block_html
+from app.crawler.order_parser import parse_items, parse_items_fast, parse_order_fast, parse_order_model
+from app.crawler.utils import RSAEncryptor, generate_dummy_password
+from benchmarks.mock_baemin import BLOCK_HTML, FAKE_MODULUS
+from tests.fixtures import make_order
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "micro.json")
+
+MB = 1024 * 1024
+
+
+def _big_html(marker: str = "") -> str:
+    """마커 없는 1MB HTML (차단 감지의 최악 경우: 끝까지 다 훑음). marker 는 맨 끝에 붙임"""
+    filler = "<div class='menu'>후라이드치킨 양념치킨 간장치킨</div>\n"
+    body = "<!DOCTYPE html><html><body>" + filler * (MB // len(filler.encode("utf-8")))
+    return body + marker + "</body></html>"
+
+
+def _big_json() -> bytes:
+    orders = []
+    size = 0
+    i = 0
+    while size < MB:
+        row = json.dumps({"order": make_order(i)}, ensure_ascii=False)
+        orders.append(row)
+        size += len(row.encode("utf-8"))
+        i += 1
+    return ('{"totalSize": %d, "contents": [%s]}' % (len(orders), ",".join(orders))).encode("utf-8")
+
+
+def build_cases() -> List[Tuple[str, Callable[[], object]]]:
+    # 아이템/옵션이 많은 주문 (실데이터 상위 구간 정도)
+    heavy = make_order(1, n_items=12, n_options=6)
+    typical = make_order(2)
+
+    rsa = RSAEncryptor(int(FAKE_MODULUS, 16))
+    key_len = rsa.key_length
+    account_id = "baemin_owner_01"
+    password = "correct-horse-battery!"
+
+    html_clean = _big_html()
+    html_clean_bytes = html_clean.encode("utf-8")
+    html_block = _big_html(BLOCK_HTML)
+    json_body = _big_json()
+
+    return [
+        ("parse_order_fast/typical", lambda: parse_order_fast(typical, "K0001")),
+        ("parse_order_fast/heavy", lambda: parse_order_fast(heavy, "K0001")),
+        ("parse_order_model/heavy", lambda: parse_order_model(heavy, "K0001")),
+        ("parse_items_fast/heavy", lambda: parse_items_fast(heavy["items"])),
+        ("parse_items/heavy", lambda: parse_items(heavy["items"])),
+        ("rsa_pkcs1_pad", lambda: rsa._pkcs1_pad(password.encode("utf-8"), key_len)),
+        ("rsa_encrypt", lambda: rsa.encrypt(password)),
+        ("rsa_encrypt/login_pair", lambda: (rsa.encrypt(account_id), rsa.encrypt(password))),
+        ("generate_dummy_password", generate_dummy_password),
+        ("is_block_html/1mb_clean_str", lambda: is_block_html(html_clean)),
+        ("is_block_html/1mb_clean_bytes", lambda: is_block_html(html_clean_bytes)),
+        ("is_block_html/1mb_block_str", lambda: is_block_html(html_block)),
+        ("classify_response/1mb_json", lambda: classify_response(json_body, "application/json")),
+        ("classify_response/1mb_html", lambda: classify_response(html_clean_bytes, "text/html")),
+    ]
+
+
+def measure(fn: Callable[[], object], repeat: int) -> float:
+    """1회당 시간(초) – repeat 번 잰 것 중 최솟값"""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(filter_: str | None, repeat: int) -> Dict[str, float]:
+    results = {}
+    for name, fn in build_cases():
+        if filter_ and filter_ not in name:
+            continue
+        results[name] = measure(fn, repeat)
+    return results
+
+
+def _fmt(sec: float) -> str:
+    if sec >= 1e-3:
+        return f"{sec * 1e3:9.3f} ms"
+    return f"{sec * 1e6:9.2f} us"
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> int:
+    regressions = 0
+    print(f"{'case':<34} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for name, sec in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<34} {'-':>12} {_fmt(sec):>12} {'new':>7}")
+            continue
+        ratio = sec / base
+        mark = ""
+        if ratio > threshold:
+            mark = "  REGRESSION"
+            regressions += 1
+        elif ratio < 1 / threshold:
+            mark = "  faster"
+        print(f"{name:<34} {_fmt(base):>12} {_fmt(sec):>12} {ratio:6.2f}x{mark}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Baemin crawler hot-path microbenchmarks")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="기준선 JSON 경로")
+    parser.add_argument("--save", action="store_true", help="측정 결과를 기준선으로 저장")
+    parser.add_argument("--compare", action="store_true", help="기준선과 비교, 회귀가 있으면 exit 1")
+    parser.add_argument("--threshold", type=float, default=1.25, help="회귀로 볼 현재/기준선 비율")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("-k", dest="filter", default=None, help="이름에 이 문자열이 들어간 케이스만")
+    args = parser.parse_args()
+
+    results = run(args.filter, args.repeat)
+
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"baseline not found: {args.baseline} (먼저 --save 로 저장)")
+            sys.exit(2)
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+    else:
+        regressions = 0
+        for name, sec in results.items():
+            print(f"{name:<34} {_fmt(sec):>12}")
+
+    if args.save:
+        saved = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        saved.update(results)  # -k 로 일부만 돌렸으면 나머지 기준선은 유지
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(saved, f, indent=2, sort_keys=True)
+        print(f"baseline saved: {args.baseline}")
+
+    if regressions:
+        print(f"{regressions} regression(s) over x{args.threshold}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+주문 파서 빠른 경로(parse_order_fast / parse_page) vs pydantic 경로(parse_order_model)
+
+    python -m benchmarks.bench_parser [주문 수]
+
+두 경로의 결과가 완전히 같은지 먼저 확인한 뒤 처리 시간을 비교
+"""
+import sys
+import time
+
+from app.core import config
+from app.crawler.order_parser import parse_order_fast, parse_order_model, parse_page
+from tests.fixtures import make_page
+
+
+def check_parity(rows) -> None:
+    for item in rows:
+        fast = parse_order_fast(item["order"], pid="K0001")
+        model = parse_order_model(item["order"], pid="K0001")
+        if fast != model:
+            raise AssertionError(f"parser mismatch: {item['order']['orderNumber']}")
+
+
+def timed(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def main(n_orders: int = 50_000):
+    rows = make_page(0, n_orders)
+    check_parity(rows)
+    print(f"parity ok ({n_orders} orders)")
+
+    model_s = timed(lambda: [parse_order_model(item["order"], "K0001") for item in rows])
+    fast_s = timed(lambda: [parse_order_fast(item["order"], "K0001") for item in rows])
+
+    config.ORDER_PARSER_FAST = True
+    page_s = timed(lambda: [parse_page(rows[i:i + 100], "K0001") for i in range(0, n_orders, 100)])
+
+    for name, sec in [("model", model_s), ("fast", fast_s), ("fast/page", page_s)]:
+        print(f"{name:<10} {sec:8.3f}s  {n_orders / sec:10.0f} orders/s  x{model_s / sec:.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,102 @@
+"""
+주문 응답 직렬화 / 압축 비교 (기본 5만 건)
+
+    python -m benchmarks.bench_response [주문 수] [반복 횟수]
+
+parse_page 로 만든 주문 N 건을 {"code": 200, "data": [...]} 로 감싸서
+- 직렬화 : FastAPI 기본(jsonable_encoder + JSONResponse.render) vs json_bytes(orjson)
+- 압축   : gzip / brotli 수준별 크기(압축률)와 시간
+- 스트림 : /orders/stream 처럼 500줄 덩어리마다 flush 했을 때 크기
+시간은 반복 중 최솟값 (FastAPI 기본 경로는 느려서 한 번만)
+"""
+import json
+import sys
+import time
+import zlib
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.api import responses
+from app.api.responses import StreamCompressor, json_bytes, ndjson_line
+from app.core import config
+from app.crawler.order_parser import parse_page
+from tests.fixtures import make_page
+
+STREAM_CHUNK_LINES = 500
+
+
+def best_of(fn, repeat: int):
+    best, result = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def fastapi_default(content) -> bytes:
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def stream_size(lines: list, encoding: str) -> int:
+    compressor = StreamCompressor(encoding)
+    size = 0
+    for i in range(0, len(lines), STREAM_CHUNK_LINES):
+        size += len(compressor.chunk(b"".join(lines[i:i + STREAM_CHUNK_LINES])))
+    return size + len(compressor.finish())
+
+
+def main(n_orders: int, repeat: int):
+    rows = make_page(0, n_orders)
+    orders = []
+    for i in range(0, n_orders, 100):
+        orders.extend(parse_page(rows[i:i + 100], "K0001"))
+    content = {"code": 200, "data": orders}
+
+    print(f"orders={n_orders} repeat={repeat}")
+    print("[serialize]")
+    default_s, default_body = best_of(lambda: fastapi_default(content), 1)
+    fast_s, body = best_of(lambda: json_bytes(content), repeat)
+    if json.loads(default_body) != json.loads(body):
+        raise AssertionError("json_bytes output differs from FastAPI default")
+    print(f"  fastapi default   {default_s * 1000:8.1f}ms  {len(default_body) / 1e6:7.2f}MB")
+    print(f"  json_bytes        {fast_s * 1000:8.1f}ms  {len(body) / 1e6:7.2f}MB  (x{default_s / fast_s:.1f})")
+
+    print("[compress]")
+    cases = [("gzip", level) for level in (1, 5, 6, 9)]
+    if responses.brotli is not None:
+        cases += [("br", quality) for quality in (1, 4, 5, 7)]
+    else:
+        print("  (brotli 미설치 → br 생략)")
+
+    for encoding, level in cases:
+        if encoding == "gzip":
+            compress_s, out = best_of(lambda: zlib.compress(body, level, wbits=31), repeat)
+        else:
+            compress_s, out = best_of(lambda: responses.brotli.compress(body, quality=level), repeat)
+        print(
+            f"  {encoding:4} {level:>2}           {compress_s * 1000:8.1f}ms  {len(out) / 1e6:7.2f}MB"
+            f"  ratio {len(body) / len(out):5.1f}  {len(body) / compress_s / 1e6:7.1f}MB/s"
+        )
+
+    print(f"[stream, {STREAM_CHUNK_LINES} lines/chunk, default levels]")
+    lines = [ndjson_line(order) for order in orders]
+    raw = sum(len(line) for line in lines)
+    for encoding in responses.supported_encodings() or (responses.ENCODING_GZIP,):
+        started = time.perf_counter()
+        size = stream_size(lines, encoding)
+        elapsed = time.perf_counter() - started
+        level = config.RESPONSE_BROTLI_QUALITY if encoding == "br" else config.RESPONSE_GZIP_LEVEL
+        print(
+            f"  {encoding:4} {level:>2}           {elapsed * 1000:8.1f}ms  {size / 1e6:7.2f}MB"
+            f"  ratio {raw / size:5.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 50_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 3,
+    )
@@ -0,0 +1,277 @@
+"""
+로컬 배민 목 서버 (부하 테스트 / e2e 벤치마크용)
+
+    python -m benchmarks.mock_baemin --port 9100 --latency-ms 30 --error-rate 0.01
+
+크롤러가 호출하는 엔드포인트만 흉내냄
+- biz-member : /v1/login/init, /v1/login
+- self-api   : /v1/session/profile, /v4/store/shops/..., /v4/orders
+
+크롤러 쪽은 BAEMIN_MEMBER_BASE_URL / BAEMIN_SELF_API_BASE_URL 을 이 서버 주소로 지정.
+주문 데이터는 tests.fixtures.make_order 로 (매장, 상태, 날짜) 마다 결정적으로 생성.
+
+- latency_ms  : 응답마다 latency_ms × (1 ± jitter) 만큼 지연
+- error_rate  : 이 확률로 HTTP 503
+- block_rate  : 이 확률로 배민 보안 차단 HTML (HTTP 403)
+- session_ttl : 로그인 세션 유효 시간(초). 지나면 HTTP 401 (0 이면 만료 없음)
+
+--server hypercorn 이면 HTTP/2 를 받음 (평문 h2c / --certfile 지정 시 TLS + ALPN)
+/_stats 의 connections / http_versions 로 클라이언트가 연 커넥션 수와 프로토콜 확인
+"""
+import argparse
+import asyncio
+import hashlib
+import random
+import secrets
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from datetime import date, datetime, timedelta
+
+import orjson
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import HTMLResponse, JSONResponse
+
+from tests.fixtures import make_order
+
+SID_COOKIE = "_ceo_v2_gk_sid"
+
+# 2048bit 홀수 modulus (크롤러는 암호화만 하므로 실제 RSA 키일 필요 없음)
+FAKE_MODULUS = format((1 << 2047) | random.Random(0).getrandbits(2046) << 1 | 1, "x")
+
+BLOCK_HTML = (
+    "<!DOCTYPE html><html><head><title>보안 위배</title></head>"
+    "<body>올바르지 않은 요청으로 페이지를 보실 수 없습니다.</body></html>"
+)
+
+
+@dataclass
+class MockSettings:
+    latency_ms: float = 20.0
+    jitter: float = 0.3
+    error_rate: float = 0.0
+    block_rate: float = 0.0
+    shops: int = 2
+    orders_per_day: int = 40
+    seed: int = 0
+    session_ttl: float = 0.0
+
+
+settings = MockSettings()
+
+stats = {
+    "requests": 0, "errors": 0, "blocks": 0, "logins": 0, "order_pages": 0, "unauthorized": 0,
+    "connections": 0, "http_versions": {},
+}
+
+# 지금까지 요청을 보낸 (클라이언트 주소, 포트) = 커넥션
+_peers = set()
+
+# sid → 발급 시각
+sessions = {}
+
+app = FastAPI(title="Baemin Mock", docs_url=None, redoc_url=None)
+
+
+async def _simulate(request: Request):
+    """지연 + 장애 주입. 장애 응답이면 Response 를 반환"""
+    stats["requests"] += 1
+
+    peer = request.scope.get("client")
+    if peer is not None and peer not in _peers:
+        _peers.add(peer)
+        stats["connections"] = len(_peers)
+    version = request.scope.get("http_version", "?")
+    stats["http_versions"][version] = stats["http_versions"].get(version, 0) + 1
+
+    if settings.latency_ms > 0:
+        spread = settings.latency_ms * settings.jitter
+        await asyncio.sleep(max(0.0, settings.latency_ms + random.uniform(-spread, spread)) / 1000)
+
+    roll = random.random()
+    if roll < settings.block_rate:
+        stats["blocks"] += 1
+        return HTMLResponse(BLOCK_HTML, status_code=403)
+    if roll < settings.block_rate + settings.error_rate:
+        stats["errors"] += 1
+        return JSONResponse({"message": "Service Unavailable"}, status_code=503)
+    return None
+
+
+def _owner_of(request: Request) -> str | None:
+    """유효한 세션이면 sid 앞부분으로 만든 사장님 번호, 아니면 None(→ 401)"""
+    sid = request.cookies.get(SID_COOKIE) or ""
+    issued_at = sessions.get(sid)
+    if issued_at is None or (
+        settings.session_ttl > 0 and time.monotonic() - issued_at > settings.session_ttl
+    ):
+        stats["unauthorized"] += 1
+        return None
+    return str(int(sid[:8], 16))
+
+
+@lru_cache(maxsize=4096)
+def _orders_for_day(shop_no: str, status: str, day: date) -> list:
+    """(매장, 상태, 날짜) 의 주문 목록 – 같은 인자면 항상 같은 결과 (목 서버 CPU 가 병목이 되지 않게 캐시)"""
+    seed = int(hashlib.md5(f"{settings.seed}:{shop_no}:{status}".encode()).hexdigest()[:8], 16)
+    base = day.toordinal() * settings.orders_per_day
+    step = timedelta(minutes=(24 * 60) // max(1, settings.orders_per_day))
+    start = datetime(day.year, day.month, day.day)
+
+    rows = []
+    for k in range(settings.orders_per_day):
+        order = make_order(base + k, seed=seed)
+        order["orderNumber"] = f"{shop_no}-{status[:2]}-{base + k}"
+        order["status"] = status
+        order["orderDateTime"] = (start + step * k).isoformat()
+        rows.append({"order": order})
+    return rows
+
+
+# -----------------------------
+#   biz-member
+# -----------------------------
+@app.get("/v1/login/init")
+async def login_init(request: Request):
+    if (res := await _simulate(request)) is not None:
+        return res
+    return {"data": {"tag": FAKE_MODULUS, "needRecaptcha": False}}
+
+
+@app.post("/v1/login")
+async def do_login(request: Request):
+    if (res := await _simulate(request)) is not None:
+        return res
+
+    body = await request.json()
+    if not body.get("id") or not body.get("value1") or not body.get("value2"):
+        return {"status": "FAIL"}
+
+    stats["logins"] += 1
+    # 앞 8자리는 계정별로 고정(사장님 번호), 뒤는 로그인마다 새로 발급
+    sid = hashlib.sha256(body["id"].encode()).hexdigest()[:8] + secrets.token_hex(16)
+    sessions[sid] = time.monotonic()
+    res = JSONResponse({"status": "SUCCESS"})
+    res.set_cookie(SID_COOKIE, sid, httponly=True)
+    return res
+
+
+# -----------------------------
+#   self-api
+# -----------------------------
+@app.get("/v1/session/profile")
+async def profile(request: Request):
+    if (res := await _simulate(request)) is not None:
+        return res
+    owner = _owner_of(request)
+    if owner is None:
+        return JSONResponse({"message": "Unauthorized"}, status_code=401)
+    return {"shopOwnerNumber": owner}
+
+
+@app.get("/v4/store/shops/temporary-stop-status/by-shop-owner-number")
+async def shops(request: Request, shopOwnerNo: str):
+    if (res := await _simulate(request)) is not None:
+        return res
+    if _owner_of(request) is None:
+        return JSONResponse({"message": "Unauthorized"}, status_code=401)
+    return {"content": [{"shopNo": f"{shopOwnerNo}{i:02d}"} for i in range(settings.shops)]}
+
+
+@app.get("/v4/orders")
+async def orders(
+    request: Request,
+    shopNumbers: str,
+    orderStatus: str,
+    startDate: str,
+    endDate: str,
+    offset: int = 0,
+    limit: int = 100,
+):
+    if (res := await _simulate(request)) is not None:
+        return res
+    if _owner_of(request) is None:
+        return JSONResponse({"message": "Unauthorized"}, status_code=401)
+
+    stats["order_pages"] += 1
+
+    start = date.fromisoformat(startDate)
+    end = date.fromisoformat(endDate)
+    total = max(0, (end - start).days + 1) * settings.orders_per_day
+
+    # 요청한 페이지에 걸치는 날짜만 생성
+    contents = []
+    per_day = settings.orders_per_day
+    if per_day > 0:
+        first_day, skip = divmod(offset, per_day)
+        day = start + timedelta(days=first_day)
+        while len(contents) < limit and day <= end:
+            rows = _orders_for_day(shopNumbers, orderStatus, day)
+            contents.extend(rows[skip:])
+            skip = 0
+            day += timedelta(days=1)
+
+    # jsonable_encoder 를 거치지 않고 바로 직렬화 (목 서버가 병목이 되지 않게)
+    return Response(
+        orjson.dumps({"totalSize": total, "contents": contents[:limit]}),
+        media_type="application/json",
+    )
+
+
+@app.get("/_stats")
+async def mock_stats():
+    return stats
+
+
+def _serve_hypercorn(args):
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+
+    config = Config()
+    config.bind = [f"{args.host}:{args.port}"]
+    config.loglevel = "WARNING"
+    config.accesslog = None
+    if args.certfile:
+        config.certfile = args.certfile
+        config.keyfile = args.keyfile
+        config.alpn_protocols = ["h2", "http/1.1"]
+    asyncio.run(serve(app, config))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Baemin mock server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency-ms", type=float, default=settings.latency_ms)
+    parser.add_argument("--jitter", type=float, default=settings.jitter)
+    parser.add_argument("--error-rate", type=float, default=settings.error_rate)
+    parser.add_argument("--block-rate", type=float, default=settings.block_rate)
+    parser.add_argument("--shops", type=int, default=settings.shops)
+    parser.add_argument("--orders-per-day", type=int, default=settings.orders_per_day)
+    parser.add_argument("--seed", type=int, default=settings.seed)
+    parser.add_argument("--session-ttl", type=float, default=settings.session_ttl)
+    parser.add_argument("--server", choices=("uvicorn", "hypercorn"), default="uvicorn")
+    parser.add_argument("--certfile", default=None)
+    parser.add_argument("--keyfile", default=None)
+    args = parser.parse_args()
+
+    settings.latency_ms = args.latency_ms
+    settings.jitter = args.jitter
+    settings.error_rate = args.error_rate
+    settings.block_rate = args.block_rate
+    settings.shops = args.shops
+    settings.orders_per_day = args.orders_per_day
+    settings.seed = args.seed
+    settings.session_ttl = args.session_ttl
+
+    if args.server == "hypercorn":
+        _serve_hypercorn(args)
+        return
+
+    import uvicorn
+
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning", access_log=False)
+
+
+if __name__ == "__main__":
+    main()
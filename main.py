@@ -1,12 +1,55 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from app.api.job_api import router as job_router
 from app.api.login_api import router as login_router
+from app.api.metrics_api import router as metrics_router
 from app.api.order_api import router as order_router
+from app.api.snapshot_api import router as snapshot_router
+from app.core.client_pool import ClientPool
+from app.core.cookie_store import cookie_cache
+from app.core.order_snapshot import order_snapshot_store
+from app.crawler.session_refresh import session_refresher
+from app.scheduler.jobs import job_manager
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 프로세스 공용 HTTP 커넥션 풀
+    client_pool = ClientPool()
+    await client_pool.start()
+    app.state.client_pool = client_pool
+
+    # 쿠키 저장소 → 메모리 캐시 일괄 로드 + 만료 정리 루프
+    await cookie_cache.start()
+
+    # 활성 계정 세션 만료 전 재로그인
+    await session_refresher.start(client_pool)
+
+    # 백그라운드 조회 작업 워커
+    await job_manager.start()
+
+    # 커서 페이지 조회용 주문 스냅샷 (이전 프로세스가 남긴 파일 정리)
+    await order_snapshot_store.start()
+
+    try:
+        yield
+    finally:
+        await order_snapshot_store.close()
+        await job_manager.close()
+        await session_refresher.close()
+        await client_pool.close()
+        await cookie_cache.close()
+
 
-app = FastAPI(title="Baemin Crawler API", version="1.0.0")
+app = FastAPI(title="Baemin Crawler API", version="1.0.0", lifespan=lifespan)
 
 # 라우터 등록
 app.include_router(login_router, prefix="/baemin", tags=["Baemin Login"])
 app.include_router(order_router, prefix="/baemin", tags=["Baemin Orders"])
+app.include_router(job_router, prefix="/baemin", tags=["Baemin Jobs"])
+app.include_router(snapshot_router, prefix="/baemin", tags=["Baemin Order Snapshots"])
+app.include_router(metrics_router, tags=["Metrics"])
 
 # 실행 명령:
 # uvicorn main:app --reload
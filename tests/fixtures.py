@@ -0,0 +1,44 @@
+"""
+테스트 / 벤치마크 공용 배민 응답 픽스처 (실제 /v4/orders 응답 구조를 흉내낸 합성 데이터)
+"""
+import random
+from datetime import datetime, timedelta
+
+MENU = ["후라이드치킨", "양념치킨", "간장치킨", "치즈볼", "콜라 1.25L", "떡볶이", "순대", "김밥"]
+OPTIONS = ["순살 변경", "뼈 추가", "소스 추가", "치즈 추가", "맵기 조절", "음료 사이즈업"]
+STATUSES = ["ACCEPTED", "CLOSED", "CANCELLED"]
+
+
+def make_order(i: int, n_items: int = 4, n_options: int = 3, seed: int = 0) -> dict:
+    rnd = random.Random(seed * 1_000_003 + i)
+    ordered_at = datetime(2025, 1, 1, 11) + timedelta(minutes=17 * i)
+
+    items = []
+    for _ in range(n_items):
+        qty = rnd.randint(1, 3)
+        items.append({
+            "name": rnd.choice(MENU),
+            "quantity": qty,
+            "totalPrice": qty * rnd.randrange(3000, 25000, 500),
+            "options": [
+                {"name": rnd.choice(OPTIONS), "price": rnd.randrange(0, 3000, 500)}
+                for _ in range(n_options)
+            ],
+        })
+
+    return {
+        "orderNumber": f"B{20250101000000 + i}",
+        "status": rnd.choice(STATUSES),
+        "deliveryType": rnd.choice(["DELIVERY", "TAKEOUT"]),
+        "orderDateTime": ordered_at.isoformat(),
+        "payAmount": sum(it["totalPrice"] for it in items) + 3000,
+        "deliveryTip": 3000,
+        "extraDeliveryTip": rnd.choice([0, 0, 1000]),
+        "discountPrice": rnd.choice([0, 0, 2000]),
+        "items": items,
+    }
+
+
+def make_page(offset: int = 0, limit: int = 100, **kwargs) -> list:
+    """/v4/orders 응답의 contents 한 페이지"""
+    return [{"order": make_order(offset + i, **kwargs)} for i in range(limit)]
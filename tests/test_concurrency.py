@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+from app.core.concurrency import bounded_gather
+
+
+def test_bounded_gather_keeps_order_and_limit():
+    running = 0
+    peak = 0
+
+    async def work(i):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (5 - i))
+        running -= 1
+        return i
+
+    assert asyncio.run(bounded_gather((work(i) for i in range(5)), 2)) == [0, 1, 2, 3, 4]
+    assert peak == 2
+
+
+def test_bounded_gather_cancels_siblings_on_error():
+    cancelled = []
+
+    async def slow(i):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(i)
+            raise
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main():
+        with pytest.raises(ValueError, match="boom"):
+            await bounded_gather([slow(0), fail(), slow(2), slow(3)], 3)
+        # 다시 던지기 전에 형제 작업은 취소 후 정리까지 끝나 있어야 함
+        assert sorted(cancelled) == [0, 2, 3]
+        assert len(asyncio.all_tasks()) == 1
+
+    asyncio.run(main())
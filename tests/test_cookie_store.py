@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+from app.core.cookie_store import CookieBackend, CookieCache, SqliteCookieBackend
+
+
+def test_backend_must_implement_interface():
+    class Partial(CookieBackend):
+        async def get(self, account_id):
+            return None
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_sqlite_backend_reopens_after_restart(tmp_path):
+    backend = SqliteCookieBackend(str(tmp_path / "cookies.sqlite3"))
+    assert backend._conn is None  # 만들기만 해서는 연결하지 않음
+
+    cache = CookieCache(backend=backend, sweep_interval=0)
+
+    async def lifecycle():
+        await cache.start(warm=False)
+        await cache.put("acc", {"sid": "1"})
+        await cache.close()
+        assert backend._conn is None
+
+        # 같은 앱이 다시 시작돼도 (lifespan 재진입) 닫힌 연결을 쓰지 않음
+        await cache.start(warm=True)
+        assert await backend.get("acc") is not None
+        assert await cache.get("acc") == {"sid": "1"}
+        await cache.close()
+
+    asyncio.run(lifecycle())
@@ -0,0 +1,142 @@
+import asyncio
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.core import config
+from app.core.errors import BaeminError
+from app.core.page_checkpoint import PageCheckpoint
+from app.crawler import order_fetcher
+from app.crawler.order_fetcher import FetchProgress, fetch_orders, split_range
+
+SHARD_ROWS = 250  # 구간마다 3 페이지 (offset 0 / 100 / 200)
+
+
+class FakeSession:
+    """구간(startDate)마다 SHARD_ROWS 건을 내려주는 가짜 세션. fail 에 든 페이지는 한 번 HTTP 400"""
+
+    def __init__(self, fail=(), sizes=None):
+        self.fail = set(fail)
+        self.sizes = sizes or {}
+        self.calls = []
+
+    def random_ua(self):
+        return "test"
+
+    async def get(self, url, headers=None, params=None, cookies=None):
+        key = (params["startDate"], params["offset"])
+        self.calls.append(key)
+        if key in self.fail:
+            self.fail.discard(key)
+            await asyncio.sleep(0.05)  # 다른 페이지가 먼저 끝나게
+            return {}, 400
+
+        offset = params["offset"]
+        size = self.sizes.get(params["startDate"], SHARD_ROWS)
+        contents = [
+            {"order": {"orderNumber": f"{params['startDate']}-{i}"}}
+            for i in range(offset, min(offset + params["limit"], size))
+        ]
+        return {"totalSize": size, "contents": contents}, 200
+
+
+@pytest.fixture
+def checkpoint(monkeypatch):
+    checkpoint = PageCheckpoint()
+    monkeypatch.setattr(order_fetcher, "page_checkpoint", checkpoint)
+    return checkpoint
+
+
+@pytest.fixture
+def shards(monkeypatch, checkpoint):
+    monkeypatch.setattr(config, "ORDERS_SHARD_DAYS", 7)
+    shards = split_range("2024-01-01", "2024-01-20", 7)
+    assert len(shards) == 3
+    return shards
+
+
+def _fetch(session, progress=None):
+    return asyncio.run(fetch_orders(
+        session, {}, "owner", "shop", "2024-01-01", "2024-01-20", "CLOSED", progress=progress,
+    ))
+
+
+def test_retry_fetches_only_missing_pages(shards):
+    session = FakeSession(fail={(shards[1].start, 200)})
+
+    with pytest.raises(BaeminError):
+        _fetch(session)
+    assert len(session.calls) == 9
+
+    # 다시 조회하면 첫 페이지(구간마다 1번) + 실패했던 페이지만 요청
+    session.calls.clear()
+    orders = _fetch(session)
+    assert len(orders) == 3 * SHARD_ROWS
+    assert sorted(session.calls) == sorted([(s.start, 0) for s in shards] + [(shards[1].start, 200)])
+
+
+def test_checkpoints_kept_until_whole_fetch_succeeds(shards, checkpoint):
+    session = FakeSession(fail={(shards[0].start, 100)})
+
+    with pytest.raises(BaeminError):
+        _fetch(session)
+    assert checkpoint.stats() == {"shards": 3, "pages": 5, "resumed_pages": 0}
+
+    _fetch(session)
+    assert checkpoint.stats() == {"shards": 0, "pages": 0, "resumed_pages": 5}
+
+
+def test_progress_counts_empty_and_split_first_pages(shards, monkeypatch):
+    # 마지막 구간은 비어 있고, 나머지 구간은 하루 단위까지 반씩 나뉨
+    monkeypatch.setattr(config, "ORDERS_SHARD_MAX_ROWS", SHARD_ROWS - 1)
+    session = FakeSession(sizes={shards[2].start: 0})
+    progress = FetchProgress()
+
+    _fetch(session, progress)
+    assert progress.pages_done == len(session.calls)
+    assert progress.pages_total == progress.pages_done
+
+
+class DailySession(FakeSession):
+    """하루 per_day 건, 날짜 오름차순으로 startDate ~ endDate 를 나눠 주는 가짜 세션"""
+
+    def __init__(self, per_day):
+        super().__init__()
+        self.per_day = per_day
+
+    async def get(self, url, headers=None, params=None, cookies=None):
+        self.calls.append((params["startDate"], params["endDate"], params["offset"]))
+        start = date.fromisoformat(params["startDate"])
+        days = (date.fromisoformat(params["endDate"]) - start).days + 1
+        rows = [
+            {"order": {
+                "orderNumber": f"{start + timedelta(days=d)}-{k}",
+                "orderDateTime": datetime.combine(start + timedelta(days=d), datetime.min.time()).isoformat(),
+            }}
+            for d in range(days)
+            for k in range(self.per_day)
+        ]
+        offset = params["offset"]
+        return {"totalSize": len(rows), "contents": rows[offset:offset + params["limit"]]}, 200
+
+
+def test_split_reuses_first_page_for_the_half_it_belongs_to(monkeypatch, checkpoint):
+    monkeypatch.setattr(config, "ORDERS_SHARD_DAYS", 7)
+    monkeypatch.setattr(config, "ORDERS_SHARD_MAX_ROWS", 150)
+    session = DailySession(per_day=60)
+    progress = FetchProgress()
+
+    orders = asyncio.run(fetch_orders(
+        session, {}, "owner", "shop", "2024-01-01", "2024-01-04", "CLOSED", progress=progress,
+    ))
+
+    # 240건 → 2일씩 반으로. 첫 페이지(100건)는 앞 절반 것이므로 앞 절반은 offset 100 만 요청
+    assert sorted(session.calls) == sorted([
+        ("2024-01-01", "2024-01-04", 0),
+        ("2024-01-01", "2024-01-02", 100),
+        ("2024-01-03", "2024-01-04", 0),
+        ("2024-01-03", "2024-01-04", 100),
+    ])
+    expected = [f"{date(2024, 1, 1) + timedelta(days=d)}-{k}" for d in range(4) for k in range(60)]
+    assert [row["order"]["orderNumber"] for row in orders] == expected
+    assert progress.pages_done == progress.pages_total == 4
@@ -0,0 +1,30 @@
+import asyncio
+
+from app.crawler import order_info
+from app.crawler.order_info import AccountMetaCache
+
+
+def test_account_meta_cache_is_bounded_lru(monkeypatch):
+    calls = []
+
+    async def fetch_account_number(cookies, session):
+        calls.append(cookies["id"])
+        return f"owner-{cookies['id']}"
+
+    async def fetch_shop_number(cookies, account_no, session):
+        return [{"shopNo": f"{account_no}-shop"}]
+
+    monkeypatch.setattr(order_info, "fetch_account_number", fetch_account_number)
+    monkeypatch.setattr(order_info, "fetch_shop_number", fetch_shop_number)
+
+    cache = AccountMetaCache(maxsize=2)
+
+    async def run():
+        for account_id in ("a", "b", "a", "c", "a", "b"):
+            await cache.get(account_id, {"id": account_id}, None)
+
+    asyncio.run(run())
+    # a 는 계속 쓰여서 남고, b 는 c 가 들어올 때 밀려나 다시 조회
+    assert calls == ["a", "b", "c", "b"]
+    assert cache.stats()["size"] == 2
+    assert cache.stats()["evictions"] == 2
@@ -0,0 +1,86 @@
+import copy
+
+import pytest
+from pydantic import ValidationError
+
+from app.core import metrics
+from app.crawler.order_parser import parse_order_fast, parse_order_model
+from tests.fixtures import make_order, make_page
+
+
+def _parse(parse, order):
+    """결과 dict 또는 던진 예외 클래스"""
+    try:
+        return parse(copy.deepcopy(order), "K0001")
+    except Exception as e:
+        return type(e)
+
+
+@pytest.mark.parametrize("n_items,n_options", [(0, 0), (1, 0), (1, 3), (4, 3), (8, 6)])
+def test_fast_parser_matches_model(n_items, n_options):
+    for row in make_page(0, 50, n_items=n_items, n_options=n_options):
+        order = row["order"]
+        assert parse_order_fast(order, "K0001") == parse_order_model(order, "K0001")
+
+
+def _set(path, value):
+    def mutate(order):
+        *parents, key = path
+        target = order
+        for p in parents:
+            target = target[p]
+        target[key] = value
+    return mutate
+
+
+def _drop(path):
+    def mutate(order):
+        *parents, key = path
+        target = order
+        for p in parents:
+            target = target[p]
+        del target[key]
+    return mutate
+
+
+MALFORMED = {
+    # 모델이 str 로 검증하는 필드 → 빠른 경로도 같은 ValidationError
+    "orderNumber int": _set(["orderNumber"], 20250101000001),
+    "orderNumber None": _set(["orderNumber"], None),
+    "deliveryType None": _set(["deliveryType"], None),
+    "item name int": _set(["items", 1, "name"], 7),
+    "only item name None": lambda o: o.update(items=[dict(o["items"][0], name=None)]),
+    "option name None": _set(["items", 0, "options", 0, "name"], None),
+    # 빠진 키 / 엉뚱한 값 → 두 경로 모두 같은 기본값 또는 같은 예외
+    "orderNumber missing": _drop(["orderNumber"]),
+    "status missing": _drop(["status"]),
+    "status None": _set(["status"], None),
+    "status int": _set(["status"], 5),
+    "items missing": _drop(["items"]),
+    "items None": _set(["items"], None),
+    "item name missing": _drop(["items", 1, "name"]),
+    "item quantity missing": _drop(["items", 0, "quantity"]),
+    "item quantity junk": _set(["items", 0, "quantity"], "x"),
+    "item options missing": _drop(["items", 0, "options"]),
+    "item not a dict": _set(["items", 0], "치킨"),
+    "option not a dict": _set(["items", 0, "options", 0], 1),
+    "orderDateTime junk": _set(["orderDateTime"], "yesterday"),
+    "payAmount str": _set(["payAmount"], "1.5"),
+}
+
+
+@pytest.mark.parametrize("case", MALFORMED)
+def test_fast_parser_matches_model_on_malformed(case):
+    order = make_order(1)
+    MALFORMED[case](order)
+    assert _parse(parse_order_fast, order) == _parse(parse_order_model, order)
+
+
+def test_fast_parser_falls_back_to_model_on_non_string_fields():
+    order = make_order(1, n_items=2)
+    order["orderNumber"] = 20250101000001
+    before = metrics.PARSE_FALLBACKS.value()
+
+    with pytest.raises(ValidationError):
+        parse_order_fast(order, "K0001")
+    assert metrics.PARSE_FALLBACKS.value() == before + 1
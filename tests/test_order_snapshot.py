@@ -0,0 +1,25 @@
+import asyncio
+
+from app.core.order_snapshot import OrderSnapshotStore
+
+
+def test_start_and_close_only_touch_own_snapshots(tmp_path):
+    (tmp_path / "keep.txt").write_text("data")
+    other = tmp_path / "99999999"
+    other.mkdir()
+    (other / "live.ndjson").write_text("{}\n")
+
+    store = OrderSnapshotStore(str(tmp_path), ttl=60, max_count=10)
+
+    async def lifecycle():
+        await store.start()
+        snapshot = await store.create("acc", {}, [{"order_date": 2}, {"order_date": 1}])
+        data, end = await store.read_page(snapshot, 0, 10)
+        assert end == 2 and data.startswith(b"[")
+        await store.close()
+
+    asyncio.run(lifecycle())
+
+    assert (tmp_path / "keep.txt").read_text() == "data"
+    assert (other / "live.ndjson").exists()
+    assert not (tmp_path / store.directory).exists()
@@ -0,0 +1,55 @@
+import asyncio
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import order_api
+from app.api.deps import get_client_pool
+from app.core import config
+from app.core.errors import BaeminError
+
+BODY = {"id": "acc", "pw": "pw", "start": "2024-01-01", "end": "2024-01-20"}
+
+
+def _client():
+    app = FastAPI()
+    app.include_router(order_api.router)
+    app.dependency_overrides[get_client_pool] = lambda: None
+    return TestClient(app)
+
+
+def test_stream_error_is_last_line_and_cancels_siblings(monkeypatch):
+    cancelled = []
+
+    async def prepare_crawl(body, session):
+        return {}, "owner", [("s1", "CLOSED"), ("s2", "CLOSED"), ("s3", "CLOSED")]
+
+    async def fetch_parsed_orders(session, cookies, account_no, shop_no, start, end, status, on_rows):
+        try:
+            if shop_no == "s2":
+                await on_rows([{"shop": shop_no, "i": 0}])
+                await asyncio.sleep(0.02)
+                raise BaeminError("upstream down", code=502)
+            # 나머지 매장은 계속 행을 흘려보냄 (버퍼가 차면 on_rows 에서 멈춤)
+            i = 0
+            while True:
+                await on_rows([{"shop": shop_no, "i": i}])
+                i += 1
+                await asyncio.sleep(0.001)
+        except asyncio.CancelledError:
+            cancelled.append(shop_no)
+            raise
+
+    monkeypatch.setattr(order_api, "_prepare_crawl", prepare_crawl)
+    monkeypatch.setattr(order_api, "fetch_parsed_orders", fetch_parsed_orders)
+    monkeypatch.setattr(config, "ORDERS_STREAM_BUFFER_SIZE", 4)
+
+    with _client() as client:
+        res = client.post("/baemin/orders/stream", json=BODY)
+        # 응답이 끝난 시점에 나머지 매장 조회는 이미 취소돼 있어야 함
+        assert sorted(cancelled) == ["s1", "s3"]
+
+    lines = [json.loads(line) for line in res.text.splitlines()]
+    assert lines[-1] == {"code": 502, "message": "upstream down"}
+    assert all("shop" in line for line in lines[:-1])
@@ -0,0 +1,31 @@
+from app.core import page_checkpoint as page_checkpoint_module
+from app.core.page_checkpoint import PageCheckpoint
+
+
+def test_expired_entries_are_evicted_from_the_head(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(page_checkpoint_module.time, "monotonic", lambda: now[0])
+
+    checkpoint = PageCheckpoint(ttl=10, max_pages=100)
+    checkpoint.begin("a", 300)
+    checkpoint.put("a", 100, [1])
+    now[0] += 6
+    checkpoint.begin("b", 300)
+    checkpoint.put("b", 100, [2])
+    # 다시 이어받아도 순서(만든 순서)는 그대로
+    assert checkpoint.begin("a", 300) == {100: [1]}
+
+    now[0] += 6  # a 만 만료
+    checkpoint.put("b", 200, [3])
+    assert checkpoint.get("a", 100) is None
+    assert checkpoint.stats() == {"shards": 1, "pages": 2, "resumed_pages": 1}
+
+
+def test_max_pages_drops_oldest_shard():
+    checkpoint = PageCheckpoint(ttl=60, max_pages=2)
+    for key in ("a", "b"):
+        checkpoint.begin(key, 300)
+        checkpoint.put(key, 100, [key])
+    checkpoint.put("b", 200, ["b"])
+    assert checkpoint.get("a", 100) is None
+    assert checkpoint.stats()["pages"] == 2
@@ -0,0 +1,22 @@
+from app.core.rate import HostRateController
+
+
+def _controller():
+    return HostRateController("h", initial_rate=5, min_rate=1, max_rate=50, increase=1, decrease_cooldown=0)
+
+
+def test_only_success_increases_rate():
+    rate = _controller()
+    rate.feedback(200)
+    rate.feedback(304)
+    assert rate.rate == 7
+
+    for status in (400, 401, 404, 500):
+        rate.feedback(status)
+    assert rate.rate == 7
+
+
+def test_backoff_statuses_decrease_rate():
+    rate = _controller()
+    rate.feedback(429)
+    assert rate.rate < 5
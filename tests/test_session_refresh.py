@@ -0,0 +1,37 @@
+import asyncio
+
+from app.crawler import session_refresh
+from app.crawler.login import SESSION_COOKIE
+from app.crawler.session_refresh import SessionRefresher
+
+
+def test_cached_request_does_not_replace_verified_password(monkeypatch):
+    logins = []
+
+    async def login_single_flight(account_id, pw, session):
+        logins.append(pw)
+        return {SESSION_COOKIE: f"sid-{len(logins)}"}
+
+    async def invalidate(account_id):
+        pass
+
+    monkeypatch.setattr(session_refresh, "login_single_flight", login_single_flight)
+    monkeypatch.setattr(session_refresh.cookie_cache, "invalidate", invalidate)
+
+    refresher = SessionRefresher(interval=0)
+    relogins = []
+    refresher.on_relogin(relogins.append)
+    cookies = {SESSION_COOKIE: "sid-0"}
+    refresher.track("acc", "right", cookies, verified=True)
+    # 캐시된 쿠키로 처리된 요청 → 틀린 비밀번호여도 검증되지 않았으므로 무시
+    refresher.track("acc", "wrong", cookies)
+
+    assert asyncio.run(refresher.refresh_cookies(cookies, "sid-0", None))
+    assert logins == ["right"]
+    assert cookies == {SESSION_COOKIE: "sid-1"}
+    assert relogins == ["acc"]
+
+    # 새 비밀번호로 로그인에 성공한 요청은 반영
+    refresher.track("acc", "changed", cookies, verified=True)
+    assert asyncio.run(refresher.refresh_cookies(cookies, "sid-1", None))
+    assert logins == ["right", "changed"]